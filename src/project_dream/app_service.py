@@ -1,15 +1,22 @@
+import json
+import random
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
 from pathlib import Path
 
 from project_dream.canon_gate import enforce_canon_gate
 from project_dream.data_ingest import load_corpus_texts
-from project_dream.eval_suite import evaluate_run
+from project_dream.eval_suite import METRIC_SET_REGISTRY, evaluate_run
 from project_dream.infra.store import RunRepository
-from project_dream.kb_index import build_index, retrieve_context
-from project_dream.models import SeedInput
-from project_dream.pack_service import load_packs
-from project_dream.orchestrator_runtime import run_simulation_with_backend
+from project_dream.kb_index import build_index, load_or_build_index, retrieve_context
+from project_dream.models import Dial, SeedInput
+from project_dream.pack_service import LoadedPacks, load_packs_cached
+from project_dream.orchestrator_runtime import finalize_simulation_with_backend, run_simulation_with_backend
 from project_dream.regression_runner import run_regression_batch
 from project_dream.report_generator import build_report_v1
+from project_dream.sim_orchestrator import run_simulation_batch
 
 
 def _merge_unique_corpus(*groups: list[str]) -> list[str]:
@@ -25,24 +32,37 @@ def _merge_unique_corpus(*groups: list[str]) -> list[str]:
     return merged
 
 
-def simulate_and_persist(
+DIAL_AXES = ("U", "E", "M", "S", "H")
+_MAX_SWEEP_VARIANTS = 5000
+_SWEEP_PERSIST_MODES = ("none", "interesting", "all")
+# A variant is interesting when any of these differs from the run with the seed's own dial.
+_SWEEP_OUTCOME_KEYS = ("target_flow_id", "target_sort_tab", "termination_reason", "status")
+
+
+def _prepare_simulation(
     seed: SeedInput,
     *,
-    rounds: int,
     packs_dir: Path,
-    repository: RunRepository,
-    corpus_dir: Path = Path("corpus"),
-    orchestrator_backend: str = "manual",
-    vector_backend: str = "memory",
-    vector_db_path: Path | None = None,
-) -> Path:
-    packs = load_packs(packs_dir, enforce_phase1_minimums=True)
+    corpus_dir: Path,
+    vector_backend: str,
+    vector_db_path: Path | None,
+    kb_index_dir: Path | None,
+) -> tuple[LoadedPacks, dict, list[str]]:
+    packs = load_packs_cached(packs_dir, enforce_phase1_minimums=True)
     enforce_canon_gate(seed=seed, packs=packs)
-    index = build_index(
-        packs,
-        vector_backend=vector_backend,
-        vector_db_path=vector_db_path,
-    )
+    if kb_index_dir is None:
+        index = build_index(
+            packs,
+            vector_backend=vector_backend,
+            vector_db_path=vector_db_path,
+        )
+    else:
+        index = load_or_build_index(
+            packs,
+            snapshot_dir=kb_index_dir,
+            vector_backend=vector_backend,
+            vector_db_path=vector_db_path,
+        )
     context = retrieve_context(
         index,
         task=f"{seed.title} {seed.summary}",
@@ -53,14 +73,19 @@ def simulate_and_persist(
         top_k=3,
     )
     ingested_corpus = load_corpus_texts(corpus_dir)
-    merged_corpus = _merge_unique_corpus(context["corpus"], ingested_corpus)
-    sim_result = run_simulation_with_backend(
-        seed=seed,
-        rounds=rounds,
-        corpus=merged_corpus,
-        packs=packs,
-        backend=orchestrator_backend,
-    )
+    return packs, context, _merge_unique_corpus(context["corpus"], ingested_corpus)
+
+
+def _persist_simulation(
+    seed: SeedInput,
+    sim_result: dict,
+    *,
+    packs: LoadedPacks,
+    context: dict,
+    merged_corpus: list[str],
+    orchestrator_backend: str,
+    repository: RunRepository,
+) -> Path:
     sim_result["orchestrator_backend"] = orchestrator_backend
     sim_result["context_bundle"] = context["bundle"]
     sim_result["context_corpus"] = merged_corpus
@@ -71,6 +96,170 @@ def simulate_and_persist(
     return repository.persist_run(sim_result, report)
 
 
+def simulate_and_persist(
+    seed: SeedInput,
+    *,
+    rounds: int,
+    packs_dir: Path,
+    repository: RunRepository,
+    corpus_dir: Path = Path("corpus"),
+    orchestrator_backend: str = "manual",
+    vector_backend: str = "memory",
+    vector_db_path: Path | None = None,
+    kb_index_dir: Path | None = None,
+    generation_workers: int | None = None,
+) -> Path:
+    packs, context, merged_corpus = _prepare_simulation(
+        seed,
+        packs_dir=packs_dir,
+        corpus_dir=corpus_dir,
+        vector_backend=vector_backend,
+        vector_db_path=vector_db_path,
+        kb_index_dir=kb_index_dir,
+    )
+    sim_result = run_simulation_with_backend(
+        seed=seed,
+        rounds=rounds,
+        corpus=merged_corpus,
+        packs=packs,
+        backend=orchestrator_backend,
+        generation_workers=generation_workers,
+    )
+    return _persist_simulation(
+        seed,
+        sim_result,
+        packs=packs,
+        context=context,
+        merged_corpus=merged_corpus,
+        orchestrator_backend=orchestrator_backend,
+        repository=repository,
+    )
+
+
+def dial_grid(step: int) -> list[Dial]:
+    """Every dial whose axis weights are multiples of `step` (which must divide 100)."""
+    if step < 1 or 100 % step:
+        raise ValueError("sweep step must be a positive divisor of 100")
+    units = 100 // step
+    slots = units + len(DIAL_AXES) - 1
+    dials: list[Dial] = []
+    for bars in combinations(range(slots), len(DIAL_AXES) - 1):
+        edges = (-1, *bars, slots)
+        weights = [(edges[idx + 1] - edges[idx] - 1) * step for idx in range(len(DIAL_AXES))]
+        dials.append(Dial(**dict(zip(DIAL_AXES, weights))))
+        if len(dials) > _MAX_SWEEP_VARIANTS:
+            raise ValueError(f"sweep step {step} yields more than {_MAX_SWEEP_VARIANTS} dials; use a larger step")
+    return dials
+
+
+def sample_dials(count: int, *, random_seed: int = 0) -> list[Dial]:
+    """`count` distinct dials drawn uniformly from all integer dials, reproducible for a given seed."""
+    if count < 1 or count > _MAX_SWEEP_VARIANTS:
+        raise ValueError(f"sweep samples must be between 1 and {_MAX_SWEEP_VARIANTS}")
+    rng = random.Random(random_seed)
+    slots = 100 + len(DIAL_AXES) - 1
+    seen: set[tuple[int, ...]] = set()
+    dials: list[Dial] = []
+    while len(dials) < count:
+        edges = (-1, *sorted(rng.sample(range(slots), len(DIAL_AXES) - 1)), slots)
+        weights = tuple(edges[idx + 1] - edges[idx] - 1 for idx in range(len(DIAL_AXES)))
+        if weights in seen:
+            continue
+        seen.add(weights)
+        dials.append(Dial(**dict(zip(DIAL_AXES, weights))))
+    return dials
+
+
+def _sweep_row(variant: int, dial: Dial, sim_result: dict) -> dict:
+    thread_state = sim_result.get("thread_state", {})
+    end_condition = sim_result.get("end_condition", {})
+    return {
+        "variant": variant,
+        "dial": dial.model_dump(),
+        "dominant_axis": thread_state.get("dial_dominant_axis"),
+        "target_flow_id": thread_state.get("dial_target_flow_id"),
+        "target_sort_tab": thread_state.get("dial_target_sort_tab"),
+        "termination_reason": end_condition.get("termination_reason"),
+        "ended_round": end_condition.get("ended_round"),
+        "total_reports": thread_state.get("total_reports"),
+        "culture_weight": thread_state.get("culture_weight_multiplier"),
+        "status": end_condition.get("status"),
+    }
+
+
+def sweep_dials_and_persist(
+    seed: SeedInput,
+    *,
+    dials: list[Dial],
+    rounds: int,
+    packs_dir: Path,
+    repository: RunRepository,
+    corpus_dir: Path = Path("corpus"),
+    persist: str = "none",
+    workers: int = 1,
+    orchestrator_backend: str = "manual",
+    vector_backend: str = "memory",
+    vector_db_path: Path | None = None,
+    kb_index_dir: Path | None = None,
+    generation_workers: int | None = None,
+) -> dict:
+    """Simulate `seed` once per dial (variant 0 is the seed's own dial) and return a comparison table."""
+    if persist not in _SWEEP_PERSIST_MODES:
+        raise ValueError(f"Unknown sweep persist mode: {persist} (allowed: {', '.join(_SWEEP_PERSIST_MODES)})")
+    if workers < 1:
+        raise ValueError("workers must be >= 1")
+
+    started_at = time.perf_counter()
+    packs, context, merged_corpus = _prepare_simulation(
+        seed,
+        packs_dir=packs_dir,
+        corpus_dir=corpus_dir,
+        vector_backend=vector_backend,
+        vector_db_path=vector_db_path,
+        kb_index_dir=kb_index_dir,
+    )
+    variant_dials = [seed.dial] + [dial for dial in dials if dial != seed.dial]
+    variants = [seed.model_copy(update={"dial": dial}) for dial in variant_dials]
+    raw_results = run_simulation_batch(
+        variants,
+        rounds,
+        merged_corpus,
+        packs=packs,
+        generation_workers=generation_workers,
+        workers=workers,
+    )
+
+    rows = [_sweep_row(idx, dial, raw) for idx, (dial, raw) in enumerate(zip(variant_dials, raw_results))]
+    baseline = rows[0]
+    persisted = 0
+    for row, variant, raw in zip(rows, variants, raw_results):
+        row["interesting"] = any(row[key] != baseline[key] for key in _SWEEP_OUTCOME_KEYS)
+        row["run_id"] = None
+        if persist == "all" or (persist == "interesting" and row["interesting"]):
+            sim_result = finalize_simulation_with_backend(raw, backend=orchestrator_backend)
+            run_dir = _persist_simulation(
+                variant,
+                sim_result,
+                packs=packs,
+                context=context,
+                merged_corpus=merged_corpus,
+                orchestrator_backend=orchestrator_backend,
+                repository=repository,
+            )
+            row["run_id"] = run_dir.name
+            persisted += 1
+
+    return {
+        "seed_id": seed.seed_id,
+        "rounds": rounds,
+        "variants": len(rows),
+        "interesting": sum(1 for row in rows if row["interesting"]),
+        "persisted": persisted,
+        "elapsed_sec": round(time.perf_counter() - started_at, 3),
+        "rows": rows,
+    }
+
+
 def evaluate_and_persist(
     *,
     repository: RunRepository,
@@ -83,6 +272,122 @@ def evaluate_and_persist(
     return eval_result
 
 
+def _eval_is_current(run_dir: Path, metric_set: str) -> bool:
+    eval_path = run_dir / "eval.json"
+    try:
+        eval_mtime = eval_path.stat().st_mtime_ns
+        payload = json.loads(eval_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return False
+    if not isinstance(payload, dict) or payload.get("metric_set") != metric_set:
+        return False
+    for name in ("report.json", "runlog.jsonl"):
+        try:
+            if (run_dir / name).stat().st_mtime_ns > eval_mtime:
+                return False
+        except FileNotFoundError:
+            continue
+    return True
+
+
+def _evaluate_run_job(job: tuple[str, str]) -> tuple[str, dict | None, str | None]:
+    run_dir, metric_set = job
+    try:
+        return run_dir, evaluate_run(Path(run_dir), metric_set=metric_set), None
+    except Exception as exc:  # noqa: BLE001 - one broken run must not stop the backfill
+        return run_dir, None, f"{type(exc).__name__}: {exc}"
+
+
+def _list_all_run_dirs(repository: RunRepository, *, page_size: int = 500, **filters: str | None) -> list[Path]:
+    run_dirs: list[Path] = []
+    cursor: str | None = None
+    while True:
+        page = repository.list_runs(limit=page_size, cursor=cursor, include_total=False, **filters)
+        run_dirs.extend(Path(item["run_dir"]) for item in page["items"])
+        cursor = page.get("next_cursor")
+        if not cursor:
+            return run_dirs
+
+
+def evaluate_all_and_persist(
+    *,
+    repository: RunRepository,
+    metric_set: str = "v1",
+    workers: int = 1,
+    force: bool = False,
+    batch_size: int = 200,
+    seed_id: str | None = None,
+    board_id: str | None = None,
+    status: str | None = None,
+    pack_fingerprint: str | None = None,
+    progress: Callable[[dict], None] | None = None,
+) -> dict:
+    if metric_set not in METRIC_SET_REGISTRY:
+        raise ValueError(f"Unknown metric_set: {metric_set}")
+    if workers < 1:
+        raise ValueError("workers must be >= 1")
+    if batch_size < 1:
+        raise ValueError("batch_size must be >= 1")
+
+    started_at = time.perf_counter()
+    run_dirs = _list_all_run_dirs(
+        repository,
+        seed_id=seed_id,
+        board_id=board_id,
+        status=status,
+        pack_fingerprint=pack_fingerprint,
+    )
+    pending = [run_dir for run_dir in run_dirs if force or not _eval_is_current(run_dir, metric_set)]
+    stats: dict = {
+        "metric_set": metric_set,
+        "total": len(run_dirs),
+        "skipped": len(run_dirs) - len(pending),
+        "evaluated": 0,
+        "passed": 0,
+        "failed": [],
+    }
+
+    def _emit(done: int) -> None:
+        if progress is None:
+            return
+        elapsed = time.perf_counter() - started_at
+        progress(
+            {
+                "done": done,
+                "pending": len(pending),
+                "evaluated": stats["evaluated"],
+                "errors": len(stats["failed"]),
+                "runs_per_sec": round(done / elapsed, 2) if elapsed > 0 else 0.0,
+            }
+        )
+
+    jobs = [(str(run_dir), metric_set) for run_dir in pending]
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 and len(jobs) > 1 else None
+    try:
+        for start in range(0, len(jobs), batch_size):
+            chunk = jobs[start : start + batch_size]
+            results = executor.map(_evaluate_run_job, chunk) if executor else map(_evaluate_run_job, chunk)
+            batch: list[tuple[Path, dict]] = []
+            for run_dir, eval_result, error in results:
+                if eval_result is None:
+                    stats["failed"].append({"run_id": Path(run_dir).name, "error": error})
+                    continue
+                batch.append((Path(run_dir), eval_result))
+                stats["passed"] += int(bool(eval_result.get("pass_fail")))
+            if batch:
+                repository.persist_evals(batch)
+            stats["evaluated"] += len(batch)
+            _emit(start + len(chunk))
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    elapsed = time.perf_counter() - started_at
+    stats["elapsed_sec"] = round(elapsed, 3)
+    stats["runs_per_sec"] = round(stats["evaluated"] / elapsed, 2) if elapsed > 0 else 0.0
+    return stats
+
+
 def regress_and_persist(
     *,
     repository: RunRepository,
@@ -99,6 +404,9 @@ def regress_and_persist(
     orchestrator_backend: str = "manual",
     vector_backend: str = "memory",
     vector_db_path: Path | None = None,
+    kb_index_dir: Path | None = None,
+    workers: int = 1,
+    generation_workers: int | None = None,
 ) -> dict:
     summary = run_regression_batch(
         seeds_dir=seeds_dir,
@@ -115,6 +423,9 @@ def regress_and_persist(
         orchestrator_backend=orchestrator_backend,
         vector_backend=vector_backend,
         vector_db_path=vector_db_path,
+        kb_index_dir=kb_index_dir,
+        workers=workers,
+        generation_workers=generation_workers,
     )
     repository.persist_regression_summary(summary)
     return summary
@@ -6,7 +6,14 @@ from contextlib import contextmanager
 from datetime import UTC, datetime
 from pathlib import Path
 
-from project_dream.app_service import evaluate_and_persist, simulate_and_persist
+from project_dream.app_service import (
+    dial_grid,
+    evaluate_all_and_persist,
+    evaluate_and_persist,
+    sample_dials,
+    simulate_and_persist,
+    sweep_dials_and_persist,
+)
 from project_dream.authoring_compile import compile_world_pack
 from project_dream.data_ingest import build_corpus_from_packs
 from project_dream.eval_export import export_external_eval_bundle
@@ -296,7 +303,7 @@ def _compare_regress_live_baseline(
 def _vector_backend_default_from_env() -> str:
     raw = os.environ.get("PROJECT_DREAM_VECTOR_BACKEND", "memory")
     backend = str(raw).strip().lower()
-    if backend not in {"memory", "sqlite"}:
+    if backend not in {"memory", "sqlite", "numpy"}:
         raise ValueError(f"Invalid PROJECT_DREAM_VECTOR_BACKEND: {raw}")
     return backend
 
@@ -309,9 +316,18 @@ def _vector_db_path_default_from_env() -> str | None:
     return path or None
 
 
+def _kb_index_dir_default_from_env() -> str | None:
+    raw = os.environ.get("PROJECT_DREAM_KB_INDEX_DIR")
+    if raw is None:
+        return None
+    path = str(raw).strip()
+    return path or None
+
+
 def build_parser() -> argparse.ArgumentParser:
     vector_backend_default = _vector_backend_default_from_env()
     vector_db_path_default = _vector_db_path_default_from_env()
+    kb_index_dir_default = _kb_index_dir_default_from_env()
 
     parser = argparse.ArgumentParser(prog="project-dream")
     sub = parser.add_subparsers(dest="command", required=True)
@@ -333,10 +349,18 @@ def build_parser() -> argparse.ArgumentParser:
     sim.add_argument(
         "--vector-backend",
         required=False,
-        choices=["memory", "sqlite"],
+        choices=["memory", "sqlite", "numpy"],
         default=vector_backend_default,
     )
     sim.add_argument("--vector-db-path", required=False, default=vector_db_path_default)
+    sim.add_argument("--kb-index-dir", required=False, default=kb_index_dir_default)
+    sim.add_argument("--generation-workers", type=int, default=None)
+    sweep = sim.add_mutually_exclusive_group()
+    sweep.add_argument("--sweep-step", type=int, default=None)
+    sweep.add_argument("--sweep-samples", type=int, default=None)
+    sim.add_argument("--sweep-random-seed", type=int, default=0)
+    sim.add_argument("--workers", type=int, default=1)
+    sim.add_argument("--sweep-persist", choices=["none", "interesting", "all"], default="none")
 
     ingest = sub.add_parser("ingest")
     ingest.add_argument("--packs-dir", required=False, default="packs")
@@ -355,6 +379,19 @@ def build_parser() -> argparse.ArgumentParser:
     eva.add_argument("--repo-backend", required=False, choices=["file", "sqlite"], default="file")
     eva.add_argument("--sqlite-db-path", required=False, default=None)
 
+    eva_all = sub.add_parser("evaluate-all")
+    eva_all.add_argument("--runs-dir", required=False, default="runs")
+    eva_all.add_argument("--metric-set", required=False, default="v1")
+    eva_all.add_argument("--repo-backend", required=False, choices=["file", "sqlite"], default="file")
+    eva_all.add_argument("--sqlite-db-path", required=False, default=None)
+    eva_all.add_argument("--workers", type=int, default=1)
+    eva_all.add_argument("--batch-size", type=int, default=200)
+    eva_all.add_argument("--force", action="store_true")
+    eva_all.add_argument("--seed-id", required=False, default=None)
+    eva_all.add_argument("--board-id", required=False, default=None)
+    eva_all.add_argument("--status", required=False, default=None)
+    eva_all.add_argument("--pack-fingerprint", required=False, default=None)
+
     eva_export = sub.add_parser("eval-export")
     eva_export.add_argument("--runs-dir", required=False, default="runs")
     eva_export.add_argument("--run-id", required=False, default=None)
@@ -384,10 +421,13 @@ def build_parser() -> argparse.ArgumentParser:
     reg.add_argument(
         "--vector-backend",
         required=False,
-        choices=["memory", "sqlite"],
+        choices=["memory", "sqlite", "numpy"],
         default=vector_backend_default,
     )
     reg.add_argument("--vector-db-path", required=False, default=vector_db_path_default)
+    reg.add_argument("--kb-index-dir", required=False, default=kb_index_dir_default)
+    reg.add_argument("--workers", type=int, default=1)
+    reg.add_argument("--generation-workers", type=int, default=None)
 
     reg_live = sub.add_parser("regress-live")
     reg_live.add_argument("--seeds-dir", required=False, default="examples/seeds/regression")
@@ -425,10 +465,13 @@ def build_parser() -> argparse.ArgumentParser:
     reg_live.add_argument(
         "--vector-backend",
         required=False,
-        choices=["memory", "sqlite"],
+        choices=["memory", "sqlite", "numpy"],
         default=vector_backend_default,
     )
     reg_live.add_argument("--vector-db-path", required=False, default=vector_db_path_default)
+    reg_live.add_argument("--kb-index-dir", required=False, default=kb_index_dir_default)
+    reg_live.add_argument("--workers", type=int, default=1)
+    reg_live.add_argument("--generation-workers", type=int, default=None)
 
     srv = sub.add_parser("serve")
     srv.add_argument("--host", required=False, default="127.0.0.1")
@@ -441,10 +484,11 @@ def build_parser() -> argparse.ArgumentParser:
     srv.add_argument(
         "--vector-backend",
         required=False,
-        choices=["memory", "sqlite"],
+        choices=["memory", "sqlite", "numpy"],
         default=vector_backend_default,
     )
     srv.add_argument("--vector-db-path", required=False, default=vector_db_path_default)
+    srv.add_argument("--kb-index-dir", required=False, default=kb_index_dir_default)
     return parser
 
 
@@ -453,6 +497,8 @@ def main(argv: list[str] | None = None) -> int:
     args = parser.parse_args(argv)
 
     if args.command == "simulate":
+        if args.workers != 1 and args.sweep_step is None and args.sweep_samples is None:
+            parser.error("simulate --workers only applies to --sweep-step/--sweep-samples")
         seed_path = Path(args.seed)
         seed = SeedInput.model_validate_json(seed_path.read_text(encoding="utf-8"))
         repository = _build_repository(
@@ -460,6 +506,33 @@ def main(argv: list[str] | None = None) -> int:
             repository_backend=args.repo_backend,
             sqlite_db_path=args.sqlite_db_path,
         )
+        if args.sweep_step is not None or args.sweep_samples is not None:
+            if args.sweep_step is not None:
+                dials = dial_grid(args.sweep_step)
+            else:
+                dials = sample_dials(args.sweep_samples, random_seed=args.sweep_random_seed)
+            summary = sweep_dials_and_persist(
+                seed,
+                dials=dials,
+                rounds=args.rounds,
+                packs_dir=Path(args.packs_dir),
+                corpus_dir=Path(args.corpus_dir),
+                repository=repository,
+                persist=args.sweep_persist,
+                workers=args.workers,
+                orchestrator_backend=args.orchestrator_backend,
+                vector_backend=args.vector_backend,
+                vector_db_path=Path(args.vector_db_path) if args.vector_db_path else None,
+                kb_index_dir=Path(args.kb_index_dir) if args.kb_index_dir else None,
+                generation_workers=args.generation_workers,
+            )
+            print(
+                f"[simulate] sweep variants={summary['variants']} interesting={summary['interesting']} "
+                f"persisted={summary['persisted']} elapsed={summary['elapsed_sec']}s",
+                file=sys.stderr,
+            )
+            print(json.dumps(summary, ensure_ascii=False))
+            return 0
         simulate_and_persist(
             seed,
             rounds=args.rounds,
@@ -469,6 +542,8 @@ def main(argv: list[str] | None = None) -> int:
             orchestrator_backend=args.orchestrator_backend,
             vector_backend=args.vector_backend,
             vector_db_path=Path(args.vector_db_path) if args.vector_db_path else None,
+            kb_index_dir=Path(args.kb_index_dir) if args.kb_index_dir else None,
+            generation_workers=args.generation_workers,
         )
     elif args.command == "ingest":
         summary = build_corpus_from_packs(
@@ -499,6 +574,30 @@ def main(argv: list[str] | None = None) -> int:
             run_id=args.run_id,
             metric_set=args.metric_set,
         )
+    elif args.command == "evaluate-all":
+        repository = _build_repository(
+            runs_dir=Path(args.runs_dir),
+            repository_backend=args.repo_backend,
+            sqlite_db_path=args.sqlite_db_path,
+        )
+        stats = evaluate_all_and_persist(
+            repository=repository,
+            metric_set=args.metric_set,
+            workers=args.workers,
+            force=args.force,
+            batch_size=args.batch_size,
+            seed_id=args.seed_id,
+            board_id=args.board_id,
+            status=args.status,
+            pack_fingerprint=args.pack_fingerprint,
+            progress=lambda row: print(
+                f"[evaluate-all] {row['done']}/{row['pending']} "
+                f"evaluated={row['evaluated']} errors={row['errors']} {row['runs_per_sec']} runs/s",
+                file=sys.stderr,
+            ),
+        )
+        print(json.dumps(stats, ensure_ascii=False))
+        return 0 if not stats["failed"] else 2
     elif args.command == "eval-export":
         repository = _build_repository(
             runs_dir=Path(args.runs_dir),
@@ -529,6 +628,9 @@ def main(argv: list[str] | None = None) -> int:
             orchestrator_backend=args.orchestrator_backend,
             vector_backend=args.vector_backend,
             vector_db_path=Path(args.vector_db_path) if args.vector_db_path else None,
+            kb_index_dir=Path(args.kb_index_dir) if args.kb_index_dir else None,
+            workers=args.workers,
+            generation_workers=args.generation_workers,
         )
         return 0 if summary["pass_fail"] else 2
     elif args.command == "regress-live":
@@ -557,6 +659,9 @@ def main(argv: list[str] | None = None) -> int:
                 orchestrator_backend=args.orchestrator_backend,
                 vector_backend=args.vector_backend,
                 vector_db_path=Path(args.vector_db_path) if args.vector_db_path else None,
+                kb_index_dir=Path(args.kb_index_dir) if args.kb_index_dir else None,
+                workers=args.workers,
+                generation_workers=args.generation_workers,
             )
         if not summary["pass_fail"]:
             return 2
@@ -650,6 +755,7 @@ def main(argv: list[str] | None = None) -> int:
             sqlite_db_path=Path(args.sqlite_db_path) if args.sqlite_db_path else None,
             vector_backend=args.vector_backend,
             vector_db_path=Path(args.vector_db_path) if args.vector_db_path else None,
+            kb_index_dir=Path(args.kb_index_dir) if args.kb_index_dir else None,
         )
         try:
             serve(
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import json
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+from project_dream.text_features import char_ngrams_of_normalized, term_freq, text_digest, tokenize
+
+
+CORPUS_ARTIFACT_SCHEMA_VERSION = "corpus_artifacts.v1"
+_MAGIC = b"PDCORPUS"
+_HEADER_LEN = struct.Struct("<I")
+# Per-row ragged columns are stored as (offsets, ids, counts); offsets has row_count + 1 entries.
+_UINT_COLUMNS = (
+    "text_len",
+    "doc_len",
+    "token_offsets",
+    "token_ids",
+    "tf_offsets",
+    "tf_ids",
+    "tf_counts",
+    "bigram_offsets",
+    "bigram_ids",
+    "bigram_counts",
+)
+
+
+def corpus_artifact_path(corpus_dir: Path, source_type: str) -> Path:
+    return corpus_dir / "artifacts" / f"{source_type}.features.bin"
+
+
+def _source_signature(path: Path) -> list[int]:
+    stat = path.stat()
+    return [int(stat.st_size), int(stat.st_mtime_ns)]
+
+
+def _uint_array(values: Iterable[int] = ()) -> array:
+    return array("I", values)
+
+
+def _to_little_endian(column: array) -> bytes:
+    if sys.byteorder == "little":
+        return column.tobytes()
+    swapped = array(column.typecode, column)
+    swapped.byteswap()
+    return swapped.tobytes()
+
+
+def write_corpus_artifact(source_path: Path, artifact_path: Path, source_type: str, texts: Iterable[str]) -> dict:
+    """Write token/tf/bigram/hash columns for `texts`, one entry per corpus line of `source_path`."""
+    vocab: dict[str, int] = {}
+    bigram_vocab: dict[str, int] = {}
+    columns = {name: _uint_array() for name in _UINT_COLUMNS}
+    for name in ("token_offsets", "tf_offsets", "bigram_offsets"):
+        columns[name].append(0)
+    digests = bytearray()
+    row_count = 0
+
+    for text in texts:
+        tokens = tokenize(text)
+        columns["text_len"].append(len(text))
+        columns["doc_len"].append(len(tokens))
+        digests += text_digest(text)
+        columns["token_ids"].extend(vocab.setdefault(token, len(vocab)) for token in tokens)
+        columns["token_offsets"].append(len(columns["token_ids"]))
+        # Dict insertion order is kept so rebuilt tf/bigram maps iterate exactly like freshly computed ones.
+        for token, count in term_freq(tokens).items():
+            columns["tf_ids"].append(vocab[token])
+            columns["tf_counts"].append(count)
+        columns["tf_offsets"].append(len(columns["tf_ids"]))
+        for gram, count in char_ngrams_of_normalized("".join(tokens)).items():
+            columns["bigram_ids"].append(bigram_vocab.setdefault(gram, len(bigram_vocab)))
+            columns["bigram_counts"].append(int(count))
+        columns["bigram_offsets"].append(len(columns["bigram_ids"]))
+        row_count += 1
+
+    layout: dict[str, list] = {}
+    chunks: list[bytes] = []
+    offset = 0
+    for name in _UINT_COLUMNS:
+        raw = _to_little_endian(columns[name])
+        layout[name] = ["I", offset, len(columns[name])]
+        chunks.append(raw)
+        offset += len(raw)
+    layout["text_hash"] = ["16s", offset, row_count]
+    chunks.append(bytes(digests))
+
+    header = {
+        "schema_version": CORPUS_ARTIFACT_SCHEMA_VERSION,
+        "source_type": source_type,
+        "source_signature": _source_signature(source_path),
+        "row_count": row_count,
+        "vocab": list(vocab),
+        "bigram_vocab": list(bigram_vocab),
+        "columns": layout,
+    }
+    header_raw = json.dumps(header, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    artifact_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = artifact_path.with_name(f"{artifact_path.name}.{os.getpid()}.tmp")
+    with tmp_path.open("wb") as fp:
+        fp.write(_MAGIC)
+        fp.write(_HEADER_LEN.pack(len(header_raw)))
+        fp.write(header_raw)
+        for chunk in chunks:
+            fp.write(chunk)
+    os.replace(tmp_path, artifact_path)
+    return {
+        "path": str(artifact_path),
+        "schema_version": CORPUS_ARTIFACT_SCHEMA_VERSION,
+        "row_count": row_count,
+        "vocab_size": len(vocab),
+        "bigram_vocab_size": len(bigram_vocab),
+    }
+
+
+@dataclass(frozen=True)
+class CorpusFeatures:
+    row_count: int
+    vocab: list[str]
+    bigram_vocab: list[str]
+    columns: dict[str, array]
+    text_hashes: bytes
+
+    def text_hash(self, idx: int) -> bytes:
+        return self.text_hashes[idx * 16 : (idx + 1) * 16]
+
+    def text_len(self, idx: int) -> int:
+        return self.columns["text_len"][idx]
+
+    def kb_fields(self, idx: int) -> dict:
+        """Rebuild the `_analyze_passage` fields of row `idx` without re-tokenizing."""
+        columns = self.columns
+        vocab = self.vocab
+        start, end = columns["token_offsets"][idx], columns["token_offsets"][idx + 1]
+        tokens = [vocab[token_id] for token_id in columns["token_ids"][start:end]]
+        start, end = columns["tf_offsets"][idx], columns["tf_offsets"][idx + 1]
+        token_tf = {
+            vocab[token_id]: count
+            for token_id, count in zip(columns["tf_ids"][start:end], columns["tf_counts"][start:end])
+        }
+        start, end = columns["bigram_offsets"][idx], columns["bigram_offsets"][idx + 1]
+        dense_vector = {
+            self.bigram_vocab[gram_id]: float(count)
+            for gram_id, count in zip(columns["bigram_ids"][start:end], columns["bigram_counts"][start:end])
+        }
+        return {
+            "_tokens": tokens,
+            "_token_tf": token_tf,
+            "_doc_len": columns["doc_len"][idx],
+            "_normalized_text": "".join(tokens),
+            "_dense_vector": dense_vector,
+        }
+
+
+def load_corpus_artifact(source_path: Path, artifact_path: Path) -> CorpusFeatures | None:
+    """Return the artifact for `source_path`, or None when it is missing, stale or unreadable."""
+    try:
+        raw = artifact_path.read_bytes()
+        signature = _source_signature(source_path)
+    except OSError:
+        return None
+    if not raw.startswith(_MAGIC):
+        return None
+    try:
+        (header_len,) = _HEADER_LEN.unpack_from(raw, len(_MAGIC))
+        data_start = len(_MAGIC) + _HEADER_LEN.size + header_len
+        header = json.loads(raw[len(_MAGIC) + _HEADER_LEN.size : data_start])
+    except (struct.error, ValueError):
+        return None
+    if header.get("schema_version") != CORPUS_ARTIFACT_SCHEMA_VERSION:
+        return None
+    if header.get("source_signature") != signature:
+        return None
+
+    data = memoryview(raw)[data_start:]
+    columns: dict[str, array] = {}
+    try:
+        for name in _UINT_COLUMNS:
+            _, offset, count = header["columns"][name]
+            column = _uint_array()
+            column.frombytes(data[offset : offset + count * column.itemsize])
+            if sys.byteorder != "little":
+                column.byteswap()
+            if len(column) != count:
+                return None
+            columns[name] = column
+        _, hash_offset, row_count = header["columns"]["text_hash"]
+        text_hashes = bytes(data[hash_offset : hash_offset + row_count * 16])
+    except (KeyError, TypeError, ValueError):
+        return None
+    if row_count != header.get("row_count") or len(text_hashes) != row_count * 16:
+        return None
+    return CorpusFeatures(
+        row_count=row_count,
+        vocab=list(header.get("vocab", [])),
+        bigram_vocab=list(header.get("bigram_vocab", [])),
+        columns=columns,
+        text_hashes=text_hashes,
+    )
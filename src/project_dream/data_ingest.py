@@ -1,30 +1,33 @@
 from __future__ import annotations
 
 import json
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import Iterator
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
 
-from project_dream.pack_service import LoadedPacks, load_packs
+from project_dream.corpus_artifacts import (
+    CorpusFeatures,
+    corpus_artifact_path,
+    load_corpus_artifact,
+    write_corpus_artifact,
+)
+from project_dream.pack_service import LoadedPacks, load_packs, pack_lookup
+from project_dream.text_features import text_digest
 
 
 DEFAULT_DIAL = {"U": 30, "E": 25, "M": 15, "S": 15, "H": 15}
 
 
 def _template_for_board(packs: LoadedPacks, board_id: str) -> tuple[str, str]:
-    for template in sorted(packs.thread_templates.values(), key=lambda row: row["id"]):
-        if board_id in template.get("intended_boards", []):
-            return template["id"], template.get("default_comment_flow", "P1")
-    return "T1", "P1"
+    return pack_lookup(packs).template_by_board.get(board_id, ("T1", "P1"))
 
 
 def _community_by_board(packs: LoadedPacks) -> dict[str, dict]:
-    out: dict[str, dict] = {}
-    for community in sorted(packs.communities.values(), key=lambda row: row["id"]):
-        board_id = str(community.get("board_id", ""))
-        if not board_id:
-            continue
-        out.setdefault(board_id, community)
-    return out
+    return dict(pack_lookup(packs).community_by_board)
 
 
 def _base_row(
@@ -230,6 +233,19 @@ def build_corpus_from_packs(*, packs_dir: Path, corpus_dir: Path) -> dict:
     _write_jsonl(refined_path, refined_rows)
     _write_jsonl(generated_path, generated_rows)
 
+    artifacts: dict[str, dict] = {}
+    for source_type, path, rows in (
+        ("reference", reference_path, reference_rows),
+        ("refined", refined_path, refined_rows),
+        ("generated", generated_path, generated_rows),
+    ):
+        artifacts[source_type] = write_corpus_artifact(
+            path,
+            corpus_artifact_path(corpus_dir, source_type),
+            source_type,
+            (str(row.get("text", "")).strip() for row in rows),
+        )
+
     manifest = {
         "schema_version": "corpus.manifest.v1",
         "generated_at_utc": datetime.now(UTC).isoformat(),
@@ -238,68 +254,226 @@ def build_corpus_from_packs(*, packs_dir: Path, corpus_dir: Path) -> dict:
         "reference_count": len(reference_rows),
         "refined_count": len(refined_rows),
         "generated_count": len(generated_rows),
+        "artifacts": artifacts,
     }
     manifest_path.write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8")
     return manifest
 
 
-def _read_jsonl(path: Path) -> list[dict]:
+CORPUS_SOURCE_TYPES = ("reference", "refined", "generated")
+
+
+def _corpus_path(corpus_dir: Path, source_type: str) -> Path | None:
+    if source_type not in CORPUS_SOURCE_TYPES:
+        return None
+    return corpus_dir / f"{source_type}.jsonl"
+
+
+def _iter_jsonl(path: Path) -> Iterator[dict]:
     if not path.exists():
-        return []
-    rows: list[dict] = []
-    for raw in path.read_text(encoding="utf-8").splitlines():
-        line = raw.strip()
-        if not line:
+        return
+    with path.open("r", encoding="utf-8") as fp:
+        for raw in fp:
+            line = raw.strip()
+            if not line:
+                continue
+            yield json.loads(line)
+
+
+def iter_corpus_rows(
+    corpus_dir: Path,
+    source_types: tuple[str, ...] = CORPUS_SOURCE_TYPES,
+    *,
+    board_ids: set[str] | None = None,
+) -> Iterator[dict]:
+    """Stream corpus rows one line at a time, in `source_types` order."""
+    if not corpus_dir.exists():
+        return
+    for source_type in source_types:
+        path = _corpus_path(corpus_dir, source_type)
+        if path is None:
             continue
-        rows.append(json.loads(line))
-    return rows
+        for row in _iter_jsonl(path):
+            row.setdefault("source_type", source_type)
+            if board_ids is not None and row.get("board_id") not in board_ids:
+                continue
+            yield row
 
 
 def load_corpus_rows(
     corpus_dir: Path,
-    source_types: tuple[str, ...] = ("reference", "refined", "generated"),
+    source_types: tuple[str, ...] = CORPUS_SOURCE_TYPES,
+    *,
+    board_ids: set[str] | None = None,
 ) -> list[dict]:
-    if not corpus_dir.exists():
-        return []
+    return list(iter_corpus_rows(corpus_dir, source_types, board_ids=board_ids))
+
+
+class _InternedText:
+    __slots__ = ("text", "__weakref__")
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+
+
+class _CorpusTextStore:
+    """Intern table keyed by content hash; an entry lives only while a cached segment references it."""
+
+    def __init__(self) -> None:
+        self._texts: weakref.WeakValueDictionary[bytes, _InternedText] = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+
+    def intern(self, text: str, digest: bytes | None = None) -> _InternedText:
+        if digest is None:
+            digest = text_digest(text)
+        with self._lock:
+            interned = self._texts.get(digest)
+            if interned is None:
+                interned = _InternedText(text)
+                self._texts[digest] = interned
+            return interned
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+
+@dataclass(frozen=True)
+class _CorpusSegment:
+    signature: tuple[int, int]
+    # Distinct (board_id, text) pairs of one corpus file with non-empty text, in first-seen order.
+    texts: tuple[tuple[object, _InternedText], ...]
+
+
+_MAX_CACHED_SEGMENTS = 16
+_TEXT_STORE = _CorpusTextStore()
+_SEGMENTS: OrderedDict[tuple[str, str], _CorpusSegment] = OrderedDict()
+_SEGMENTS_LOCK = threading.Lock()
+# One lock per corpus file, so parsing one file never blocks readers of another.
+_SEGMENT_FILE_LOCKS: dict[tuple[str, str], threading.Lock] = {}
+
+
+def _cached_segment(key: tuple[str, str], signature: tuple[int, int]) -> _CorpusSegment | None:
+    with _SEGMENTS_LOCK:
+        segment = _SEGMENTS.get(key)
+        if segment is None or segment.signature != signature:
+            return None
+        _SEGMENTS.move_to_end(key)
+        return segment
+
+
+def _matching_features(features: CorpusFeatures | None, idx: int, text: str) -> CorpusFeatures | None:
+    if features is not None and idx < features.row_count and features.text_len(idx) == len(text):
+        return features
+    return None
+
+
+def _corpus_segment(corpus_dir: Path, source_type: str) -> _CorpusSegment | None:
+    path = _corpus_path(corpus_dir, source_type)
+    if path is None:
+        return None
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    signature = (int(stat.st_size), int(stat.st_mtime_ns))
+    key = (str(path.resolve()), source_type)
+    segment = _cached_segment(key, signature)
+    if segment is not None:
+        return segment
+    with _SEGMENTS_LOCK:
+        file_lock = _SEGMENT_FILE_LOCKS.setdefault(key, threading.Lock())
+    with file_lock:
+        # Another thread may have parsed the file while this one waited.
+        segment = _cached_segment(key, signature)
+        if segment is not None:
+            return segment
+        # Drop the stale segment first so texts only it referenced can be freed while re-parsing.
+        with _SEGMENTS_LOCK:
+            _SEGMENTS.pop(key, None)
+        features = load_corpus_artifact(path, corpus_artifact_path(corpus_dir, source_type))
+        texts: list[tuple[object, _InternedText]] = []
+        seen: set[tuple[object, _InternedText]] = set()
+        for idx, row in enumerate(_iter_jsonl(path)):
+            text = str(row.get("text", "")).strip()
+            if not text:
+                continue
+            matching = _matching_features(features, idx, text)
+            entry = (row.get("board_id"), _TEXT_STORE.intern(text, matching.text_hash(idx) if matching else None))
+            if entry in seen:
+                continue
+            seen.add(entry)
+            texts.append(entry)
+        segment = _CorpusSegment(signature=signature, texts=tuple(texts))
+        with _SEGMENTS_LOCK:
+            _SEGMENTS[key] = segment
+            while len(_SEGMENTS) > _MAX_CACHED_SEGMENTS:
+                _SEGMENTS.popitem(last=False)
+        return segment
 
-    source_to_path = {
-        "reference": corpus_dir / "reference.jsonl",
-        "refined": corpus_dir / "refined.jsonl",
-        "generated": corpus_dir / "generated.jsonl",
-    }
 
-    rows: list[dict] = []
-    for source_type in source_types:
-        path = source_to_path.get(source_type)
-        if path is None:
-            continue
-        for row in _read_jsonl(path):
-            copied = dict(row)
-            copied.setdefault("source_type", source_type)
-            rows.append(copied)
-    return rows
+def clear_corpus_cache() -> None:
+    with _SEGMENTS_LOCK:
+        _SEGMENTS.clear()
 
 
-def load_corpus_texts(corpus_dir: Path, source_types: tuple[str, ...] = ("reference", "refined")) -> list[str]:
+def iter_corpus_records(
+    corpus_dir: Path,
+    source_types: tuple[str, ...] = CORPUS_SOURCE_TYPES,
+    *,
+    board_ids: set[str] | None = None,
+    with_features: bool = False,
+) -> Iterator[dict]:
+    """Stream the retrieval fields of each corpus line, in `source_types` order.
+
+    With `with_features`, rows backed by an ingest artifact also carry the precomputed KB fields.
+    """
+    if not corpus_dir.exists():
+        return
+    for source_type in source_types:
+        path = _corpus_path(corpus_dir, source_type)
+        if path is None or not path.exists():
+            continue
+        features = load_corpus_artifact(path, corpus_artifact_path(corpus_dir, source_type)) if with_features else None
+        for idx, row in enumerate(_iter_jsonl(path)):
+            board_id = row.get("board_id")
+            if board_ids is not None and board_id not in board_ids:
+                continue
+            text = str(row.get("text", "")).strip()
+            record = {
+                "doc_id": str(row.get("doc_id", "")).strip(),
+                "board_id": board_id,
+                "zone_id": row.get("zone_id"),
+                "source_type": row.get("source_type", source_type),
+                "doc_type": row.get("doc_type"),
+                "text": text,
+            }
+            matching = _matching_features(features, idx, text)
+            if matching is not None:
+                record.update(matching.kb_fields(idx))
+            yield record
+
+
+def load_corpus_texts(
+    corpus_dir: Path,
+    source_types: tuple[str, ...] = ("reference", "refined"),
+    *,
+    board_ids: set[str] | None = None,
+) -> list[str]:
     if not corpus_dir.exists():
         return []
 
-    source_to_path = {
-        "reference": corpus_dir / "reference.jsonl",
-        "refined": corpus_dir / "refined.jsonl",
-        "generated": corpus_dir / "generated.jsonl",
-    }
     allowed = set(source_types)
     texts: list[str] = []
-    seen: set[str] = set()
-
-    for source_type, path in source_to_path.items():
+    seen: set[_InternedText] = set()
+    for source_type in CORPUS_SOURCE_TYPES:
         if source_type not in allowed:
             continue
-        for row in _read_jsonl(path):
-            text = str(row.get("text", "")).strip()
-            if not text or text in seen:
+        segment = _corpus_segment(corpus_dir, source_type)
+        if segment is None:
+            continue
+        for board_id, interned in segment.texts:
+            if interned in seen or (board_ids is not None and board_id not in board_ids):
                 continue
-            seen.add(text)
-            texts.append(text)
+            seen.add(interned)
+            texts.append(interned.text)
     return texts
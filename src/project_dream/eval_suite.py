@@ -1,4 +1,6 @@
 import json
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from project_dream.models import EvalCheck, EvalResult
@@ -35,10 +37,50 @@ REQUIRED_STAGE_EVENT_TYPES = {
 }
 
 
-def _quality_metrics_v1(runlog_rows: list[dict], report: dict) -> dict[str, float]:
-    round_rows = [row for row in runlog_rows if row.get("type") == "round"]
-    gate_rows = [row for row in runlog_rows if row.get("type") == "gate"]
-    action_rows = [row for row in runlog_rows if row.get("type") == "action"]
+@dataclass
+class RunlogView:
+    """Runlog rows grouped once by type; checks and metric sets read from here."""
+
+    rows: list[dict]
+    by_type: dict[str, list[dict]] = field(default_factory=dict)
+    indices_by_type: dict[str, list[int]] = field(default_factory=dict)
+
+    @classmethod
+    def from_rows(cls, rows: list[dict]) -> "RunlogView":
+        view = cls(rows=rows)
+        for idx, row in enumerate(rows):
+            row_type = row.get("type")
+            if row_type:
+                key = str(row_type)
+                view.by_type.setdefault(key, []).append(row)
+                view.indices_by_type.setdefault(key, []).append(idx)
+        return view
+
+    def of_type(self, row_type: str) -> list[dict]:
+        return self.by_type.get(row_type, [])
+
+    def count(self, row_type: str) -> int:
+        return len(self.by_type.get(row_type, []))
+
+    def first_index(self, row_type: str) -> int | None:
+        indices = self.indices_by_type.get(row_type)
+        return indices[0] if indices else None
+
+    def last_index(self, row_type: str) -> int | None:
+        indices = self.indices_by_type.get(row_type)
+        return indices[-1] if indices else None
+
+    def round_ids(self, row_type: str) -> list[int]:
+        return sorted({int(row.get("round", 0)) for row in self.of_type(row_type)})
+
+
+MetricSet = Callable[[RunlogView, dict], dict[str, float]]
+
+
+def _quality_metrics_v1(view: RunlogView, report: dict) -> dict[str, float]:
+    round_rows = view.of_type("round")
+    gate_rows = view.of_type("gate")
+    action_rows = view.of_type("action")
 
     moderation_actions = {
         "HIDE_PREVIEW",
@@ -71,10 +113,10 @@ def _quality_metrics_v1(runlog_rows: list[dict], report: dict) -> dict[str, floa
     }
 
 
-def _quality_metrics_v2(runlog_rows: list[dict], report: dict) -> dict[str, float]:
-    metrics = dict(_quality_metrics_v1(runlog_rows, report))
+def _quality_metrics_v2(view: RunlogView, report: dict) -> dict[str, float]:
+    metrics = dict(_quality_metrics_v1(view, report))
 
-    gate_rows = [row for row in runlog_rows if row.get("type") == "gate"]
+    gate_rows = view.of_type("gate")
     lore_total = 0
     lore_passed = 0
     for row in gate_rows:
@@ -85,7 +127,7 @@ def _quality_metrics_v2(runlog_rows: list[dict], report: dict) -> dict[str, floa
             lore_passed += int(bool(gate.get("passed")))
     lore_pass_rate = lore_passed / max(1, lore_total)
 
-    action_rows = [row for row in runlog_rows if row.get("type") == "action"]
+    action_rows = view.of_type("action")
     depth_map = {
         "HIDE_PREVIEW": 0.25,
         "LOCK_THREAD": 0.5,
@@ -102,7 +144,7 @@ def _quality_metrics_v2(runlog_rows: list[dict], report: dict) -> dict[str, floa
     unique_speakers = len({item.get("speaker") for item in dialogue if item.get("speaker")})
     dialogue_speaker_diversity = unique_speakers / max(1, dialogue_count)
 
-    round_rows = [row for row in runlog_rows if row.get("type") == "round"]
+    round_rows = view.of_type("round")
     dial_flow_total = 0
     dial_flow_aligned = 0
     dial_sort_tab_total = 0
@@ -153,12 +195,20 @@ def _quality_metrics_v2(runlog_rows: list[dict], report: dict) -> dict[str, floa
     return metrics
 
 
-METRIC_SET_REGISTRY = {
+METRIC_SET_REGISTRY: dict[str, MetricSet] = {
     "v1": _quality_metrics_v1,
     "v2": _quality_metrics_v2,
 }
 
 
+def register_metric_set(name: str, metric_set: MetricSet) -> None:
+    if not name.strip():
+        raise ValueError("metric_set name must be non-empty")
+    if name in METRIC_SET_REGISTRY:
+        raise ValueError(f"Metric set already registered: {name}")
+    METRIC_SET_REGISTRY[name] = metric_set
+
+
 def _safe_read_json(path: Path) -> dict:
     if not path.exists():
         return {}
@@ -169,10 +219,11 @@ def _safe_read_jsonl(path: Path) -> list[dict]:
     if not path.exists():
         return []
     rows: list[dict] = []
-    for line in path.read_text(encoding="utf-8").splitlines():
-        if not line.strip():
-            continue
-        rows.append(json.loads(line))
+    with path.open(encoding="utf-8") as fp:
+        for line in fp:
+            if not line.strip():
+                continue
+            rows.append(json.loads(line))
     return rows
 
 
@@ -284,32 +335,31 @@ def evaluate_run(run_dir: Path, metric_set: str = "v1") -> dict:
         raise ValueError(f"Unknown metric_set: {metric_set}")
 
     report = _safe_read_json(run_dir / "report.json")
-    runlog_rows = _safe_read_jsonl(run_dir / "runlog.jsonl")
+    view = RunlogView.from_rows(_safe_read_jsonl(run_dir / "runlog.jsonl"))
 
     checks: list[EvalCheck] = []
 
-    event_types = {row.get("type") for row in runlog_rows}
+    event_types = set(view.by_type)
     has_required_event_types = {"round", "gate", "action"}.issubset(event_types)
     checks.append(
         EvalCheck(
             name="runlog.required_event_types",
             passed=has_required_event_types,
-            details=f"event_types={sorted([t for t in event_types if t])}",
+            details=f"event_types={sorted(event_types)}",
         )
     )
 
-    context_rows = [row for row in runlog_rows if row.get("type") == "context"]
+    context_count = view.count("context")
     checks.append(
         EvalCheck(
             name="runlog.context_trace_present",
-            passed=len(context_rows) >= 1,
-            details=f"context_rows={len(context_rows)}",
+            passed=context_count >= 1,
+            details=f"context_rows={context_count}",
         )
     )
 
     stage_type_counts: dict[str, int] = {
-        event_type: sum(1 for row in runlog_rows if row.get("type") == event_type)
-        for event_type in sorted(REQUIRED_STAGE_EVENT_TYPES)
+        event_type: view.count(event_type) for event_type in sorted(REQUIRED_STAGE_EVENT_TYPES)
     }
     missing_stage_types = [
         event_type for event_type in sorted(REQUIRED_STAGE_EVENT_TYPES) if stage_type_counts[event_type] < 1
@@ -322,14 +372,10 @@ def evaluate_run(run_dir: Path, metric_set: str = "v1") -> dict:
         )
     )
 
-    round_ids = sorted({int(row.get("round", 0)) for row in runlog_rows if row.get("type") == "round"})
-    round_summary_ids = sorted(
-        {int(row.get("round", 0)) for row in runlog_rows if row.get("type") == "round_summary"}
-    )
-    moderation_ids = sorted(
-        {int(row.get("round", 0)) for row in runlog_rows if row.get("type") == "moderation_decision"}
-    )
-    end_conditions = [row for row in runlog_rows if row.get("type") == "end_condition"]
+    round_ids = view.round_ids("round")
+    round_summary_ids = view.round_ids("round_summary")
+    moderation_ids = view.round_ids("moderation_decision")
+    end_conditions = view.of_type("end_condition")
     ended_round = None
     if end_conditions:
         ended_round = int(end_conditions[0].get("ended_round", 0))
@@ -372,61 +418,19 @@ def evaluate_run(run_dir: Path, metric_set: str = "v1") -> dict:
         )
     )
 
-    indices_by_type: dict[str, list[int]] = {}
-    for idx, row in enumerate(runlog_rows):
-        row_type = row.get("type")
-        if not row_type:
-            continue
-        indices_by_type.setdefault(str(row_type), []).append(idx)
-
-    core_indices = [
-        idx
-        for row_type in ("round", "gate", "action")
-        for idx in indices_by_type.get(row_type, [])
+    core_last_candidates = [
+        idx for idx in (view.last_index(row_type) for row_type in ("round", "gate", "action")) if idx is not None
     ]
-    first_round_idx = (
-        min(indices_by_type.get("round", [])) if indices_by_type.get("round") else None
-    )
-    core_last_idx = max(core_indices) if core_indices else None
-
-    context_first_idx = (
-        min(indices_by_type.get("context", [])) if indices_by_type.get("context") else None
-    )
-    thread_candidate_last_idx = (
-        max(indices_by_type.get("thread_candidate", []))
-        if indices_by_type.get("thread_candidate")
-        else None
-    )
-    thread_selected_first_idx = (
-        min(indices_by_type.get("thread_selected", []))
-        if indices_by_type.get("thread_selected")
-        else None
-    )
-    round_summary_first_idx = (
-        min(indices_by_type.get("round_summary", []))
-        if indices_by_type.get("round_summary")
-        else None
-    )
-    round_summary_last_idx = (
-        max(indices_by_type.get("round_summary", []))
-        if indices_by_type.get("round_summary")
-        else None
-    )
-    moderation_first_idx = (
-        min(indices_by_type.get("moderation_decision", []))
-        if indices_by_type.get("moderation_decision")
-        else None
-    )
-    moderation_last_idx = (
-        max(indices_by_type.get("moderation_decision", []))
-        if indices_by_type.get("moderation_decision")
-        else None
-    )
-    end_condition_idx = (
-        min(indices_by_type.get("end_condition", []))
-        if indices_by_type.get("end_condition")
-        else None
-    )
+    first_round_idx = view.first_index("round")
+    core_last_idx = max(core_last_candidates) if core_last_candidates else None
+    context_first_idx = view.first_index("context")
+    thread_candidate_last_idx = view.last_index("thread_candidate")
+    thread_selected_first_idx = view.first_index("thread_selected")
+    round_summary_first_idx = view.first_index("round_summary")
+    round_summary_last_idx = view.last_index("round_summary")
+    moderation_first_idx = view.first_index("moderation_decision")
+    moderation_last_idx = view.last_index("moderation_decision")
+    end_condition_idx = view.first_index("end_condition")
 
     stage_trace_ordered = (
         context_first_idx is not None
@@ -518,7 +522,7 @@ def evaluate_run(run_dir: Path, metric_set: str = "v1") -> dict:
         story_checklist_present_items = 0
 
     pass_fail = all(check.passed for check in checks)
-    quality_metrics = METRIC_SET_REGISTRY[metric_set](runlog_rows, report)
+    quality_metrics = METRIC_SET_REGISTRY[metric_set](view, report)
 
     result = EvalResult(
         metric_set=metric_set,
@@ -527,15 +531,15 @@ def evaluate_run(run_dir: Path, metric_set: str = "v1") -> dict:
         pass_fail=pass_fail,
         checks=checks,
         metrics={
-            "runlog_rows": len(runlog_rows),
-            "context_rows": len(context_rows),
+            "runlog_rows": len(view.rows),
+            "context_rows": context_count,
             "stage_trace_rows": sum(stage_type_counts.values()),
             "stage_trace_coverage_rate": stage_trace_coverage_rate,
             "stage_trace_consistent": int(stage_trace_consistent),
             "stage_trace_ordered": int(stage_trace_ordered),
-            "round_rows": sum(1 for row in runlog_rows if row.get("type") == "round"),
-            "gate_rows": sum(1 for row in runlog_rows if row.get("type") == "gate"),
-            "action_rows": sum(1 for row in runlog_rows if row.get("type") == "action"),
+            "round_rows": view.count("round"),
+            "gate_rows": view.count("gate"),
+            "action_rows": view.count("action"),
             "highlight_count": highlight_count,
             "dialogue_count": dialogue_count,
             "lens_count": lens_count,
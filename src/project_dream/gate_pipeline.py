@@ -1,6 +1,13 @@
+import json
 import re
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
 from copy import deepcopy
+from dataclasses import dataclass
+from functools import lru_cache
 
+from rapidfuzz import process
 from rapidfuzz.fuzz import ratio
 from project_dream.prompt_templates import render_prompt
 
@@ -129,6 +136,71 @@ def _compile_phone_pattern(pattern_text: str) -> re.Pattern[str]:
         return re.compile(DEFAULT_GATE_POLICY["safety"]["phone_pattern"])
 
 
+class _SimilarityIndex:
+    def __init__(self, corpus: tuple[str, ...]):
+        buckets: dict[int, list[int]] = {}
+        for idx, text in enumerate(corpus):
+            buckets.setdefault(len(text), []).append(idx)
+        self.buckets = {
+            length: (indices, [corpus[idx] for idx in indices]) for length, indices in buckets.items()
+        }
+
+    def top_k(self, text: str, k: int = 3) -> list[dict]:
+        query_len = len(text)
+        # ratio() is 2 * LCS / (len_a + len_b), so a length bucket can never score above this bound.
+        ordered: list[tuple[float, int]] = []
+        for length in self.buckets:
+            total = query_len + length
+            bound = 100.0 if total == 0 else 100.0 * (1.0 - ((total - 2 * min(query_len, length)) / total))
+            ordered.append((bound, length))
+        ordered.sort(key=lambda item: (-item[0], item[1]))
+
+        best: list[tuple[float, int]] = []
+        for bound, length in ordered:
+            cutoff = best[-1][0] if len(best) >= k else 0.0
+            if len(best) >= k and bound + 1e-9 < cutoff:
+                break
+            indices, texts = self.buckets[length]
+            for _, score, position in process.extract(
+                text, texts, scorer=ratio, limit=k, score_cutoff=cutoff
+            ):
+                best.append((float(score), indices[position]))
+            best.sort(key=lambda item: (-item[0], item[1]))
+            del best[k:]
+        return [{"index": idx, "score": score} for score, idx in best]
+
+
+@lru_cache(maxsize=16)
+def _similarity_index_for_texts(corpus: tuple[str, ...]) -> _SimilarityIndex:
+    return _SimilarityIndex(corpus)
+
+
+_SIMILARITY_INDEX_CACHE_SIZE = 16
+# id(corpus) -> (corpus, index); the corpus is held so its id cannot be reused while cached.
+_SIMILARITY_INDEXES: OrderedDict[int, tuple[tuple[str, ...], _SimilarityIndex]] = OrderedDict()
+_SIMILARITY_INDEXES_LOCK = threading.Lock()
+
+
+def _similarity_index(corpus: Sequence[str]) -> _SimilarityIndex:
+    # Tuples are immutable, so a corpus tuple reused across gate calls is looked up by identity
+    # instead of being re-hashed per call; other sequences are snapshotted and keyed by content.
+    if not isinstance(corpus, tuple):
+        return _similarity_index_for_texts(tuple(corpus))
+    key = id(corpus)
+    with _SIMILARITY_INDEXES_LOCK:
+        entry = _SIMILARITY_INDEXES.get(key)
+        if entry is not None and entry[0] is corpus:
+            _SIMILARITY_INDEXES.move_to_end(key)
+            return entry[1]
+    index = _similarity_index_for_texts(corpus)
+    with _SIMILARITY_INDEXES_LOCK:
+        _SIMILARITY_INDEXES[key] = (corpus, index)
+        _SIMILARITY_INDEXES.move_to_end(key)
+        while len(_SIMILARITY_INDEXES) > _SIMILARITY_INDEX_CACHE_SIZE:
+            _SIMILARITY_INDEXES.popitem(last=False)
+    return index
+
+
 def _build_violation(
     *,
     gate_name: str,
@@ -148,61 +220,143 @@ def _build_violation(
     }
 
 
-def _entity_refs_from_text(
-    text: str,
-    *,
-    phone_pattern: re.Pattern[str],
-    evidence_keywords: list[str],
-    context_keywords: list[str],
-    claim_markers: list[str],
-    taboo_words: list[str],
-    moderation_keywords: list[str],
-) -> list[str]:
+def _compile_keyword_scanner(terms: list[str]) -> tuple[re.Pattern[str] | None, dict[str, frozenset[str]]]:
+    unique_terms = sorted(set(terms), key=lambda term: (-len(term), term))
+    if not unique_terms:
+        return None, {}
+    # The lookahead reports the longest term starting at every position; shorter terms that occur
+    # inside it are recovered from the closure, so the scan matches independent `term in text` checks.
+    pattern = re.compile("(?=(" + "|".join(re.escape(term) for term in unique_terms) + "))")
+    closure = {
+        term: frozenset(other for other in unique_terms if other in term) for term in unique_terms
+    }
+    return pattern, closure
+
+
+@dataclass(frozen=True)
+class CompiledGatePolicy:
+    phone_pattern: re.Pattern[str]
+    taboo_words: tuple[str, ...]
+    evidence_keywords: tuple[str, ...]
+    context_keywords: tuple[str, ...]
+    claim_markers: tuple[str, ...]
+    moderation_keywords: tuple[str, ...]
+    contradiction_term_groups: tuple[tuple[tuple[str, ...], tuple[str, ...]], ...]
+    rule_ids: dict[str, str]
+    keyword_pattern: re.Pattern[str] | None
+    keyword_closure: dict[str, frozenset[str]]
+
+    def terms_in(self, text: str) -> set[str]:
+        if self.keyword_pattern is None:
+            return set()
+        found: set[str] = set()
+        for match in self.keyword_pattern.finditer(text):
+            term = match.group(1)
+            if term not in found:
+                found.update(self.keyword_closure[term])
+        return found
+
+
+def _resolved_rule_id(rule_ids: object, key: str, default: str) -> str:
+    if not isinstance(rule_ids, dict):
+        return default
+    return str(rule_ids.get(key, default)).strip() or default
+
+
+def _build_compiled_gate_policy(gate_policy: dict | None) -> CompiledGatePolicy:
+    resolved_policy = _resolve_gate_policy(gate_policy)
+    safety_policy = resolved_policy.get("safety", {})
+    lore_policy = resolved_policy.get("lore", {})
+    similarity_policy = resolved_policy.get("similarity", {})
+    taboo_words = _as_str_list(safety_policy.get("taboo_words")) or _as_str_list(
+        DEFAULT_GATE_POLICY["safety"]["taboo_words"]
+    )
+    evidence_keywords = _as_str_list(lore_policy.get("evidence_keywords")) or _as_str_list(
+        DEFAULT_GATE_POLICY["lore"]["evidence_keywords"]
+    )
+    context_keywords = _as_str_list(lore_policy.get("context_keywords")) or _as_str_list(
+        DEFAULT_GATE_POLICY["lore"]["context_keywords"]
+    )
+    claim_markers = _as_str_list(lore_policy.get("claim_markers")) or _as_str_list(
+        DEFAULT_GATE_POLICY["lore"]["claim_markers"]
+    )
+    moderation_keywords = _as_str_list(lore_policy.get("moderation_keywords")) or _as_str_list(
+        DEFAULT_GATE_POLICY["lore"]["moderation_keywords"]
+    )
+    contradiction_term_groups = _normalize_contradiction_term_groups(
+        lore_policy.get("contradiction_term_groups")
+    ) or _normalize_contradiction_term_groups(DEFAULT_GATE_POLICY["lore"]["contradiction_term_groups"])
+    safety_rule_ids = safety_policy.get("rule_ids", {})
+    lore_rule_ids = lore_policy.get("rule_ids", {})
+    similarity_rule_ids = similarity_policy.get("rule_ids", {})
+    scan_terms = taboo_words + evidence_keywords + context_keywords + claim_markers + moderation_keywords
+    for positives, negatives in contradiction_term_groups:
+        scan_terms.extend(positives)
+        scan_terms.extend(negatives)
+    keyword_pattern, keyword_closure = _compile_keyword_scanner(scan_terms)
+    return CompiledGatePolicy(
+        phone_pattern=_compile_phone_pattern(str(safety_policy.get("phone_pattern", ""))),
+        taboo_words=tuple(taboo_words),
+        evidence_keywords=tuple(evidence_keywords),
+        context_keywords=tuple(context_keywords),
+        claim_markers=tuple(claim_markers),
+        moderation_keywords=tuple(moderation_keywords),
+        contradiction_term_groups=tuple(contradiction_term_groups),
+        rule_ids={
+            "pii_phone": _resolved_rule_id(safety_rule_ids, "pii_phone", "RULE-PLZ-SAFE-01"),
+            "taboo_term": _resolved_rule_id(safety_rule_ids, "taboo_term", "RULE-PLZ-SAFE-02"),
+            "seed_forbidden": _resolved_rule_id(safety_rule_ids, "seed_forbidden", "RULE-PLZ-SAFE-03"),
+            "evidence_missing": _resolved_rule_id(lore_rule_ids, "evidence_missing", "RULE-PLZ-LORE-01"),
+            "consistency_conflict": _resolved_rule_id(
+                lore_rule_ids, "consistency_conflict", "RULE-PLZ-LORE-02"
+            ),
+            "over_threshold": _resolved_rule_id(similarity_rule_ids, "over_threshold", "RULE-PLZ-SIM-01"),
+        },
+        keyword_pattern=keyword_pattern,
+        keyword_closure=keyword_closure,
+    )
+
+
+@lru_cache(maxsize=32)
+def _compile_gate_policy_cached(policy_key: str) -> CompiledGatePolicy:
+    return _build_compiled_gate_policy(json.loads(policy_key))
+
+
+def compile_gate_policy(gate_policy: dict | None) -> CompiledGatePolicy:
+    if not isinstance(gate_policy, dict):
+        gate_policy = None
+    return _compile_gate_policy_cached(json.dumps(gate_policy, ensure_ascii=False, sort_keys=True, default=str))
+
+
+def _entity_refs_from_text(text: str, *, policy: CompiledGatePolicy, found_terms: set[str]) -> list[str]:
     refs: set[str] = set()
-    if phone_pattern.search(text):
+    if policy.phone_pattern.search(text):
         refs.add("ENT-CONTACT")
-    if any(keyword in text for keyword in evidence_keywords):
+    if any(keyword in found_terms for keyword in policy.evidence_keywords):
         refs.add("ENT-EVIDENCE")
-    if any(keyword in text for keyword in context_keywords) or any(marker in text for marker in claim_markers):
+    if any(keyword in found_terms for keyword in policy.context_keywords) or any(
+        marker in found_terms for marker in policy.claim_markers
+    ):
         refs.add("ENT-CLAIM")
-    if any(word in text for word in taboo_words):
+    if any(word in found_terms for word in policy.taboo_words):
         refs.add("ENT-SAFETY-LANGUAGE")
-    if any(word in text for word in moderation_keywords):
+    if any(word in found_terms for word in policy.moderation_keywords):
         refs.add("ENT-MODERATION")
     return sorted(refs)
 
 
-def _run_consistency_checker(
-    text: str,
-    *,
-    contradiction_term_groups: list[tuple[tuple[str, ...], tuple[str, ...]]],
-    lore_consistency_rule_id: str,
-    phone_pattern: re.Pattern[str],
-    evidence_keywords: list[str],
-    context_keywords: list[str],
-    claim_markers: list[str],
-    taboo_words: list[str],
-    moderation_keywords: list[str],
-) -> dict:
+def _run_consistency_checker(text: str, *, policy: CompiledGatePolicy, found_terms: set[str]) -> dict:
     issues: list[dict] = []
-    refs = _entity_refs_from_text(
-        text,
-        phone_pattern=phone_pattern,
-        evidence_keywords=evidence_keywords,
-        context_keywords=context_keywords,
-        claim_markers=claim_markers,
-        taboo_words=taboo_words,
-        moderation_keywords=moderation_keywords,
-    )
-    for positives, negatives in contradiction_term_groups:
-        found_positive = next((term for term in positives if term in text), "")
-        found_negative = next((term for term in negatives if term in text), "")
+    refs = _entity_refs_from_text(text, policy=policy, found_terms=found_terms)
+    for positives, negatives in policy.contradiction_term_groups:
+        found_positive = next((term for term in positives if term in found_terms), "")
+        found_negative = next((term for term in negatives if term in found_terms), "")
         if not found_positive or not found_negative:
             continue
         issues.append(
             _build_violation(
                 gate_name="lore",
-                rule_id=lore_consistency_rule_id,
+                rule_id=policy.rule_ids["consistency_conflict"],
                 code="CONSISTENCY_CONFLICT",
                 message=f"상충 표현 감지: {found_positive}/{found_negative}",
                 severity="medium",
@@ -219,57 +373,20 @@ def _run_consistency_checker(
 
 def run_gates(
     text: str,
-    corpus: list[str],
+    corpus: Sequence[str],
     similarity_threshold: int = 85,
     template_set: str = "v1",
     forbidden_terms: list[str] | None = None,
     sensitivity_tags: list[str] | None = None,
     gate_policy: dict | None = None,
+    compiled_policy: CompiledGatePolicy | None = None,
 ) -> dict:
     gates = []
     aggregate_violations: list[dict] = []
     raw_text = text
     current = text
-    resolved_policy = _resolve_gate_policy(gate_policy)
-    safety_policy = resolved_policy.get("safety", {})
-    lore_policy = resolved_policy.get("lore", {})
-    similarity_policy = resolved_policy.get("similarity", {})
-    phone_pattern = _compile_phone_pattern(str(safety_policy.get("phone_pattern", "")))
-    taboo_words = _as_str_list(safety_policy.get("taboo_words")) or _as_str_list(
-        DEFAULT_GATE_POLICY["safety"]["taboo_words"]
-    )
-    evidence_keywords = _as_str_list(lore_policy.get("evidence_keywords")) or _as_str_list(
-        DEFAULT_GATE_POLICY["lore"]["evidence_keywords"]
-    )
-    context_keywords = _as_str_list(lore_policy.get("context_keywords")) or _as_str_list(
-        DEFAULT_GATE_POLICY["lore"]["context_keywords"]
-    )
-    claim_markers = _as_str_list(lore_policy.get("claim_markers")) or _as_str_list(
-        DEFAULT_GATE_POLICY["lore"]["claim_markers"]
-    )
-    moderation_keywords = _as_str_list(lore_policy.get("moderation_keywords")) or _as_str_list(
-        DEFAULT_GATE_POLICY["lore"]["moderation_keywords"]
-    )
-    contradiction_term_groups = _normalize_contradiction_term_groups(
-        lore_policy.get("contradiction_term_groups")
-    ) or _normalize_contradiction_term_groups(DEFAULT_GATE_POLICY["lore"]["contradiction_term_groups"])
-    safety_rule_ids = safety_policy.get("rule_ids", {})
-    lore_rule_ids = lore_policy.get("rule_ids", {})
-    similarity_rule_ids = similarity_policy.get("rule_ids", {})
-    pii_phone_rule_id = str(safety_rule_ids.get("pii_phone", "RULE-PLZ-SAFE-01")).strip() or "RULE-PLZ-SAFE-01"
-    taboo_term_rule_id = str(safety_rule_ids.get("taboo_term", "RULE-PLZ-SAFE-02")).strip() or "RULE-PLZ-SAFE-02"
-    seed_forbidden_rule_id = (
-        str(safety_rule_ids.get("seed_forbidden", "RULE-PLZ-SAFE-03")).strip() or "RULE-PLZ-SAFE-03"
-    )
-    evidence_missing_rule_id = (
-        str(lore_rule_ids.get("evidence_missing", "RULE-PLZ-LORE-01")).strip() or "RULE-PLZ-LORE-01"
-    )
-    consistency_conflict_rule_id = (
-        str(lore_rule_ids.get("consistency_conflict", "RULE-PLZ-LORE-02")).strip() or "RULE-PLZ-LORE-02"
-    )
-    similarity_over_threshold_rule_id = (
-        str(similarity_rule_ids.get("over_threshold", "RULE-PLZ-SIM-01")).strip() or "RULE-PLZ-SIM-01"
-    )
+    policy = compiled_policy if compiled_policy is not None else compile_gate_policy(gate_policy)
+    phone_pattern = policy.phone_pattern
 
     # Gate 1: Safety
     warnings: list[str] = []
@@ -280,27 +397,28 @@ def run_gates(
         safety_violations.append(
             _build_violation(
                 gate_name="safety",
-                rule_id=pii_phone_rule_id,
+                rule_id=policy.rule_ids["pii_phone"],
                 code="PII_PHONE",
                 message="전화번호 패턴 감지",
                 severity="high",
                 entity_refs=["ENT-CONTACT"],
             )
         )
-    for taboo in taboo_words:
-        if taboo in current:
-            warnings.append(f"TABOO_TERM:{taboo}")
-            current = current.replace(taboo, "부적절 표현")
-            safety_violations.append(
-                _build_violation(
-                    gate_name="safety",
-                    rule_id=taboo_term_rule_id,
-                    code="TABOO_TERM",
-                    message=f"금칙어 감지: {taboo}",
-                    severity="medium",
-                    entity_refs=["ENT-SAFETY-LANGUAGE"],
+    if policy.terms_in(current).intersection(policy.taboo_words):
+        for taboo in policy.taboo_words:
+            if taboo in current:
+                warnings.append(f"TABOO_TERM:{taboo}")
+                current = current.replace(taboo, "부적절 표현")
+                safety_violations.append(
+                    _build_violation(
+                        gate_name="safety",
+                        rule_id=policy.rule_ids["taboo_term"],
+                        code="TABOO_TERM",
+                        message=f"금칙어 감지: {taboo}",
+                        severity="medium",
+                        entity_refs=["ENT-SAFETY-LANGUAGE"],
+                    )
                 )
-            )
     for raw_term in forbidden_terms or []:
         term = str(raw_term).strip()
         if not term:
@@ -317,7 +435,7 @@ def run_gates(
         safety_violations.append(
             _build_violation(
                 gate_name="safety",
-                rule_id=seed_forbidden_rule_id,
+                rule_id=policy.rule_ids["seed_forbidden"],
                 code="SEED_FORBIDDEN_TERM",
                 message=f"Seed 금지어 감지: {term}",
                 severity="high",
@@ -338,9 +456,7 @@ def run_gates(
     )
 
     # Gate 2: Similarity
-    scored = [{"index": idx, "score": float(ratio(current, c))} for idx, c in enumerate(corpus)]
-    scored.sort(key=lambda item: item["score"], reverse=True)
-    top_k = scored[:3]
+    top_k = _similarity_index(corpus).top_k(current, 3)
     max_sim = top_k[0]["score"] if top_k else 0.0
     similarity_pass = max_sim < similarity_threshold
     similarity_violations: list[dict] = []
@@ -349,7 +465,7 @@ def run_gates(
         similarity_violations.append(
             _build_violation(
                 gate_name="similarity",
-                rule_id=similarity_over_threshold_rule_id,
+                rule_id=policy.rule_ids["over_threshold"],
                 code="SIMILARITY_OVER_THRESHOLD",
                 message=f"유사도 임계치 초과: {max_sim} >= {similarity_threshold}",
                 severity="low",
@@ -368,19 +484,10 @@ def run_gates(
     )
 
     # Gate 3: Lore consistency (MVP rule)
-    evidence_found = any(keyword in current for keyword in evidence_keywords)
-    context_found = any(keyword in current for keyword in context_keywords)
-    consistency = _run_consistency_checker(
-        current,
-        contradiction_term_groups=contradiction_term_groups,
-        lore_consistency_rule_id=consistency_conflict_rule_id,
-        phone_pattern=phone_pattern,
-        evidence_keywords=evidence_keywords,
-        context_keywords=context_keywords,
-        claim_markers=claim_markers,
-        taboo_words=taboo_words,
-        moderation_keywords=moderation_keywords,
-    )
+    found_terms = policy.terms_in(current)
+    evidence_found = any(keyword in found_terms for keyword in policy.evidence_keywords)
+    context_found = any(keyword in found_terms for keyword in policy.context_keywords)
+    consistency = _run_consistency_checker(current, policy=policy, found_terms=found_terms)
     lore_violations: list[dict] = []
     checklist = {
         "evidence_keyword_found": evidence_found,
@@ -390,22 +497,14 @@ def run_gates(
         lore_violations.append(
             _build_violation(
                 gate_name="lore",
-                rule_id=evidence_missing_rule_id,
+                rule_id=policy.rule_ids["evidence_missing"],
                 code="EVIDENCE_MISSING",
                 message="증거/정본/로그 기준 부재",
                 severity="medium",
                 entity_refs=sorted(
                     set(
                         ["ENT-EVIDENCE"]
-                        + _entity_refs_from_text(
-                            current,
-                            phone_pattern=phone_pattern,
-                            evidence_keywords=evidence_keywords,
-                            context_keywords=context_keywords,
-                            claim_markers=claim_markers,
-                            taboo_words=taboo_words,
-                            moderation_keywords=moderation_keywords,
-                        )
+                        + _entity_refs_from_text(current, policy=policy, found_terms=found_terms)
                     )
                 ),
             )
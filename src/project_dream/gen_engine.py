@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import threading
 from collections.abc import Mapping
 
 from project_dream.llm_client import LLMClient, build_default_llm_client
@@ -8,7 +9,8 @@ from project_dream.models import Dial, SeedInput
 from project_dream.prompt_templates import render_prompt
 
 
-_LAST_GENERATION_TRACE: dict | None = None
+# Per-thread so personas generated concurrently in one round keep their own trace.
+_GENERATION_TRACE = threading.local()
 
 
 def _render_voice_hint(voice_constraints: dict | None) -> str:
@@ -75,14 +77,12 @@ def _coerce_stage1_payload(raw: str, *, seed: SeedInput) -> dict[str, str]:
 
 
 def reset_last_generation_trace() -> None:
-    global _LAST_GENERATION_TRACE
-    _LAST_GENERATION_TRACE = None
+    _GENERATION_TRACE.last = None
 
 
 def pop_last_generation_trace() -> dict | None:
-    global _LAST_GENERATION_TRACE
-    trace = _LAST_GENERATION_TRACE
-    _LAST_GENERATION_TRACE = None
+    trace = getattr(_GENERATION_TRACE, "last", None)
+    _GENERATION_TRACE.last = None
     return trace
 
 
@@ -186,8 +186,7 @@ def generate_comment(
     template_context: Mapping[str, object] | None = None,
     flow_context: Mapping[str, object] | None = None,
 ) -> str:
-    global _LAST_GENERATION_TRACE
-    _LAST_GENERATION_TRACE = None
+    _GENERATION_TRACE.last = None
 
     client = llm_client if llm_client is not None else build_default_llm_client()
     stage1 = _build_stage1(
@@ -212,7 +211,7 @@ def generate_comment(
         flow_context=flow_context,
     )
     final_text = client.generate(stage2_prompt, task="comment_generation")
-    _LAST_GENERATION_TRACE = {
+    _GENERATION_TRACE.last = {
         "stage1": {
             "claim": stage1.get("claim", ""),
             "evidence": stage1.get("evidence", ""),
@@ -1,6 +1,7 @@
 import json
+import sys
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from urllib.parse import parse_qs, urlparse
@@ -9,10 +10,55 @@ from project_dream.infra.web_api import ProjectDreamAPI
 from project_dream.orchestrator_runtime import StageNodeExecutionError
 
 
+_RUNLOG_QUERY_KEYS = {"limit", "offset", "cursor", "type", "round_from", "round_to"}
+
+
 def _json_bytes(payload: dict) -> bytes:
     return json.dumps(payload, ensure_ascii=False).encode("utf-8")
 
 
+def _optional_int(query: dict[str, list[str]], key: str) -> int | None:
+    raw = query.get(key, [None])[0]
+    return None if raw in (None, "") else int(raw)
+
+
+def _optional_bool(query: dict[str, list[str]], key: str) -> bool | None:
+    raw = query.get(key, [None])[0]
+    if raw in (None, ""):
+        return None
+    normalized = str(raw).strip().lower()
+    if normalized in {"1", "true", "yes"}:
+        return True
+    if normalized in {"0", "false", "no"}:
+        return False
+    raise ValueError(f"Invalid {key}: {raw}")
+
+
+def _list_page_kwargs(query: dict[str, list[str]]) -> dict:
+    include_total = _optional_bool(query, "include_total")
+    return {
+        "offset": _optional_int(query, "offset") or 0,
+        "cursor": query.get("cursor", [None])[0] or None,
+        "include_total": True if include_total is None else include_total,
+    }
+
+
+def _runlog_query_kwargs(query: dict[str, list[str]]) -> dict:
+    row_types = {
+        part.strip()
+        for raw in query.get("type", [])
+        for part in raw.split(",")
+        if part.strip()
+    }
+    return {
+        "offset": _optional_int(query, "offset") or 0,
+        "cursor": _optional_int(query, "cursor") or 0,
+        "row_types": row_types or None,
+        "round_from": _optional_int(query, "round_from"),
+        "round_to": _optional_int(query, "round_to"),
+    }
+
+
 def create_server(
     api: ProjectDreamAPI,
     host: str = "127.0.0.1",
@@ -33,6 +79,50 @@ def create_server(
             self.end_headers()
             self.wfile.write(body)
 
+        def _send_ndjson(self, rows: Iterator[dict]) -> None:
+            # Chunked encoding needs an HTTP/1.1 status line; the connection still closes afterwards.
+            self.protocol_version = "HTTP/1.1"
+            self.close_connection = True
+            self._response_status = 200
+            self.send_response(200)
+            self.send_header("Content-Type", "application/x-ndjson; charset=utf-8")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            try:
+                for row in rows:
+                    self._write_chunk(_json_bytes(row) + b"\n")
+            except Exception as exc:
+                # Headers are already sent, so the failure is reported in-band as the last line.
+                self._log_stream_error(exc)
+                try:
+                    self._write_chunk(_json_bytes({"error": "internal_error", "message": str(exc)}) + b"\n")
+                except OSError:
+                    return
+            self.wfile.write(b"0\r\n\r\n")
+
+        def _write_chunk(self, data: bytes) -> None:
+            self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+
+        def _log_stream_error(self, exc: Exception) -> None:
+            entry = {
+                "event": "http_stream_error",
+                "path": urlparse(self.path).path,
+                "error": f"{type(exc).__name__}: {exc}",
+            }
+            try:
+                if request_logger is not None:
+                    request_logger(entry)
+                else:
+                    print(json.dumps(entry, ensure_ascii=False), file=sys.stderr, flush=True)
+            except Exception:  # pragma: no cover - logging must not break request flow
+                pass
+
+        def _wants_ndjson(self, query: dict[str, list[str]]) -> bool:
+            if query.get("format", [""])[0] == "ndjson":
+                return True
+            return "application/x-ndjson" in self.headers.get("Accept", "")
+
         def _emit_request_log(self, method: str, path: str, auth_ok: bool, started_at: float) -> None:
             if request_logger is None:
                 return
@@ -90,9 +180,7 @@ def create_server(
 
                 if path == "/runs":
                     limit_raw = query.get("limit", [None])[0]
-                    offset_raw = query.get("offset", [None])[0]
                     limit = 20 if limit_raw in (None, "") else int(limit_raw)
-                    offset = 0 if offset_raw in (None, "") else int(offset_raw)
                     seed_id = query.get("seed_id", [None])[0] or None
                     board_id = query.get("board_id", [None])[0] or None
                     status_filter = query.get("status", [None])[0] or None
@@ -101,38 +189,24 @@ def create_server(
                         200,
                         api.list_runs(
                             limit=limit,
-                            offset=offset,
                             seed_id=seed_id,
                             board_id=board_id,
                             status=status_filter,
                             pack_fingerprint=pack_fingerprint,
+                            **_list_page_kwargs(query),
                         ),
                     )
                     return
 
                 if path == "/regressions":
-                    limit_raw = query.get("limit", [None])[0]
-                    offset_raw = query.get("offset", [None])[0]
                     metric_set = query.get("metric_set", [None])[0] or None
-                    pass_fail_raw = query.get("pass_fail", [None])[0]
-                    limit = None if limit_raw in (None, "") else int(limit_raw)
-                    offset = 0 if offset_raw in (None, "") else int(offset_raw)
-                    pass_fail: bool | None = None
-                    if pass_fail_raw not in (None, ""):
-                        normalized = str(pass_fail_raw).strip().lower()
-                        if normalized in {"1", "true", "yes"}:
-                            pass_fail = True
-                        elif normalized in {"0", "false", "no"}:
-                            pass_fail = False
-                        else:
-                            raise ValueError(f"Invalid pass_fail: {pass_fail_raw}")
                     self._send(
                         200,
                         api.list_regression_summaries(
-                            limit=limit,
-                            offset=offset,
+                            limit=_optional_int(query, "limit"),
                             metric_set=metric_set,
-                            pass_fail=pass_fail,
+                            pass_fail=_optional_bool(query, "pass_fail"),
+                            **_list_page_kwargs(query),
                         ),
                     )
                     return
@@ -158,6 +232,28 @@ def create_server(
                     if parts[2] == "eval":
                         self._send(200, api.get_eval(run_id))
                         return
+                    if self._wants_ndjson(query):
+                        rows = api.iter_runlog(
+                            run_id,
+                            limit=_optional_int(query, "limit"),
+                            **_runlog_query_kwargs(query),
+                        )
+                        try:
+                            self._send_ndjson(rows)
+                        finally:
+                            rows.close()
+                        return
+                    if _RUNLOG_QUERY_KEYS.intersection(query):
+                        runlog_limit = _optional_int(query, "limit")
+                        self._send(
+                            200,
+                            api.get_runlog_page(
+                                run_id,
+                                limit=100 if runlog_limit is None else runlog_limit,
+                                **_runlog_query_kwargs(query),
+                            ),
+                        )
+                        return
                     self._send(200, api.get_runlog(run_id))
                     return
 
@@ -194,12 +290,14 @@ def create_server(
                     seed_payload = body.get("seed", {})
                     rounds = int(body.get("rounds", 3))
                     vector_db_path_raw = body.get("vector_db_path")
+                    generation_workers_raw = body.get("generation_workers")
                     payload = api.simulate(
                         seed_payload=seed_payload,
                         rounds=rounds,
                         orchestrator_backend=body.get("orchestrator_backend", "manual"),
                         vector_backend=body.get("vector_backend"),
                         vector_db_path=Path(vector_db_path_raw) if vector_db_path_raw else None,
+                        generation_workers=int(generation_workers_raw) if generation_workers_raw is not None else None,
                     )
                     self._send(200, payload)
                     return
@@ -214,6 +312,7 @@ def create_server(
 
                 if path == "/regress":
                     vector_db_path_raw = body.get("vector_db_path")
+                    generation_workers_raw = body.get("generation_workers")
                     payload = api.regress(
                         seeds_dir=Path(body.get("seeds_dir", "examples/seeds/regression")),
                         rounds=int(body.get("rounds", 4)),
@@ -226,6 +325,8 @@ def create_server(
                         orchestrator_backend=body.get("orchestrator_backend", "manual"),
                         vector_backend=body.get("vector_backend"),
                         vector_db_path=Path(vector_db_path_raw) if vector_db_path_raw else None,
+                        workers=int(body.get("workers", 1)),
+                        generation_workers=int(generation_workers_raw) if generation_workers_raw is not None else None,
                     )
                     self._send(200, payload)
                     return
@@ -1,10 +1,17 @@
+import base64
 import json
+import os
 import sqlite3
+import stat
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Protocol
 
 from project_dream.eval_suite import find_latest_run
+from project_dream.storage import check_runlog_cursor, iter_runlog_rows, read_runlog_rows
 from project_dream.storage import persist_eval as persist_eval_file
 from project_dream.storage import persist_run as persist_run_file
 
@@ -114,6 +121,145 @@ def _build_runlog_summary(rows: list[dict]) -> dict:
     }
 
 
+def _runlog_path(run_dir: Path, run_id: str) -> Path:
+    path = run_dir / "runlog.jsonl"
+    if not path.exists():
+        raise FileNotFoundError(f"Runlog not found for run: {run_id}")
+    return path
+
+
+def _validate_runlog_query(*, limit: int | None, offset: int, cursor: int) -> None:
+    if limit is not None and limit < 1:
+        raise ValueError(f"Invalid limit: {limit}")
+    if offset < 0:
+        raise ValueError(f"Invalid offset: {offset}")
+    if cursor < 0:
+        raise ValueError(f"Invalid cursor: {cursor}")
+
+
+def _stream_runlog(
+    path: Path,
+    *,
+    limit: int | None,
+    offset: int,
+    cursor: int,
+    row_types: set[str] | None,
+    round_from: int | None,
+    round_to: int | None,
+) -> Iterator[dict]:
+    rows = iter_runlog_rows(
+        path.parent,
+        row_types=row_types,
+        round_from=round_from,
+        round_to=round_to,
+        cursor=cursor,
+    )
+    emitted = 0
+    for index, (_, row) in enumerate(rows):
+        if index < offset:
+            continue
+        if limit is not None and emitted >= limit:
+            return
+        emitted += 1
+        yield row
+
+
+def _runlog_page(
+    run_id: str,
+    path: Path,
+    *,
+    limit: int,
+    offset: int,
+    cursor: int,
+    row_types: set[str] | None,
+    round_from: int | None,
+    round_to: int | None,
+) -> dict:
+    items: list[dict] = []
+    next_cursor: int | None = None
+    last_position = cursor
+    rows = iter_runlog_rows(
+        path.parent,
+        row_types=row_types,
+        round_from=round_from,
+        round_to=round_to,
+        cursor=cursor,
+    )
+    for index, (position, row) in enumerate(rows):
+        if index < offset:
+            last_position = position
+            continue
+        if len(items) >= limit:
+            next_cursor = last_position
+            break
+        items.append(row)
+        last_position = position
+    return {
+        "run_id": run_id,
+        "count": len(items),
+        "limit": limit,
+        "offset": offset,
+        "cursor": cursor,
+        "next_cursor": next_cursor,
+        "items": items,
+    }
+
+
+def _encode_list_cursor(sort_key: tuple[str, str]) -> str:
+    raw = json.dumps(list(sort_key), ensure_ascii=False, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_list_cursor(cursor: str | None, *, offset: int) -> tuple[str, str] | None:
+    if not cursor:
+        return None
+    if offset:
+        raise ValueError("cursor and offset cannot be combined")
+    try:
+        decoded = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (ValueError, TypeError) as exc:
+        raise ValueError(f"Invalid cursor: {cursor}") from exc
+    if not (isinstance(decoded, list) and len(decoded) == 2 and all(isinstance(part, str) for part in decoded)):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return decoded[0], decoded[1]
+
+
+def _run_sort_key(row: dict) -> tuple[str, str]:
+    return str(row.get("created_at_utc") or ""), str(row.get("run_id", ""))
+
+
+def _regression_sort_key(row: dict) -> tuple[str, str]:
+    return str(row.get("generated_at_utc") or ""), str(row.get("summary_id", ""))
+
+
+def _paginate_rows(
+    rows: list[dict],
+    *,
+    sort_key: Callable[[dict], tuple[str, str]],
+    limit: int | None,
+    offset: int,
+    cursor: str | None,
+    include_total: bool,
+) -> dict:
+    # `rows` must already be sorted by `sort_key` descending.
+    after = _decode_list_cursor(cursor, offset=offset)
+    total = len(rows) if include_total else None
+    if after is not None:
+        rows = [row for row in rows if sort_key(row) < after]
+    end = None if limit is None else offset + limit
+    items = rows[offset:end]
+    has_more = end is not None and len(rows) > end
+    return {
+        "count": len(items),
+        "total": total,
+        "limit": limit,
+        "offset": offset,
+        "cursor": cursor or None,
+        "next_cursor": _encode_list_cursor(sort_key(items[-1])) if has_more and items else None,
+        "items": items,
+    }
+
+
 class RunRepository(Protocol):
     runs_dir: Path
 
@@ -123,6 +269,9 @@ class RunRepository(Protocol):
     def persist_eval(self, run_dir: Path, eval_result: dict) -> Path:
         ...
 
+    def persist_evals(self, items: list[tuple[Path, dict]]) -> list[Path]:
+        ...
+
     def find_latest_run(self) -> Path:
         ...
 
@@ -138,6 +287,8 @@ class RunRepository(Protocol):
         board_id: str | None = None,
         status: str | None = None,
         pack_fingerprint: str | None = None,
+        cursor: str | None = None,
+        include_total: bool = True,
     ) -> dict:
         ...
 
@@ -150,6 +301,32 @@ class RunRepository(Protocol):
     def load_runlog(self, run_id: str) -> dict:
         ...
 
+    def iter_runlog(
+        self,
+        run_id: str,
+        *,
+        limit: int | None = None,
+        offset: int = 0,
+        cursor: int = 0,
+        row_types: set[str] | None = None,
+        round_from: int | None = None,
+        round_to: int | None = None,
+    ) -> Iterator[dict]:
+        ...
+
+    def load_runlog_page(
+        self,
+        run_id: str,
+        *,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: int = 0,
+        row_types: set[str] | None = None,
+        round_from: int | None = None,
+        round_to: int | None = None,
+    ) -> dict:
+        ...
+
     def persist_regression_summary(self, summary: dict) -> None:
         ...
 
@@ -165,19 +342,50 @@ class RunRepository(Protocol):
         offset: int = 0,
         metric_set: str | None = None,
         pass_fail: bool | None = None,
+        cursor: str | None = None,
+        include_total: bool = True,
     ) -> dict:
         ...
 
 
+_RUN_CATALOG_FILENAME = ".run_catalog.jsonl"
+_RUN_METADATA_ROW_TYPES = {
+    "context",
+    "end_condition",
+    "moderation_decision",
+    "graph_node",
+    "graph_node_attempt",
+    "stage_checkpoint",
+}
+_RUN_ARTIFACT_FILENAMES = ("report.json", "eval.json", "runlog.jsonl")
+
+
 class FileRunRepository:
     def __init__(self, runs_dir: Path):
         self.runs_dir = runs_dir
+        self._catalog: dict[str, dict] | None = None
+        self._catalog_lines = 0
+        self._catalog_lock = threading.Lock()
 
     def persist_run(self, sim_result: dict, report: dict) -> Path:
-        return persist_run_file(self.runs_dir, sim_result, report)
+        run_dir = persist_run_file(self.runs_dir, sim_result, report)
+        self._refresh_catalog_entry(run_dir)
+        return run_dir
 
     def persist_eval(self, run_dir: Path, eval_result: dict) -> Path:
-        return persist_eval_file(run_dir, eval_result)
+        path = persist_eval_file(run_dir, eval_result)
+        self._refresh_catalog_entry(run_dir)
+        return path
+
+    def persist_evals(self, items: list[tuple[Path, dict]]) -> list[Path]:
+        paths = [persist_eval_file(run_dir, eval_result) for run_dir, eval_result in items]
+        entries = [entry for entry in (self._catalog_entry(run_dir) for run_dir, _ in items) if entry is not None]
+        with self._catalog_lock:
+            catalog = self._load_catalog()
+            for entry in entries:
+                catalog[entry["run_id"]] = entry
+            self._append_catalog(entries)
+        return paths
 
     def find_latest_run(self) -> Path:
         return find_latest_run(self.runs_dir)
@@ -194,14 +402,6 @@ class FileRunRepository:
         if offset < 0:
             raise ValueError(f"Invalid offset: {offset}")
 
-    def _list_run_directories(self) -> list[Path]:
-        if not self.runs_dir.exists():
-            return []
-
-        run_dirs = [path for path in self.runs_dir.glob("run-*") if path.is_dir()]
-        run_dirs.sort(key=lambda path: (path.stat().st_mtime, path.name), reverse=True)
-        return run_dirs
-
     def _read_json_if_exists(self, path: Path) -> dict:
         if not path.exists():
             return {}
@@ -221,10 +421,7 @@ class FileRunRepository:
         runlog_rows: list[dict] = []
 
         if runlog_path.exists():
-            for line in runlog_path.read_text(encoding="utf-8").splitlines():
-                if not line.strip():
-                    continue
-                row = json.loads(line)
+            for _, row in iter_runlog_rows(run_dir, row_types=_RUN_METADATA_ROW_TYPES):
                 runlog_rows.append(row)
                 row_type = str(row.get("type", ""))
 
@@ -237,9 +434,6 @@ class FileRunRepository:
                             zone_id = str(bundle.get("zone_id", ""))
                     if not pack_fingerprint:
                         pack_fingerprint = str(row.get("pack_fingerprint", "")).strip()
-                elif row_type == "round":
-                    if not board_id:
-                        board_id = str(row.get("board_id", ""))
                 elif row_type == "end_condition":
                     status = str(row.get("status", ""))
                     termination_reason = str(row.get("termination_reason", ""))
@@ -251,6 +445,13 @@ class FileRunRepository:
                         _coerce_non_negative_int(row.get("report_total"), default=0),
                     )
 
+            if not board_id:
+                # Round rows are only a fallback for runs without a context bundle board.
+                for _, row in iter_runlog_rows(run_dir, row_types={"round"}):
+                    board_id = str(row.get("board_id", ""))
+                    if board_id:
+                        break
+
         stage_trace = _extract_stage_trace_from_runlog_rows(runlog_rows)
 
         created_at = datetime.fromtimestamp(run_dir.stat().st_mtime, tz=UTC).isoformat()
@@ -280,6 +481,111 @@ class FileRunRepository:
             "eval_pass": eval_pass,
         }
 
+    @property
+    def _catalog_path(self) -> Path:
+        return self.runs_dir / _RUN_CATALOG_FILENAME
+
+    def _run_signature(self, run_dir: Path, dir_stat: os.stat_result) -> list[int]:
+        signature = [dir_stat.st_mtime_ns]
+        for name in _RUN_ARTIFACT_FILENAMES:
+            try:
+                file_stat = (run_dir / name).stat()
+            except FileNotFoundError:
+                signature.extend([0, -1])
+                continue
+            signature.extend([file_stat.st_mtime_ns, file_stat.st_size])
+        return signature
+
+    def _catalog_entry(self, run_dir: Path) -> dict | None:
+        try:
+            dir_stat = run_dir.stat()
+        except FileNotFoundError:
+            return None
+        if not stat.S_ISDIR(dir_stat.st_mode):
+            return None
+        return {
+            "run_id": run_dir.name,
+            "signature": self._run_signature(run_dir, dir_stat),
+            "mtime": dir_stat.st_mtime,
+            "metadata": self._extract_run_file_metadata(run_dir),
+        }
+
+    def _load_catalog(self) -> dict[str, dict]:
+        if self._catalog is not None:
+            return self._catalog
+        entries: dict[str, dict] = {}
+        lines = 0
+        if self._catalog_path.exists():
+            with self._catalog_path.open(encoding="utf-8") as fp:
+                for line in fp:
+                    lines += 1
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        # A concurrent writer may leave a torn tail line; that run is simply rescanned.
+                        continue
+                    if isinstance(entry, dict) and entry.get("run_id"):
+                        entries[str(entry["run_id"])] = entry
+        self._catalog = entries
+        self._catalog_lines = lines
+        return entries
+
+    def _append_catalog(self, entries: list[dict]) -> None:
+        if not entries:
+            return
+        self.runs_dir.mkdir(parents=True, exist_ok=True)
+        with self._catalog_path.open("a", encoding="utf-8") as fp:
+            fp.write("".join(json.dumps(entry, ensure_ascii=False) + "\n" for entry in entries))
+        self._catalog_lines += len(entries)
+
+    def _compact_catalog(self, entries: dict[str, dict]) -> None:
+        tmp_path = self._catalog_path.with_name(f"{_RUN_CATALOG_FILENAME}.{os.getpid()}.tmp")
+        with tmp_path.open("w", encoding="utf-8") as fp:
+            for entry in entries.values():
+                fp.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        os.replace(tmp_path, self._catalog_path)
+        self._catalog_lines = len(entries)
+
+    def _refresh_catalog_entry(self, run_dir: Path) -> None:
+        entry = self._catalog_entry(run_dir)
+        if entry is None:
+            return
+        with self._catalog_lock:
+            self._load_catalog()[entry["run_id"]] = entry
+            self._append_catalog([entry])
+
+    def _catalog_rows(self) -> list[dict]:
+        if not self.runs_dir.exists():
+            return []
+
+        with self._catalog_lock:
+            cached = self._load_catalog()
+            current: dict[str, dict] = {}
+            updated: list[dict] = []
+            for run_dir in self.runs_dir.glob("run-*"):
+                try:
+                    dir_stat = run_dir.stat()
+                except FileNotFoundError:
+                    continue
+                if not stat.S_ISDIR(dir_stat.st_mode):
+                    continue
+                entry = cached.get(run_dir.name)
+                if entry is None or entry.get("signature") != self._run_signature(run_dir, dir_stat):
+                    entry = self._catalog_entry(run_dir)
+                    if entry is None:
+                        continue
+                    updated.append(entry)
+                current[run_dir.name] = entry
+
+            self._catalog = current
+            if self._catalog_lines + len(updated) > 2 * len(current) + 64:
+                self._compact_catalog(current)
+            else:
+                self._append_catalog(updated)
+
+        rows = [{**entry["metadata"], "run_dir": str(self.runs_dir / entry["run_id"])} for entry in current.values()]
+        return sorted(rows, key=_run_sort_key, reverse=True)
+
     def list_runs(
         self,
         *,
@@ -289,10 +595,12 @@ class FileRunRepository:
         board_id: str | None = None,
         status: str | None = None,
         pack_fingerprint: str | None = None,
+        cursor: str | None = None,
+        include_total: bool = True,
     ) -> dict:
         self._validate_list_params(limit=limit, offset=offset)
 
-        rows = [self._extract_run_file_metadata(run_dir) for run_dir in self._list_run_directories()]
+        rows = self._catalog_rows()
         if seed_id:
             rows = [row for row in rows if row.get("seed_id", "") == seed_id]
         if board_id:
@@ -302,15 +610,14 @@ class FileRunRepository:
         if pack_fingerprint:
             rows = [row for row in rows if row.get("pack_fingerprint", "") == pack_fingerprint]
 
-        total = len(rows)
-        items = rows[offset : offset + limit]
-        return {
-            "count": len(items),
-            "total": total,
-            "limit": limit,
-            "offset": offset,
-            "items": items,
-        }
+        return _paginate_rows(
+            rows,
+            sort_key=_run_sort_key,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            include_total=include_total,
+        )
 
     def load_report(self, run_id: str) -> dict:
         run_dir = self.get_run(run_id)
@@ -327,17 +634,59 @@ class FileRunRepository:
         return json.loads(path.read_text(encoding="utf-8"))
 
     def load_runlog(self, run_id: str) -> dict:
-        run_dir = self.get_run(run_id)
-        path = run_dir / "runlog.jsonl"
-        if not path.exists():
-            raise FileNotFoundError(f"Runlog not found for run: {run_id}")
-        rows = []
-        for line in path.read_text(encoding="utf-8").splitlines():
-            if not line.strip():
-                continue
-            rows.append(json.loads(line))
+        path = _runlog_path(self.get_run(run_id), run_id)
+        rows = read_runlog_rows(path.parent)
         return {"run_id": run_id, "rows": rows, "summary": _build_runlog_summary(rows)}
 
+    def iter_runlog(
+        self,
+        run_id: str,
+        *,
+        limit: int | None = None,
+        offset: int = 0,
+        cursor: int = 0,
+        row_types: set[str] | None = None,
+        round_from: int | None = None,
+        round_to: int | None = None,
+    ) -> Iterator[dict]:
+        # Validate eagerly so callers can still report errors before streaming starts.
+        _validate_runlog_query(limit=limit, offset=offset, cursor=cursor)
+        path = _runlog_path(self.get_run(run_id), run_id)
+        check_runlog_cursor(path, cursor)
+        return _stream_runlog(
+            path,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            row_types=row_types,
+            round_from=round_from,
+            round_to=round_to,
+        )
+
+    def load_runlog_page(
+        self,
+        run_id: str,
+        *,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: int = 0,
+        row_types: set[str] | None = None,
+        round_from: int | None = None,
+        round_to: int | None = None,
+    ) -> dict:
+        _validate_runlog_query(limit=limit, offset=offset, cursor=cursor)
+        path = _runlog_path(self.get_run(run_id), run_id)
+        return _runlog_page(
+            run_id,
+            path,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            row_types=row_types,
+            round_from=round_from,
+            round_to=round_to,
+        )
+
     def persist_regression_summary(self, summary: dict) -> None:
         # File backend keeps regression metadata as files only.
         return None
@@ -370,6 +719,8 @@ class FileRunRepository:
         offset: int = 0,
         metric_set: str | None = None,
         pass_fail: bool | None = None,
+        cursor: str | None = None,
+        include_total: bool = True,
     ) -> dict:
         if limit is not None and limit < 1:
             raise ValueError(f"Invalid limit: {limit}")
@@ -398,19 +749,25 @@ class FileRunRepository:
         if pass_fail is not None:
             rows = [row for row in rows if bool(row.get("pass_fail")) is bool(pass_fail)]
 
-        total = len(rows)
-        if limit is None:
-            items = rows[offset:]
-        else:
-            items = rows[offset : offset + limit]
+        return _paginate_rows(
+            sorted(rows, key=_regression_sort_key, reverse=True),
+            sort_key=_regression_sort_key,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            include_total=include_total,
+        )
 
-        return {
-            "count": len(items),
-            "total": total,
-            "limit": limit,
-            "offset": offset,
-            "items": items,
-        }
+
+_SQLITE_BUSY_TIMEOUT_MS = 30_000
+_SQLITE_CACHED_STATEMENTS = 256
+_SQLITE_MAX_IDLE_CONNECTIONS = 8
+_RUN_FILTER_COLUMNS = ("seed_id", "board_id", "status", "pack_fingerprint")
+_RUN_LIST_COLUMNS = """
+    run_id, run_dir, created_at_utc, seed_id, board_id, zone_id, status,
+    termination_reason, total_reports, pack_fingerprint, stage_retry_count, stage_failure_count,
+    max_stage_attempts, report_gate_pass, eval_pass
+"""
 
 
 class SQLiteRunRepository:
@@ -418,13 +775,56 @@ class SQLiteRunRepository:
         self.runs_dir = runs_dir
         self.runs_dir.mkdir(parents=True, exist_ok=True)
         self.db_path = db_path or (self.runs_dir / "runs.sqlite3")
+        self._idle_connections: list[sqlite3.Connection] = []
+        self._pool_lock = threading.Lock()
+        self._pool_pid = os.getpid()
+        self.connections_opened = 0
         self._init_db()
 
-    def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
+    def _open_connection(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=_SQLITE_BUSY_TIMEOUT_MS / 1000,
+            check_same_thread=False,
+            cached_statements=_SQLITE_CACHED_STATEMENTS,
+        )
         conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA busy_timeout={_SQLITE_BUSY_TIMEOUT_MS}")
+        conn.execute("PRAGMA temp_store=MEMORY")
         return conn
 
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # Connections are checked out per operation and returned to an idle pool, so request
+        # threads reuse warm handles (and their statement caches) instead of reconnecting.
+        with self._pool_lock:
+            if self._pool_pid != os.getpid():
+                # Never reuse handles inherited across fork.
+                self._idle_connections = []
+                self._pool_pid = os.getpid()
+            conn = self._idle_connections.pop() if self._idle_connections else None
+        if conn is None:
+            conn = self._open_connection()
+            self.connections_opened += 1
+        try:
+            with conn:
+                yield conn
+        finally:
+            with self._pool_lock:
+                if self._pool_pid == os.getpid() and len(self._idle_connections) < _SQLITE_MAX_IDLE_CONNECTIONS:
+                    self._idle_connections.append(conn)
+                    conn = None
+            if conn is not None:
+                conn.close()
+
+    def close(self) -> None:
+        with self._pool_lock:
+            connections, self._idle_connections = self._idle_connections, []
+        for conn in connections:
+            conn.close()
+
     def _init_db(self) -> None:
         with self._connect() as conn:
             conn.execute(
@@ -483,6 +883,27 @@ class SQLiteRunRepository:
                 conn.execute("ALTER TABLE runs ADD COLUMN max_stage_attempts INTEGER DEFAULT 0")
             if "pack_fingerprint" not in columns:
                 conn.execute("ALTER TABLE runs ADD COLUMN pack_fingerprint TEXT DEFAULT ''")
+            # (filter, created_at, run_id) indexes cover the COUNT, the ordered rowid page scan
+            # and the keyset cursor comparison.
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_runs_created_at_run_id
+                ON runs (created_at_utc DESC, run_id DESC)
+                """
+            )
+            for column in _RUN_FILTER_COLUMNS:
+                conn.execute(
+                    f"""
+                    CREATE INDEX IF NOT EXISTS idx_runs_{column}_created_at
+                    ON runs ({column}, created_at_utc DESC, run_id DESC)
+                    """
+                )
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_regression_summaries_sort_key
+                ON regression_summaries (COALESCE(generated_at_utc, indexed_at_utc) DESC, summary_id DESC)
+                """
+            )
             conn.commit()
 
     def _upsert_run_index(self, run_dir: Path, sim_result: dict, report: dict) -> None:
@@ -575,6 +996,16 @@ class SQLiteRunRepository:
         self._set_eval_status(run_dir.name, eval_result)
         return output
 
+    def persist_evals(self, items: list[tuple[Path, dict]]) -> list[Path]:
+        outputs = [persist_eval_file(run_dir, eval_result) for run_dir, eval_result in items]
+        with self._connect() as conn:
+            conn.executemany(
+                "UPDATE runs SET eval_pass = ? WHERE run_id = ?",
+                [(int(bool(eval_result.get("pass_fail"))), run_dir.name) for run_dir, eval_result in items],
+            )
+            conn.commit()
+        return outputs
+
     def find_latest_run(self) -> Path:
         with self._connect() as conn:
             row = conn.execute(
@@ -607,6 +1038,8 @@ class SQLiteRunRepository:
         board_id: str | None = None,
         status: str | None = None,
         pack_fingerprint: str | None = None,
+        cursor: str | None = None,
+        include_total: bool = True,
     ) -> dict:
         if limit < 1:
             raise ValueError(f"Invalid limit: {limit}")
@@ -629,25 +1062,41 @@ class SQLiteRunRepository:
             params.append(pack_fingerprint)
         where_clause = f"WHERE {' AND '.join(clauses)}" if clauses else ""
 
-        with self._connect() as conn:
-            total_row = conn.execute(
-                f"SELECT COUNT(*) AS total FROM runs {where_clause}",
-                params,
-            ).fetchone()
-            total = int(total_row["total"]) if total_row is not None else 0
+        after = _decode_list_cursor(cursor, offset=offset)
+        page_clauses = list(clauses)
+        page_params = list(params)
+        if after is not None:
+            page_clauses.append("(created_at_utc, run_id) < (?, ?)")
+            page_params.extend(after)
+        page_where = f"WHERE {' AND '.join(page_clauses)}" if page_clauses else ""
 
+        with self._connect() as conn:
+            total: int | None = None
+            if include_total:
+                total_row = conn.execute(
+                    f"SELECT COUNT(*) AS total FROM runs {where_clause}",
+                    params,
+                ).fetchone()
+                total = int(total_row["total"]) if total_row is not None else 0
+
+            # Walk the (filter, created_at, run_id) index to the page, then fetch the full rows.
+            # One extra row tells whether a next page exists without counting.
             rows = conn.execute(
                 f"""
-                SELECT run_id, run_dir, created_at_utc, seed_id, board_id, zone_id, status,
-                       termination_reason, total_reports, pack_fingerprint, stage_retry_count, stage_failure_count,
-                       max_stage_attempts, report_gate_pass, eval_pass
+                SELECT {_RUN_LIST_COLUMNS}
                 FROM runs
-                {where_clause}
-                ORDER BY created_at_utc DESC
-                LIMIT ? OFFSET ?
+                WHERE rowid IN (
+                    SELECT rowid FROM runs
+                    {page_where}
+                    ORDER BY created_at_utc DESC, run_id DESC
+                    LIMIT ? OFFSET ?
+                )
+                ORDER BY created_at_utc DESC, run_id DESC
                 """,
-                [*params, limit, offset],
+                [*page_params, limit + 1, offset],
             ).fetchall()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
 
         items: list[dict] = []
         for row in rows:
@@ -680,6 +1129,8 @@ class SQLiteRunRepository:
             "total": total,
             "limit": limit,
             "offset": offset,
+            "cursor": cursor or None,
+            "next_cursor": _encode_list_cursor(_run_sort_key(items[-1])) if has_more and items else None,
             "items": items,
         }
 
@@ -698,23 +1149,70 @@ class SQLiteRunRepository:
         return json.loads(path.read_text(encoding="utf-8"))
 
     def load_runlog(self, run_id: str) -> dict:
-        run_dir = self.get_run(run_id)
-        path = run_dir / "runlog.jsonl"
-        if not path.exists():
-            raise FileNotFoundError(f"Runlog not found for run: {run_id}")
-        rows = []
-        for line in path.read_text(encoding="utf-8").splitlines():
-            if not line.strip():
-                continue
-            rows.append(json.loads(line))
+        path = _runlog_path(self.get_run(run_id), run_id)
+        rows = read_runlog_rows(path.parent)
         return {"run_id": run_id, "rows": rows, "summary": _build_runlog_summary(rows)}
 
+    def iter_runlog(
+        self,
+        run_id: str,
+        *,
+        limit: int | None = None,
+        offset: int = 0,
+        cursor: int = 0,
+        row_types: set[str] | None = None,
+        round_from: int | None = None,
+        round_to: int | None = None,
+    ) -> Iterator[dict]:
+        # Validate eagerly so callers can still report errors before streaming starts.
+        _validate_runlog_query(limit=limit, offset=offset, cursor=cursor)
+        path = _runlog_path(self.get_run(run_id), run_id)
+        check_runlog_cursor(path, cursor)
+        return _stream_runlog(
+            path,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            row_types=row_types,
+            round_from=round_from,
+            round_to=round_to,
+        )
+
+    def load_runlog_page(
+        self,
+        run_id: str,
+        *,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: int = 0,
+        row_types: set[str] | None = None,
+        round_from: int | None = None,
+        round_to: int | None = None,
+    ) -> dict:
+        _validate_runlog_query(limit=limit, offset=offset, cursor=cursor)
+        path = _runlog_path(self.get_run(run_id), run_id)
+        return _runlog_page(
+            run_id,
+            path,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            row_types=row_types,
+            round_from=round_from,
+            round_to=round_to,
+        )
+
     def _sync_regression_indexes_from_files(self) -> None:
         regressions_dir = self.runs_dir / "regressions"
         if not regressions_dir.exists():
             return
 
+        with self._connect() as conn:
+            indexed = {str(row["summary_id"]) for row in conn.execute("SELECT summary_id FROM regression_summaries")}
+        # Summary files are written once; only parse the ones the index has not seen yet.
         for path in sorted(regressions_dir.glob("regression-*.json")):
+            if path.name in indexed:
+                continue
             try:
                 payload = json.loads(path.read_text(encoding="utf-8"))
             except json.JSONDecodeError:
@@ -836,6 +1334,8 @@ class SQLiteRunRepository:
         offset: int = 0,
         metric_set: str | None = None,
         pass_fail: bool | None = None,
+        cursor: str | None = None,
+        include_total: bool = True,
     ) -> dict:
         if limit is not None and limit < 1:
             raise ValueError(f"Invalid limit: {limit}")
@@ -853,37 +1353,42 @@ class SQLiteRunRepository:
             params.append(int(bool(pass_fail)))
         where_clause = f"WHERE {' AND '.join(clauses)}" if clauses else ""
 
+        after = _decode_list_cursor(cursor, offset=offset)
+        page_clauses = list(clauses)
+        page_params = list(params)
+        if after is not None:
+            page_clauses.append("(COALESCE(generated_at_utc, indexed_at_utc), summary_id) < (?, ?)")
+            page_params.extend(after)
+        page_where = f"WHERE {' AND '.join(page_clauses)}" if page_clauses else ""
+
         with self._connect() as conn:
-            total_row = conn.execute(
-                f"""
-                SELECT COUNT(*) AS total
-                FROM regression_summaries
-                {where_clause}
-                """,
-                params,
-            ).fetchone()
-            total = int(total_row["total"]) if total_row is not None else 0
+            total: int | None = None
+            if include_total:
+                total_row = conn.execute(
+                    f"""
+                    SELECT COUNT(*) AS total
+                    FROM regression_summaries
+                    {where_clause}
+                    """,
+                    params,
+                ).fetchone()
+                total = int(total_row["total"]) if total_row is not None else 0
 
-            if limit is None:
-                query = f"""
-                SELECT summary_id, summary_path, generated_at_utc, metric_set, pass_fail, seed_runs
-                FROM regression_summaries
-                {where_clause}
-                ORDER BY COALESCE(generated_at_utc, indexed_at_utc) DESC, summary_id DESC
-                LIMIT -1 OFFSET ?
-                """
-                rows = conn.execute(query, [*params, offset]).fetchall()
-            else:
-                query = f"""
-                SELECT summary_id, summary_path, generated_at_utc, metric_set, pass_fail, seed_runs
+            rows = conn.execute(
+                f"""
+                SELECT summary_id, summary_path, generated_at_utc, metric_set, pass_fail, seed_runs,
+                       COALESCE(generated_at_utc, indexed_at_utc) AS sort_at
                 FROM regression_summaries
-                {where_clause}
+                {page_where}
                 ORDER BY COALESCE(generated_at_utc, indexed_at_utc) DESC, summary_id DESC
                 LIMIT ? OFFSET ?
-                """
-                rows = conn.execute(query, [*params, limit, offset]).fetchall()
+                """,
+                [*page_params, -1 if limit is None else limit + 1, offset],
+            ).fetchall()
 
-        if rows:
+        has_more = limit is not None and len(rows) > limit
+        rows = rows if limit is None else rows[:limit]
+        if rows or after is not None:
             items = [
                 {
                     "summary_id": str(row["summary_id"]),
@@ -895,11 +1400,18 @@ class SQLiteRunRepository:
                 }
                 for row in rows
             ]
+            last = rows[-1] if rows else None
             return {
                 "count": len(items),
                 "total": total,
                 "limit": limit,
                 "offset": offset,
+                "cursor": cursor or None,
+                "next_cursor": (
+                    _encode_list_cursor((str(last["sort_at"] or ""), str(last["summary_id"])))
+                    if has_more and last is not None
+                    else None
+                ),
                 "items": items,
             }
 
@@ -926,15 +1438,11 @@ class SQLiteRunRepository:
         if pass_fail is not None:
             all_items = [item for item in all_items if bool(item.get("pass_fail")) is bool(pass_fail)]
 
-        total = len(all_items)
-        if limit is None:
-            items = all_items[offset:]
-        else:
-            items = all_items[offset : offset + limit]
-        return {
-            "count": len(items),
-            "total": total,
-            "limit": limit,
-            "offset": offset,
-            "items": items,
-        }
+        return _paginate_rows(
+            sorted(all_items, key=_regression_sort_key, reverse=True),
+            sort_key=_regression_sort_key,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            include_total=include_total,
+        )
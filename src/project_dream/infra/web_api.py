@@ -1,15 +1,25 @@
+import threading
+from collections.abc import Iterator
 from pathlib import Path
 
 from project_dream.app_service import evaluate_and_persist, regress_and_persist, simulate_and_persist
-from project_dream.kb_index import build_index, get_pack_item as kb_get_pack_item, retrieve_context, search
+from project_dream.kb_index import (
+    build_index,
+    corpus_manifest,
+    get_pack_item as kb_get_pack_item,
+    load_or_build_index,
+    retrieve_context,
+    search,
+)
 from project_dream.infra.store import FileRunRepository, RunRepository, SQLiteRunRepository
 from project_dream.models import SeedInput
-from project_dream.pack_service import load_packs
+from project_dream.pack_service import load_packs_cached, pack_cache_stats
+from project_dream.persona_service import voice_cache_stats
 
 
 def _normalize_vector_backend(backend: str) -> str:
     normalized = backend.strip().lower()
-    if normalized not in {"memory", "sqlite"}:
+    if normalized not in {"memory", "sqlite", "numpy"}:
         raise ValueError(f"Unknown vector backend: {backend}")
     return normalized
 
@@ -23,12 +33,17 @@ class ProjectDreamAPI:
         *,
         vector_backend: str = "memory",
         vector_db_path: Path | None = None,
+        kb_index_dir: Path | None = None,
     ):
         self.repository = repository
         self.packs_dir = packs_dir
         self.corpus_dir = corpus_dir
         self.vector_backend = _normalize_vector_backend(vector_backend)
         self.vector_db_path = vector_db_path
+        self.kb_index_dir = kb_index_dir
+        self._kb_index_lock = threading.Lock()
+        self._kb_index_key: tuple | None = None
+        self._kb_index: dict | None = None
 
     @classmethod
     def for_local_filesystem(
@@ -41,6 +56,7 @@ class ProjectDreamAPI:
         sqlite_db_path: Path | None = None,
         vector_backend: str = "memory",
         vector_db_path: Path | None = None,
+        kb_index_dir: Path | None = None,
     ) -> "ProjectDreamAPI":
         backend = repository_backend.strip().lower()
         if backend == "sqlite":
@@ -55,10 +71,16 @@ class ProjectDreamAPI:
             corpus_dir=corpus_dir,
             vector_backend=vector_backend,
             vector_db_path=vector_db_path,
+            kb_index_dir=kb_index_dir,
         )
 
     def health(self) -> dict:
-        return {"status": "ok", "service": "project-dream"}
+        return {
+            "status": "ok",
+            "service": "project-dream",
+            "pack_cache": pack_cache_stats(),
+            "voice_cache": voice_cache_stats(),
+        }
 
     def simulate(
         self,
@@ -67,6 +89,7 @@ class ProjectDreamAPI:
         orchestrator_backend: str = "manual",
         vector_backend: str | None = None,
         vector_db_path: Path | None = None,
+        generation_workers: int | None = None,
     ) -> dict:
         seed = SeedInput.model_validate(seed_payload)
         resolved_vector_backend = (
@@ -84,6 +107,8 @@ class ProjectDreamAPI:
             orchestrator_backend=orchestrator_backend,
             vector_backend=resolved_vector_backend,
             vector_db_path=resolved_vector_db_path,
+            kb_index_dir=self.kb_index_dir,
+            generation_workers=generation_workers,
         )
         return {"run_id": run_dir.name, "run_dir": str(run_dir)}
 
@@ -107,6 +132,8 @@ class ProjectDreamAPI:
         board_id: str | None = None,
         status: str | None = None,
         pack_fingerprint: str | None = None,
+        cursor: str | None = None,
+        include_total: bool = True,
     ) -> dict:
         return self.repository.list_runs(
             limit=limit,
@@ -115,6 +142,8 @@ class ProjectDreamAPI:
             board_id=board_id,
             status=status,
             pack_fingerprint=pack_fingerprint,
+            cursor=cursor,
+            include_total=include_total,
         )
 
     def get_report(self, run_id: str) -> dict:
@@ -126,6 +155,48 @@ class ProjectDreamAPI:
     def get_runlog(self, run_id: str) -> dict:
         return self.repository.load_runlog(run_id)
 
+    def iter_runlog(
+        self,
+        run_id: str,
+        *,
+        limit: int | None = None,
+        offset: int = 0,
+        cursor: int = 0,
+        row_types: set[str] | None = None,
+        round_from: int | None = None,
+        round_to: int | None = None,
+    ) -> Iterator[dict]:
+        return self.repository.iter_runlog(
+            run_id,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            row_types=row_types,
+            round_from=round_from,
+            round_to=round_to,
+        )
+
+    def get_runlog_page(
+        self,
+        run_id: str,
+        *,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: int = 0,
+        row_types: set[str] | None = None,
+        round_from: int | None = None,
+        round_to: int | None = None,
+    ) -> dict:
+        return self.repository.load_runlog_page(
+            run_id,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            row_types=row_types,
+            round_from=round_from,
+            round_to=round_to,
+        )
+
     def latest_regression_summary(self) -> dict:
         return self.repository.load_latest_regression_summary()
 
@@ -138,12 +209,16 @@ class ProjectDreamAPI:
         offset: int = 0,
         metric_set: str | None = None,
         pass_fail: bool | None = None,
+        cursor: str | None = None,
+        include_total: bool = True,
     ) -> dict:
         return self.repository.list_regression_summaries(
             limit=limit,
             offset=offset,
             metric_set=metric_set,
             pass_fail=pass_fail,
+            cursor=cursor,
+            include_total=include_total,
         )
 
     def regress(
@@ -160,6 +235,8 @@ class ProjectDreamAPI:
         orchestrator_backend: str = "manual",
         vector_backend: str | None = None,
         vector_db_path: Path | None = None,
+        workers: int = 1,
+        generation_workers: int | None = None,
     ) -> dict:
         resolved_vector_backend = (
             self.vector_backend
@@ -182,16 +259,35 @@ class ProjectDreamAPI:
             orchestrator_backend=orchestrator_backend,
             vector_backend=resolved_vector_backend,
             vector_db_path=resolved_vector_db_path,
+            kb_index_dir=self.kb_index_dir,
+            workers=workers,
+            generation_workers=generation_workers,
         )
 
     def _build_kb_index(self) -> dict:
-        packs = load_packs(self.packs_dir, enforce_phase1_minimums=True)
-        return build_index(
-            packs,
-            corpus_dir=self.corpus_dir,
-            vector_backend=self.vector_backend,
-            vector_db_path=self.vector_db_path,
-        )
+        packs = load_packs_cached(self.packs_dir, enforce_phase1_minimums=True)
+        key = (packs.pack_fingerprint, tuple(sorted(corpus_manifest(self.corpus_dir).items())))
+        with self._kb_index_lock:
+            if self._kb_index is not None and self._kb_index_key == key:
+                return self._kb_index
+            if self.kb_index_dir is None:
+                index = build_index(
+                    packs,
+                    corpus_dir=self.corpus_dir,
+                    vector_backend=self.vector_backend,
+                    vector_db_path=self.vector_db_path,
+                )
+            else:
+                index = load_or_build_index(
+                    packs,
+                    corpus_dir=self.corpus_dir,
+                    snapshot_dir=self.kb_index_dir,
+                    vector_backend=self.vector_backend,
+                    vector_db_path=self.vector_db_path,
+                )
+            self._kb_index_key = key
+            self._kb_index = index
+            return index
 
     def search_knowledge(
         self, *, query: str, filters: dict | None = None, top_k: int = 5
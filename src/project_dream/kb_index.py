@@ -1,42 +1,38 @@
 from __future__ import annotations
 
+import bisect
+import hashlib
+import importlib
 import json
 import math
-import re
+import os
 import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
-from project_dream.data_ingest import load_corpus_rows
+from project_dream.data_ingest import CORPUS_SOURCE_TYPES, iter_corpus_records
 from project_dream.pack_service import LoadedPacks
+from project_dream.text_features import char_ngrams as _char_ngrams
+from project_dream.text_features import char_ngrams_of_normalized as _char_ngrams_of_normalized
+from project_dream.text_features import normalize_dense_text as _normalize_dense_text
+from project_dream.text_features import term_freq as _term_freq
+from project_dream.text_features import tokenize as _tokenize
 
 
-def _tokenize(text: str) -> list[str]:
-    return re.findall(r"[0-9A-Za-z가-힣_]+", text.lower())
+_PHRASE_BONUS = 0.15
+_SUPPORTED_VECTOR_BACKENDS = {"memory", "sqlite", "numpy"}
+_NUMPY_FILTER_COLUMNS = ("kind", "board_id", "zone_id")
+_SQLITE_POSTING_CACHE_SIZE = 4096
+_SQLITE_IN_CHUNK = 500
+KB_INDEX_SNAPSHOT_SCHEMA_VERSION = "kb_index_snapshot.v2"
+_ANALYZED_FIELDS = ("_tokens", "_token_tf", "_doc_len", "_normalized_text", "_dense_vector")
 
 
-def _term_freq(tokens: list[str]) -> dict[str, int]:
-    counts: dict[str, int] = {}
-    for token in tokens:
-        counts[token] = counts.get(token, 0) + 1
-    return counts
-
-
-def _normalize_dense_text(text: str) -> str:
-    return "".join(_tokenize(text))
-
-
-def _char_ngrams(text: str, n: int = 2) -> dict[str, float]:
-    normalized = _normalize_dense_text(text)
-    if not normalized:
-        return {}
-    if len(normalized) <= n:
-        return {normalized: 1.0}
-    counts: dict[str, float] = {}
-    for idx in range(0, len(normalized) - n + 1):
-        gram = normalized[idx : idx + n]
-        counts[gram] = counts.get(gram, 0.0) + 1.0
-    return counts
+def _vector_norm(vector: dict[str, float]) -> float:
+    return math.sqrt(sum(value * value for value in vector.values()))
 
 
 def _cosine_similarity(a: dict[str, float], b: dict[str, float]) -> float:
@@ -109,13 +105,33 @@ def _bm25_score(
         tf = doc_tf.get(term, 0)
         if tf <= 0:
             continue
-        term_df = df.get(term, 0)
-        idf = math.log(1.0 + ((doc_count - term_df + 0.5) / (term_df + 0.5)))
-        denom = tf + (k1 * (1 - b + (b * (doc_len / max(avg_doc_len, 1e-9)))))
-        score += idf * ((tf * (k1 + 1.0)) / max(denom, 1e-9))
+        score += _bm25_term_score(
+            tf,
+            term_df=df.get(term, 0),
+            doc_len=doc_len,
+            doc_count=doc_count,
+            avg_doc_len=avg_doc_len,
+            k1=k1,
+            b=b,
+        )
     return float(score)
 
 
+def _bm25_term_score(
+    tf: int,
+    *,
+    term_df: int,
+    doc_len: int,
+    doc_count: int,
+    avg_doc_len: float,
+    k1: float = 1.2,
+    b: float = 0.75,
+) -> float:
+    idf = math.log(1.0 + ((doc_count - term_df + 0.5) / (term_df + 0.5)))
+    denom = tf + (k1 * (1 - b + (b * (doc_len / max(avg_doc_len, 1e-9)))))
+    return idf * ((tf * (k1 + 1.0)) / max(denom, 1e-9))
+
+
 def _score_components(
     query: str,
     row: dict,
@@ -124,10 +140,14 @@ def _score_components(
     doc_count: int,
     avg_doc_len: float,
     query_dense_vector: dict[str, float],
-    vector_backend: str = "memory",
-    sqlite_dense_cache: dict[str, dict[str, float]] | None = None,
+    dense: float | None = None,
+    query_tokens: list[str] | None = None,
+    normalized_query: str | None = None,
 ) -> tuple[float, float, float]:
-    query_tokens = _tokenize(query)
+    if query_tokens is None:
+        query_tokens = _tokenize(query)
+    if normalized_query is None:
+        normalized_query = _normalize_dense_text(query)
     sparse = _bm25_score(
         query_tokens,
         doc_tf=row.get("_token_tf", {}),
@@ -136,11 +156,9 @@ def _score_components(
         doc_count=doc_count,
         avg_doc_len=avg_doc_len,
     )
-    dense_vector = row.get("_dense_vector", {})
-    if vector_backend == "sqlite" and sqlite_dense_cache is not None:
-        dense_vector = sqlite_dense_cache.get(_vector_row_key(row), {})
-    dense = _cosine_similarity(query_dense_vector, dense_vector)
-    phrase_bonus = 0.15 if _normalize_dense_text(query) in str(row.get("_normalized_text", "")) else 0.0
+    if dense is None:
+        dense = _cosine_similarity(query_dense_vector, row.get("_dense_vector", {}))
+    phrase_bonus = _PHRASE_BONUS if normalized_query in str(row.get("_normalized_text", "")) else 0.0
     sparse_norm = 1.0 - math.exp(-max(0.0, sparse))
     hybrid = (0.65 * sparse_norm) + (0.35 * dense) + phrase_bonus
     return sparse, dense, hybrid
@@ -148,67 +166,226 @@ def _score_components(
 
 def _resolve_vector_backend(backend: str) -> str:
     name = str(backend).strip().lower()
-    if name not in {"memory", "sqlite"}:
+    if name not in _SUPPORTED_VECTOR_BACKENDS:
         raise ValueError(f"Unknown vector backend: {backend}")
     return name
 
 
+def _load_numpy() -> Any:
+    try:
+        return importlib.import_module("numpy")
+    except ImportError as exc:
+        raise RuntimeError(
+            "Vector backend 'numpy' requires the 'numpy' package. Install with `pip install numpy`."
+        ) from exc
+
+
 def _vector_row_key(row: dict) -> str:
     return f"{row.get('kind', '')}:{row.get('item_id', '')}"
 
 
-def _build_sqlite_dense_cache(passages: list[dict], db_path: Path) -> dict[str, dict[str, float]]:
-    db_path.parent.mkdir(parents=True, exist_ok=True)
-    with sqlite3.connect(db_path) as conn:
-        conn.execute(
+def _dense_content_hash(row: dict) -> str:
+    return hashlib.sha256(str(row.get("_normalized_text", "")).encode("utf-8")).hexdigest()
+
+
+def _dense_from_dot(dot: float, query_norm: float, doc_norm: float) -> float:
+    # Same value as _cosine_similarity: the dot product over shared grams divided by both norms.
+    if dot <= 0.0 or query_norm == 0.0 or doc_norm == 0.0:
+        return 0.0
+    return float(dot / (query_norm * doc_norm))
+
+
+class _SqliteDenseStore:
+    """Dense vectors kept on disk as gram postings; search accumulates dot products from them."""
+
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._postings: OrderedDict[str, tuple[tuple[str, float], ...]] = OrderedDict()
+
+    def _ensure_schema(self) -> None:
+        tables = {
+            str(row[0]) for row in self._conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+        }
+        if "dense_vectors" in tables:
+            # Earlier layout: one vector blob per passage, which search had to load and decode.
+            self._conn.execute("DROP TABLE dense_vectors")
+        self._conn.execute(
             """
-            CREATE TABLE IF NOT EXISTS dense_vectors (
-                item_key TEXT PRIMARY KEY,
-                vector_json TEXT NOT NULL
+            CREATE TABLE IF NOT EXISTS dense_items (
+                item_id INTEGER PRIMARY KEY,
+                item_key TEXT NOT NULL UNIQUE,
+                content_hash TEXT NOT NULL,
+                norm REAL NOT NULL
             )
             """
         )
-        conn.execute("DELETE FROM dense_vectors")
-        rows: list[tuple[str, str]] = []
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS dense_postings (
+                gram TEXT NOT NULL,
+                item_id INTEGER NOT NULL,
+                weight REAL NOT NULL,
+                PRIMARY KEY (gram, item_id)
+            ) WITHOUT ROWID
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_dense_postings_item ON dense_postings(item_id)")
+
+    def sync(self, passages: list[dict]) -> dict[str, int]:
+        pending: dict[str, tuple[str, dict]] = {}
         for row in passages:
-            dense_vector = row.get("_dense_vector", {})
-            if not isinstance(dense_vector, dict):
-                dense_vector = {}
-            rows.append((_vector_row_key(row), json.dumps(dense_vector, ensure_ascii=False)))
-        if rows:
-            conn.executemany(
-                "INSERT INTO dense_vectors (item_key, vector_json) VALUES (?, ?)",
-                rows,
-            )
-        conn.commit()
+            pending[_vector_row_key(row)] = (_dense_content_hash(row), row)
+        with self._lock:
+            self._ensure_schema()
+            stored = {
+                str(item_key): (int(item_id), str(content_hash))
+                for item_id, item_key, content_hash in self._conn.execute(
+                    "SELECT item_id, item_key, content_hash FROM dense_items"
+                )
+            }
+            changed = [
+                (item_key, content_hash, row)
+                for item_key, (content_hash, row) in pending.items()
+                if stored.get(item_key, (None, None))[1] != content_hash
+            ]
+            stale = [item_id for item_key, (item_id, _) in stored.items() if item_key not in pending]
+            removed = stale + [stored[item_key][0] for item_key, _, _ in changed if item_key in stored]
+            if removed:
+                params = [(item_id,) for item_id in removed]
+                self._conn.executemany("DELETE FROM dense_postings WHERE item_id = ?", params)
+                self._conn.executemany("DELETE FROM dense_items WHERE item_id = ?", params)
+            for item_key, content_hash, row in changed:
+                # Rows indexed for this backend carry no vector; it is derived from the normalized text.
+                vector = _char_ngrams_of_normalized(str(row.get("_normalized_text", "")), n=2)
+                cursor = self._conn.execute(
+                    "INSERT INTO dense_items (item_key, content_hash, norm) VALUES (?, ?, ?)",
+                    (item_key, content_hash, _vector_norm(vector)),
+                )
+                self._conn.executemany(
+                    "INSERT INTO dense_postings (gram, item_id, weight) VALUES (?, ?, ?)",
+                    [(gram, cursor.lastrowid, float(weight)) for gram, weight in vector.items()],
+                )
+            self._conn.commit()
+            self._postings.clear()
+        return {"upserted": len(changed), "deleted": len(stale), "unchanged": len(pending) - len(changed)}
 
-        loaded_rows = conn.execute(
-            "SELECT item_key, vector_json FROM dense_vectors"
-        ).fetchall()
+    def norms(self) -> dict[str, float]:
+        with self._lock:
+            return {
+                str(item_key): float(norm)
+                for item_key, norm in self._conn.execute("SELECT item_key, norm FROM dense_items")
+            }
 
-    dense_cache: dict[str, dict[str, float]] = {}
-    for item_key, vector_json in loaded_rows:
-        raw = json.loads(str(vector_json))
-        if not isinstance(raw, dict):
-            continue
-        vector: dict[str, float] = {}
-        for key, value in raw.items():
-            try:
-                vector[str(key)] = float(value)
-            except (TypeError, ValueError):
-                continue
-        dense_cache[str(item_key)] = vector
-    return dense_cache
+    def postings(self, grams: Iterable[str]) -> dict[str, tuple[tuple[str, float], ...]]:
+        found: dict[str, tuple[tuple[str, float], ...]] = {}
+        with self._lock:
+            missing: list[str] = []
+            for gram in dict.fromkeys(grams):
+                cached = self._postings.get(gram)
+                if cached is None:
+                    missing.append(gram)
+                else:
+                    self._postings.move_to_end(gram)
+                    found[gram] = cached
+            for start in range(0, len(missing), _SQLITE_IN_CHUNK):
+                chunk = missing[start : start + _SQLITE_IN_CHUNK]
+                placeholders = ",".join("?" for _ in chunk)
+                loaded: dict[str, list[tuple[str, float]]] = {gram: [] for gram in chunk}
+                for gram, item_key, weight in self._conn.execute(
+                    f"""
+                    SELECT p.gram, i.item_key, p.weight
+                    FROM dense_postings AS p JOIN dense_items AS i ON i.item_id = p.item_id
+                    WHERE p.gram IN ({placeholders})
+                    """,
+                    chunk,
+                ):
+                    loaded[str(gram)].append((str(item_key), float(weight)))
+                for gram, rows in loaded.items():
+                    found[gram] = self._postings[gram] = tuple(rows)
+                    if len(self._postings) > _SQLITE_POSTING_CACHE_SIZE:
+                        self._postings.popitem(last=False)
+        return found
 
+    def dot_products(self, query_dense_vector: dict[str, float]) -> dict[str, float]:
+        dots: dict[str, float] = {}
+        for gram, rows in self.postings(query_dense_vector).items():
+            query_weight = query_dense_vector[gram]
+            for item_key, weight in rows:
+                dots[item_key] = dots.get(item_key, 0.0) + (query_weight * weight)
+        return dots
 
-def build_index(
-    packs: LoadedPacks,
-    corpus_dir: Path | None = None,
-    *,
-    vector_backend: str = "memory",
-    vector_db_path: Path | None = None,
-) -> dict[str, Any]:
-    resolved_vector_backend = _resolve_vector_backend(vector_backend)
+
+def _build_inverted_index(passages: list[dict]) -> dict[str, Any]:
+    token_postings: dict[str, list[tuple[int, int]]] = {}
+    gram_postings: dict[str, list[tuple[int, float]]] = {}
+    dense_norms: list[float] = []
+    for doc_idx, row in enumerate(passages):
+        for token, tf in row.get("_token_tf", {}).items():
+            token_postings.setdefault(token, []).append((doc_idx, tf))
+        dense_vector = row.get("_dense_vector", {})
+        for gram, weight in dense_vector.items():
+            gram_postings.setdefault(gram, []).append((doc_idx, weight))
+        dense_norms.append(_vector_norm(dense_vector))
+    # Zero-score passages are returned in (kind, item_id) order when fewer than top_k passages match.
+    fill_order = sorted(
+        range(len(passages)),
+        key=lambda doc_idx: (passages[doc_idx]["kind"], passages[doc_idx]["item_id"]),
+    )
+    return {
+        "token_postings": token_postings,
+        "gram_postings": gram_postings,
+        "dense_norms": dense_norms,
+        "fill_order": fill_order,
+    }
+
+
+def _postings_to_csr(np: Any, postings: dict[str, list[tuple[int, float]]]) -> dict[str, Any]:
+    vocab: dict[str, int] = {}
+    indptr = [0]
+    docs: list[int] = []
+    weights: list[float] = []
+    for term, rows in postings.items():
+        vocab[term] = len(vocab)
+        for doc_idx, weight in rows:
+            docs.append(doc_idx)
+            weights.append(weight)
+        indptr.append(len(docs))
+    return {
+        "vocab": vocab,
+        "indptr": np.asarray(indptr, dtype=np.int64),
+        "docs": np.asarray(docs, dtype=np.int64),
+        "weights": np.asarray(weights, dtype=np.float64),
+    }
+
+
+def _build_numpy_matrix(passages: list[dict], inverted: dict[str, Any]) -> dict[str, Any]:
+    np = _load_numpy()
+    # Term-major CSR (vocabulary rows, passage columns): a query only touches the rows of its own terms.
+    order_rank = np.empty(len(passages), dtype=np.int64)
+    order_rank[np.asarray(inverted["fill_order"], dtype=np.int64)] = np.arange(len(passages), dtype=np.int64)
+    filter_columns: dict[str, dict[Any, Any]] = {}
+    for key in _NUMPY_FILTER_COLUMNS:
+        value_rows: dict[Any, list[int]] = {}
+        for doc_idx, row in enumerate(passages):
+            value = row.get(key)
+            for item in (value if isinstance(value, list) else [value]):
+                value_rows.setdefault(item, []).append(doc_idx)
+        filter_columns[key] = {
+            value: np.asarray(rows, dtype=np.int64) for value, rows in value_rows.items()
+        }
+    return {
+        "grams": _postings_to_csr(np, inverted["gram_postings"]),
+        "tokens": _postings_to_csr(np, inverted["token_postings"]),
+        "dense_norms": np.asarray(inverted["dense_norms"], dtype=np.float64),
+        "doc_len": np.asarray([int(row.get("_doc_len", 0)) for row in passages], dtype=np.float64),
+        "order_rank": order_rank,
+        "filter_columns": filter_columns,
+    }
+
+
+def _pack_passages(packs: LoadedPacks) -> list[dict]:
     passages: list[dict] = []
     communities = packs.communities
 
@@ -323,86 +500,322 @@ def build_index(
                 ),
             }
         )
+    return passages
 
-    if corpus_dir is not None:
-        corpus_rows = load_corpus_rows(corpus_dir)
-        for idx, row in enumerate(corpus_rows):
-            text = str(row.get("text", "")).strip()
-            if not text:
-                continue
-            item_id = str(row.get("doc_id", "")).strip() or f"corpus-{idx+1:06d}"
-            passages.append(
-                {
-                    "kind": "corpus",
-                    "item_id": item_id,
-                    "board_id": row.get("board_id"),
-                    "zone_id": row.get("zone_id"),
-                    "source_type": row.get("source_type"),
-                    "doc_type": row.get("doc_type"),
-                    "text": text,
-                }
-            )
 
+def _corpus_passages(corpus_rows: Iterable[dict], *, start_idx: int = 0) -> list[dict]:
+    passages: list[dict] = []
+    for idx, row in enumerate(corpus_rows, start=start_idx):
+        text = str(row.get("text", "")).strip()
+        if not text:
+            continue
+        passage = {
+            "kind": "corpus",
+            "item_id": str(row.get("doc_id", "")).strip(),
+            "board_id": row.get("board_id"),
+            "zone_id": row.get("zone_id"),
+            "source_type": row.get("source_type"),
+            "doc_type": row.get("doc_type"),
+            "text": text,
+        }
+        if not passage["item_id"]:
+            passage["item_id"] = f"corpus-{idx+1:06d}"
+            passage["_corpus_row_idx"] = idx
+        for key in _ANALYZED_FIELDS:
+            if key in row:
+                passage[key] = row[key]
+        passages.append(passage)
+    return passages
+
+
+def _analyze_passages(passages: list[dict], *, dense_vectors: bool = True) -> None:
+    # Corpus rows backed by ingest artifacts arrive already analyzed.
+    for row in passages:
+        if "_token_tf" not in row:
+            _analyze_passage(row)
+        if not dense_vectors:
+            # The sqlite backend keeps dense vectors only in its store, never in the passages.
+            row.pop("_dense_vector", None)
+
+
+def _analyze_passage(row: dict) -> None:
+    text = str(row.get("text", ""))
+    tokens = _tokenize(text)
+    row["_tokens"] = tokens
+    row["_token_tf"] = _term_freq(tokens)
+    row["_doc_len"] = len(tokens)
+    row["_normalized_text"] = _normalize_dense_text(text)
+    row["_dense_vector"] = _char_ngrams(text, n=2)
+
+
+def _build_stats(passages: list[dict]) -> dict[str, Any]:
     df: dict[str, int] = {}
     total_doc_len = 0
     for row in passages:
-        text = str(row.get("text", ""))
-        tokens = _tokenize(text)
-        token_tf = _term_freq(tokens)
-        unique_tokens = set(tokens)
-        for token in unique_tokens:
+        for token in row.get("_token_tf", {}):
             df[token] = df.get(token, 0) + 1
-        doc_len = len(tokens)
-        total_doc_len += doc_len
-        row["_tokens"] = tokens
-        row["_token_tf"] = token_tf
-        row["_doc_len"] = doc_len
-        row["_normalized_text"] = _normalize_dense_text(text)
-        row["_dense_vector"] = _char_ngrams(text, n=2)
-
+        total_doc_len += int(row.get("_doc_len", 0))
     doc_count = len(passages)
     avg_doc_len = (total_doc_len / doc_count) if doc_count > 0 else 0.0
-    sqlite_dense_cache: dict[str, dict[str, float]] | None = None
+    return {
+        "df": df,
+        "doc_count": doc_count,
+        "avg_doc_len": avg_doc_len,
+    }
+
+
+def _assemble_index(
+    packs: LoadedPacks,
+    passages: list[dict],
+    *,
+    stats: dict[str, Any],
+    inverted: dict[str, Any],
+    vector_backend: str,
+    vector_db_path: Path | None,
+) -> dict[str, Any]:
+    sqlite_dense_store: _SqliteDenseStore | None = None
+    vector_sync: dict[str, int] | None = None
     resolved_vector_db_path: str | None = None
-    if resolved_vector_backend == "sqlite":
+    doc_ids_by_key: dict[str, list[int]] | None = None
+    if vector_backend == "sqlite":
         db_path = vector_db_path if vector_db_path is not None else Path(".cache/kb-vectors.sqlite3")
-        sqlite_dense_cache = _build_sqlite_dense_cache(passages, db_path)
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        sqlite_dense_store = _SqliteDenseStore(db_path)
+        vector_sync = sqlite_dense_store.sync(passages)
+        # Passages and the inverted index hold no dense vectors here; only the norms are kept in memory.
+        norms = sqlite_dense_store.norms()
+        inverted = {**inverted, "dense_norms": [norms.get(_vector_row_key(row), 0.0) for row in passages]}
+        doc_ids_by_key = {}
+        for doc_idx, row in enumerate(passages):
+            doc_ids_by_key.setdefault(_vector_row_key(row), []).append(doc_idx)
         resolved_vector_db_path = str(db_path)
+    numpy_matrix = _build_numpy_matrix(passages, inverted) if vector_backend == "numpy" else None
     return {
         "passages": passages,
         "packs": packs,
-        "vector_backend": resolved_vector_backend,
+        "vector_backend": vector_backend,
         "vector_db_path": resolved_vector_db_path,
-        "_sqlite_dense_cache": sqlite_dense_cache,
-        "stats": {
-            "df": df,
-            "doc_count": doc_count,
-            "avg_doc_len": avg_doc_len,
+        "vector_sync": vector_sync,
+        "_sqlite_dense_store": sqlite_dense_store,
+        "_doc_ids_by_key": doc_ids_by_key,
+        "_numpy_matrix": numpy_matrix,
+        "_inverted": inverted,
+        "stats": stats,
+    }
+
+
+def build_index(
+    packs: LoadedPacks,
+    corpus_dir: Path | None = None,
+    *,
+    vector_backend: str = "memory",
+    vector_db_path: Path | None = None,
+) -> dict[str, Any]:
+    resolved_vector_backend = _resolve_vector_backend(vector_backend)
+    passages = _pack_passages(packs)
+    if corpus_dir is not None:
+        passages.extend(_corpus_passages(iter_corpus_records(corpus_dir, with_features=True)))
+    _analyze_passages(passages, dense_vectors=resolved_vector_backend != "sqlite")
+    return _assemble_index(
+        packs,
+        passages,
+        stats=_build_stats(passages),
+        inverted=_build_inverted_index(passages),
+        vector_backend=resolved_vector_backend,
+        vector_db_path=vector_db_path,
+    )
+
+
+def corpus_manifest(corpus_dir: Path | None) -> dict[str, list[int]]:
+    if corpus_dir is None or not corpus_dir.exists():
+        return {}
+    manifest: dict[str, list[int]] = {}
+    for source_type in CORPUS_SOURCE_TYPES:
+        path = corpus_dir / f"{source_type}.jsonl"
+        if not path.exists():
+            continue
+        stat = path.stat()
+        manifest[source_type] = [int(stat.st_size), int(stat.st_mtime_ns)]
+    return manifest
+
+
+def _snapshot_key(pack_fingerprint: str, manifest: dict[str, list[int]], *, dense_vectors: bool = True) -> str:
+    payload = json.dumps(
+        {
+            "schema_version": KB_INDEX_SNAPSHOT_SCHEMA_VERSION,
+            "pack_fingerprint": pack_fingerprint,
+            "corpus_manifest": manifest,
+            "dense_vectors": dense_vectors,
         },
+        ensure_ascii=False,
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _read_snapshot(path: Path) -> dict | None:
+    # Snapshots are plain JSON: a file planted in the index directory can only ever be data.
+    if not path.exists():
+        return None
+    try:
+        with path.open("r", encoding="utf-8") as fp:
+            payload = json.load(fp)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(payload, dict):
+        return None
+    if payload.get("schema_version") != KB_INDEX_SNAPSHOT_SCHEMA_VERSION:
+        return None
+    return payload
+
+
+def _write_snapshot(path: Path, payload: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with tmp_path.open("w", encoding="utf-8") as fp:
+        json.dump(payload, fp, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+
+def _load_corpus_segments(
+    corpus_dir: Path,
+    manifest: dict[str, list[int]],
+    snapshot_dir: Path,
+    *,
+    dense_vectors: bool = True,
+) -> tuple[list[dict], list[str]]:
+    passages: list[dict] = []
+    reindexed: list[str] = []
+    row_offset = 0
+    for source_type in CORPUS_SOURCE_TYPES:
+        signature = manifest.get(source_type)
+        if signature is None:
+            continue
+        segment_path = snapshot_dir / "segments" / f"corpus-{source_type}.json"
+        segment = _read_snapshot(segment_path)
+        if segment is None or segment.get("signature") != signature:
+            rows = list(iter_corpus_records(corpus_dir, source_types=(source_type,), with_features=True))
+            segment_passages = _corpus_passages(rows)
+            _analyze_passages(segment_passages)
+            segment = {
+                "schema_version": KB_INDEX_SNAPSHOT_SCHEMA_VERSION,
+                "signature": signature,
+                "row_count": len(rows),
+                "passages": segment_passages,
+            }
+            _write_snapshot(segment_path, segment)
+            reindexed.append(source_type)
+        for row in segment["passages"]:
+            # Fallback ids are numbered across all corpus files, so they follow earlier segment sizes.
+            if "_corpus_row_idx" in row:
+                row["item_id"] = f"corpus-{int(row['_corpus_row_idx']) + row_offset + 1:06d}"
+            if not dense_vectors:
+                row.pop("_dense_vector", None)
+            passages.append(row)
+        row_offset += int(segment.get("row_count", 0))
+    return passages, reindexed
+
+
+def load_or_build_index(
+    packs: LoadedPacks,
+    corpus_dir: Path | None = None,
+    *,
+    snapshot_dir: Path,
+    vector_backend: str = "memory",
+    vector_db_path: Path | None = None,
+) -> dict[str, Any]:
+    resolved_vector_backend = _resolve_vector_backend(vector_backend)
+    # Segments are shared, but the sqlite backend gets its own snapshot without dense vectors or gram postings.
+    dense_vectors = resolved_vector_backend != "sqlite"
+    manifest = corpus_manifest(corpus_dir)
+    snapshot_key = _snapshot_key(packs.pack_fingerprint, manifest, dense_vectors=dense_vectors)
+    snapshot_path = snapshot_dir / ("index.json" if dense_vectors else "index-sqlite.json")
+
+    payload = _read_snapshot(snapshot_path)
+    if payload is not None and payload.get("snapshot_key") == snapshot_key:
+        passages = payload["passages"]
+        stats = payload["stats"]
+        inverted = payload["inverted"]
+        reindexed: list[str] = []
+        source = "snapshot"
+    else:
+        passages = _pack_passages(packs)
+        _analyze_passages(passages, dense_vectors=dense_vectors)
+        reindexed = []
+        if corpus_dir is not None and manifest:
+            corpus_rows, reindexed = _load_corpus_segments(
+                corpus_dir, manifest, snapshot_dir, dense_vectors=dense_vectors
+            )
+            passages.extend(corpus_rows)
+        stats = _build_stats(passages)
+        inverted = _build_inverted_index(passages)
+        _write_snapshot(
+            snapshot_path,
+            {
+                "schema_version": KB_INDEX_SNAPSHOT_SCHEMA_VERSION,
+                "snapshot_key": snapshot_key,
+                "pack_fingerprint": packs.pack_fingerprint,
+                "corpus_manifest": manifest,
+                "passages": passages,
+                "stats": stats,
+                "inverted": inverted,
+            },
+        )
+        source = "rebuilt"
+
+    index = _assemble_index(
+        packs,
+        passages,
+        stats=stats,
+        inverted=inverted,
+        vector_backend=resolved_vector_backend,
+        vector_db_path=vector_db_path,
+    )
+    index["snapshot"] = {
+        "key": snapshot_key,
+        "path": str(snapshot_path),
+        "source": source,
+        "reindexed_sources": reindexed,
     }
+    return index
 
 
-def search(
+def _result_row(row: dict, *, sparse: float, dense: float, hybrid: float) -> dict:
+    copied = {key: value for key, value in row.items() if not str(key).startswith("_")}
+    copied["score"] = float(round(hybrid, 6))
+    copied["score_hybrid"] = float(round(hybrid, 6))
+    copied["score_sparse"] = float(round(sparse, 6))
+    copied["score_dense"] = float(round(dense, 6))
+    return copied
+
+
+def _search_scan(
     index: dict[str, Any],
     query: str,
-    filters: dict[str, Any] | None = None,
-    top_k: int = 5,
+    filters: dict[str, Any],
+    top_k: int,
 ) -> list[dict]:
-    if top_k <= 0:
-        return []
-    filters = filters or {}
     passages = index.get("passages", [])
     stats = index.get("stats", {})
     df: dict[str, int] = stats.get("df", {})
     doc_count: int = int(stats.get("doc_count", len(passages)))
     avg_doc_len: float = float(stats.get("avg_doc_len", 0.0))
-    vector_backend = _resolve_vector_backend(str(index.get("vector_backend", "memory")))
-    sqlite_dense_cache = index.get("_sqlite_dense_cache")
+    sqlite_dense_store = index.get("_sqlite_dense_store")
     query_dense_vector = _char_ngrams(query, n=2)
-    matched = [row for row in passages if _matches_filters(row, filters)]
+    store_dots: dict[str, float] | None = None
+    if isinstance(sqlite_dense_store, _SqliteDenseStore):
+        store_dots = sqlite_dense_store.dot_products(query_dense_vector)
+        query_norm = _vector_norm(query_dense_vector)
+        dense_norms: list[float] = index["_inverted"]["dense_norms"]
 
     scored: list[tuple[float, float, float, dict]] = []
-    for row in matched:
+    for doc_idx, row in enumerate(passages):
+        if not _matches_filters(row, filters):
+            continue
+        dense = None
+        if store_dots is not None:
+            dense = _dense_from_dot(store_dots.get(_vector_row_key(row), 0.0), query_norm, dense_norms[doc_idx])
         sparse, dense, hybrid = _score_components(
             query,
             row,
@@ -410,23 +823,339 @@ def search(
             doc_count=doc_count,
             avg_doc_len=avg_doc_len,
             query_dense_vector=query_dense_vector,
-            vector_backend=vector_backend,
-            sqlite_dense_cache=sqlite_dense_cache if isinstance(sqlite_dense_cache, dict) else None,
+            dense=dense,
         )
         scored.append((hybrid, sparse, dense, row))
     scored.sort(key=lambda item: (-item[0], -item[1], -item[2], item[3]["kind"], item[3]["item_id"]))
 
-    results: list[dict] = []
-    for hybrid, sparse, dense, row in scored[:top_k]:
-        copied = {key: value for key, value in row.items() if not str(key).startswith("_")}
-        copied["score"] = float(round(hybrid, 6))
-        copied["score_hybrid"] = float(round(hybrid, 6))
-        copied["score_sparse"] = float(round(sparse, 6))
-        copied["score_dense"] = float(round(dense, 6))
-        results.append(copied)
+    return [
+        _result_row(row, sparse=sparse, dense=dense, hybrid=hybrid)
+        for hybrid, sparse, dense, row in scored[:top_k]
+    ]
+
+
+def _filters_key(filters: dict[str, Any]) -> str:
+    return json.dumps(filters, ensure_ascii=False, sort_keys=True, default=sorted)
+
+
+def _search_inverted_many(
+    index: dict[str, Any],
+    inverted: dict[str, Any],
+    specs: list[tuple[str, dict[str, Any], int, str]],
+) -> list[list[dict]]:
+    passages = index.get("passages", [])
+    stats = index.get("stats", {})
+    df: dict[str, int] = stats.get("df", {})
+    doc_count: int = int(stats.get("doc_count", len(passages)))
+    avg_doc_len: float = float(stats.get("avg_doc_len", 0.0))
+    sqlite_dense_store = index.get("_sqlite_dense_store")
+    if not isinstance(sqlite_dense_store, _SqliteDenseStore):
+        sqlite_dense_store = None
+    token_postings: dict[str, list[tuple[int, int]]] = inverted["token_postings"]
+    gram_postings: dict[str, list[tuple[int, float]]] = inverted["gram_postings"]
+    dense_norms: list[float] = inverted["dense_norms"]
+
+    # Queries sharing a filter set share one memoized filter pass.
+    filter_caches: dict[str, dict[int, bool]] = {}
+    queries: list[dict[str, Any]] = []
+    for query, filters, top_k, normalized_query in specs:
+        query_dense_vector = _char_ngrams(query, n=2)
+        queries.append(
+            {
+                "query": query,
+                "filters": filters,
+                "top_k": top_k,
+                "normalized_query": normalized_query,
+                "tokens": _tokenize(query),
+                "dense_vector": query_dense_vector,
+                "norm": _vector_norm(query_dense_vector),
+                "filter_cache": filter_caches.setdefault(_filters_key(filters), {}),
+                "sparse_acc": {},
+                "dot_acc": {},
+            }
+        )
+
+    def _allowed(spec: dict[str, Any], doc_idx: int) -> bool:
+        cache = spec["filter_cache"]
+        allowed = cache.get(doc_idx)
+        if allowed is None:
+            allowed = _matches_filters(passages[doc_idx], spec["filters"])
+            cache[doc_idx] = allowed
+        return allowed
+
+    # One sweep over the postings of every distinct term; BM25 term scores are computed once per posting.
+    term_queries: dict[str, list[dict[str, Any]]] = {}
+    gram_queries: dict[str, list[tuple[dict[str, Any], float]]] = {}
+    for spec in queries:
+        if doc_count > 0:
+            for term in set(spec["tokens"]):
+                term_queries.setdefault(term, []).append(spec)
+        for gram, query_weight in spec["dense_vector"].items():
+            gram_queries.setdefault(gram, []).append((spec, query_weight))
+    if sqlite_dense_store is not None:
+        # Gram postings of the sqlite backend live in its store; only the queried grams are read.
+        doc_ids_by_key: dict[str, list[int]] = index["_doc_ids_by_key"]
+        gram_postings = {
+            gram: [(doc_idx, weight) for item_key, weight in rows for doc_idx in doc_ids_by_key.get(item_key, ())]
+            for gram, rows in sqlite_dense_store.postings(gram_queries).items()
+        }
+
+    for term, term_specs in term_queries.items():
+        postings = token_postings.get(term)
+        if not postings:
+            continue
+        term_df = df.get(term, 0)
+        for doc_idx, tf in postings:
+            contribution: float | None = None
+            for spec in term_specs:
+                if not _allowed(spec, doc_idx):
+                    continue
+                if contribution is None:
+                    contribution = _bm25_term_score(
+                        tf,
+                        term_df=term_df,
+                        doc_len=int(passages[doc_idx].get("_doc_len", 0)),
+                        doc_count=doc_count,
+                        avg_doc_len=avg_doc_len,
+                    )
+                sparse_acc = spec["sparse_acc"]
+                sparse_acc[doc_idx] = sparse_acc.get(doc_idx, 0.0) + contribution
+
+    for gram, gram_specs in gram_queries.items():
+        for doc_idx, weight in gram_postings.get(gram, ()):
+            for spec, query_weight in gram_specs:
+                if not _allowed(spec, doc_idx):
+                    continue
+                dot_acc = spec["dot_acc"]
+                dot_acc[doc_idx] = dot_acc.get(doc_idx, 0.0) + (query_weight * weight)
+
+    results: list[list[dict]] = []
+    for spec in queries:
+        sparse_acc = spec["sparse_acc"]
+        dot_acc = spec["dot_acc"]
+        query_norm = spec["norm"]
+        top_k = spec["top_k"]
+        # Upper bound per candidate: exact sparse part, accumulated dense part and the phrase bonus.
+        # Candidates are rescored exactly in bound order until no remaining bound can enter the top-k.
+        bounds: list[tuple[float, int]] = []
+        for doc_idx in set(sparse_acc).union(dot_acc):
+            sparse_norm = 1.0 - math.exp(-max(0.0, sparse_acc.get(doc_idx, 0.0)))
+            dense_bound = 0.0
+            if doc_idx in dot_acc and query_norm > 0.0 and dense_norms[doc_idx] > 0.0:
+                dense_bound = min(1.0, dot_acc[doc_idx] / (query_norm * dense_norms[doc_idx]))
+            bound = (0.65 * sparse_norm) + (0.35 * dense_bound) + _PHRASE_BONUS + 1e-9
+            bounds.append((bound, doc_idx))
+        bounds.sort(key=lambda item: (-item[0], item[1]))
+
+        top: list[tuple[tuple, float, float, float, int]] = []
+        for bound, doc_idx in bounds:
+            if len(top) >= top_k and bound < -top[-1][0][0]:
+                break
+            row = passages[doc_idx]
+            dense = None
+            if sqlite_dense_store is not None:
+                # The accumulated dot product is exact, so the store never has to hand back whole vectors.
+                dense = _dense_from_dot(dot_acc.get(doc_idx, 0.0), query_norm, dense_norms[doc_idx])
+            sparse, dense, hybrid = _score_components(
+                spec["query"],
+                row,
+                df=df,
+                doc_count=doc_count,
+                avg_doc_len=avg_doc_len,
+                query_dense_vector=spec["dense_vector"],
+                dense=dense,
+                query_tokens=spec["tokens"],
+                normalized_query=spec["normalized_query"],
+            )
+            rank_key = (-hybrid, -sparse, -dense, row["kind"], row["item_id"], doc_idx)
+            if len(top) >= top_k and rank_key >= top[-1][0]:
+                continue
+            bisect.insort(top, (rank_key, sparse, dense, hybrid, doc_idx))
+            del top[top_k:]
+
+        rows = [
+            _result_row(passages[doc_idx], sparse=sparse, dense=dense, hybrid=hybrid)
+            for _, sparse, dense, hybrid, doc_idx in top
+        ]
+        if len(rows) < top_k:
+            scored_docs = set(sparse_acc).union(dot_acc)
+            for doc_idx in inverted["fill_order"]:
+                if len(rows) >= top_k:
+                    break
+                if doc_idx in scored_docs or not _allowed(spec, doc_idx):
+                    continue
+                rows.append(_result_row(passages[doc_idx], sparse=0.0, dense=0.0, hybrid=0.0))
+        results.append(rows)
+    return results
+
+
+def _numpy_filter_mask(np: Any, matrix: dict[str, Any], passages: list[dict], filters: dict[str, Any]) -> Any:
+    mask = np.ones(len(passages), dtype=bool)
+    remaining: dict[str, Any] = {}
+    for key, expected in filters.items():
+        if expected is None:
+            continue
+        column = matrix["filter_columns"].get(key)
+        if column is None:
+            remaining[key] = expected
+            continue
+        values = list(expected) if isinstance(expected, (list, tuple, set)) else [expected]
+        key_mask = np.zeros(len(passages), dtype=bool)
+        for value in values:
+            rows = column.get(value)
+            if rows is not None:
+                key_mask[rows] = True
+        mask &= key_mask
+    if remaining:
+        for doc_idx in np.flatnonzero(mask).tolist():
+            if not _matches_filters(passages[doc_idx], remaining):
+                mask[doc_idx] = False
+    return mask
+
+
+def _search_numpy(
+    index: dict[str, Any],
+    matrix: dict[str, Any],
+    query: str,
+    filters: dict[str, Any],
+    top_k: int,
+    *,
+    normalized_query: str,
+    mask: Any = None,
+) -> list[dict]:
+    np = _load_numpy()
+    passages = index.get("passages", [])
+    stats = index.get("stats", {})
+    df: dict[str, int] = stats.get("df", {})
+    doc_count: int = int(stats.get("doc_count", len(passages)))
+    avg_doc_len: float = float(stats.get("avg_doc_len", 0.0))
+    query_tokens = _tokenize(query)
+    query_dense_vector = _char_ngrams(query, n=2)
+    query_norm = _vector_norm(query_dense_vector)
+    if mask is None:
+        mask = _numpy_filter_mask(np, matrix, passages, filters)
+
+    k1 = 1.2
+    b = 0.75
+    tokens = matrix["tokens"]
+    sparse = np.zeros(len(passages), dtype=np.float64)
+    if doc_count > 0:
+        for term in set(query_tokens):
+            row_idx = tokens["vocab"].get(term)
+            if row_idx is None:
+                continue
+            start, end = int(tokens["indptr"][row_idx]), int(tokens["indptr"][row_idx + 1])
+            docs = tokens["docs"][start:end]
+            tf = tokens["weights"][start:end]
+            term_df = df.get(term, 0)
+            idf = math.log(1.0 + ((doc_count - term_df + 0.5) / (term_df + 0.5)))
+            denom = tf + (k1 * (1 - b + (b * (matrix["doc_len"][docs] / max(avg_doc_len, 1e-9)))))
+            sparse[docs] += idf * ((tf * (k1 + 1.0)) / np.maximum(denom, 1e-9))
+
+    grams = matrix["grams"]
+    dot = np.zeros(len(passages), dtype=np.float64)
+    for gram, query_weight in query_dense_vector.items():
+        row_idx = grams["vocab"].get(gram)
+        if row_idx is None:
+            continue
+        start, end = int(grams["indptr"][row_idx]), int(grams["indptr"][row_idx + 1])
+        dot[grams["docs"][start:end]] += query_weight * grams["weights"][start:end]
+    dense = np.zeros(len(passages), dtype=np.float64)
+    if query_norm > 0.0:
+        norms = matrix["dense_norms"]
+        nonzero = (dot > 0.0) & (norms > 0.0)
+        dense[nonzero] = dot[nonzero] / (query_norm * norms[nonzero])
+
+    hybrid = (0.65 * (1.0 - np.exp(-np.maximum(sparse, 0.0)))) + (0.35 * dense)
+    # Every bigram of a phrase match is in the query, so only passages with a dense hit can earn the bonus.
+    for doc_idx in np.flatnonzero(mask & (dot > 0.0)).tolist():
+        if normalized_query in str(passages[doc_idx].get("_normalized_text", "")):
+            hybrid[doc_idx] += _PHRASE_BONUS
+
+    positive = np.flatnonzero(mask & (hybrid > 0.0))
+    if len(positive) > top_k:
+        scores = hybrid[positive]
+        kth = np.partition(scores, len(scores) - top_k)[len(scores) - top_k]
+        # The exact rescoring below may differ from the vectorised scores in the last ulp.
+        positive = positive[scores >= kth - 1e-9]
+
+    scored: list[tuple[tuple, float, float, float, int]] = []
+    for doc_idx in positive.tolist():
+        row = passages[doc_idx]
+        row_sparse, row_dense, row_hybrid = _score_components(
+            query,
+            row,
+            df=df,
+            doc_count=doc_count,
+            avg_doc_len=avg_doc_len,
+            query_dense_vector=query_dense_vector,
+            query_tokens=query_tokens,
+            normalized_query=normalized_query,
+        )
+        rank_key = (-row_hybrid, -row_sparse, -row_dense, row["kind"], row["item_id"], doc_idx)
+        scored.append((rank_key, row_sparse, row_dense, row_hybrid, doc_idx))
+    scored.sort()
+
+    results = [
+        _result_row(passages[doc_idx], sparse=row_sparse, dense=row_dense, hybrid=row_hybrid)
+        for _, row_sparse, row_dense, row_hybrid, doc_idx in scored[:top_k]
+    ]
+    if len(results) < top_k:
+        zero = np.flatnonzero(mask & (hybrid <= 0.0))
+        zero = zero[np.argsort(matrix["order_rank"][zero], kind="stable")][: top_k - len(results)]
+        for doc_idx in zero.tolist():
+            results.append(_result_row(passages[doc_idx], sparse=0.0, dense=0.0, hybrid=0.0))
+    return results
+
+
+def search_many(index: dict[str, Any], specs: list[dict[str, Any]]) -> list[list[dict]]:
+    passages = index.get("passages", [])
+    inverted = index.get("_inverted")
+    numpy_matrix = index.get("_numpy_matrix")
+    results: list[list[dict]] = [[] for _ in specs]
+    numpy_masks: dict[str, Any] = {}
+    inverted_specs: list[tuple[int, tuple[str, dict[str, Any], int, str]]] = []
+    for position, spec in enumerate(specs):
+        query = str(spec.get("query", ""))
+        filters = spec.get("filters") or {}
+        top_k = int(spec.get("top_k", 5))
+        if top_k <= 0:
+            continue
+        normalized_query = _normalize_dense_text(query)
+        # Queries shorter than one bigram can earn the phrase bonus without sharing any posting.
+        if not isinstance(inverted, dict) or len(normalized_query) < 2:
+            results[position] = _search_scan(index, query, filters, top_k)
+        elif isinstance(numpy_matrix, dict):
+            filters_key = _filters_key(filters)
+            if filters_key not in numpy_masks:
+                numpy_masks[filters_key] = _numpy_filter_mask(_load_numpy(), numpy_matrix, passages, filters)
+            results[position] = _search_numpy(
+                index,
+                numpy_matrix,
+                query,
+                filters,
+                top_k,
+                normalized_query=normalized_query,
+                mask=numpy_masks[filters_key],
+            )
+        else:
+            inverted_specs.append((position, (query, filters, top_k, normalized_query)))
+    if inverted_specs:
+        batched = _search_inverted_many(index, inverted, [spec for _, spec in inverted_specs])
+        for (position, _), rows in zip(inverted_specs, batched):
+            results[position] = rows
     return results
 
 
+def search(
+    index: dict[str, Any],
+    query: str,
+    filters: dict[str, Any] | None = None,
+    top_k: int = 5,
+) -> list[dict]:
+    return search_many(index, [{"query": query, "filters": filters, "top_k": top_k}])[0]
+
+
 def get_pack_item(index: dict[str, Any], pack: str, item_id: str) -> dict | None:
     packs: LoadedPacks = index["packs"]
     registry = {
@@ -457,53 +1186,51 @@ def _merge_unique_rows(rows: list[dict]) -> list[dict]:
     return merged
 
 
-def retrieve_context(
-    index: dict[str, Any],
-    *,
-    task: str,
-    seed: str,
-    board_id: str,
-    zone_id: str,
-    persona_ids: list[str] | None,
-    top_k: int = 3,
-) -> dict[str, Any]:
-    persona_ids = persona_ids or []
+def _context_specs(request: dict[str, Any]) -> list[dict[str, Any]]:
+    task = request["task"]
+    seed = request["seed"]
+    top_k = int(request.get("top_k", 3))
+    specs = [
+        {
+            "query": f"{task} {seed} 증거 로그 출처 근거",
+            "filters": {"kind": ["board", "community", "persona", "corpus"], "board_id": request["board_id"]},
+            "top_k": top_k,
+        },
+        {
+            "query": f"{task} 규정 제재 신고 룰",
+            "filters": {"kind": "rule"},
+            "top_k": top_k,
+        },
+        {
+            "query": f"{task} 조직 세력 운영 감찰",
+            "filters": {"kind": ["organization", "character"]},
+            "top_k": top_k,
+        },
+        {
+            "query": f"{task} 페르소나 계층 관계",
+            "filters": {"kind": "persona", "zone_id": request["zone_id"]},
+            "top_k": top_k,
+        },
+    ]
+    for persona_id in request.get("persona_ids") or []:
+        specs.append(
+            {
+                "query": persona_id,
+                "filters": {"kind": "persona", "item_id": persona_id},
+                "top_k": 1,
+            }
+        )
+    return specs
 
-    evidence = search(
-        index,
-        query=f"{task} {seed} 증거 로그 출처 근거",
-        filters={"kind": ["board", "community", "persona", "corpus"], "board_id": board_id},
-        top_k=top_k,
-    )
-    policy = search(
-        index,
-        query=f"{task} 규정 제재 신고 룰",
-        filters={"kind": "rule"},
-        top_k=top_k,
-    )
-    organization = search(
-        index,
-        query=f"{task} 조직 세력 운영 감찰",
-        filters={"kind": ["organization", "character"]},
-        top_k=top_k,
-    )
-    hierarchy = search(
-        index,
-        query=f"{task} 페르소나 계층 관계",
-        filters={"kind": "persona", "zone_id": zone_id},
-        top_k=top_k,
-    )
+
+def _context_from_results(request: dict[str, Any], results: list[list[dict]]) -> dict[str, Any]:
+    top_k = int(request.get("top_k", 3))
+    persona_ids = request.get("persona_ids") or []
+    evidence, policy, organization, hierarchy = results[:4]
 
     persona_rows: list[dict] = []
-    for persona_id in persona_ids:
-        persona_rows.extend(
-            search(
-                index,
-                query=persona_id,
-                filters={"kind": "persona", "item_id": persona_id},
-                top_k=1,
-            )
-        )
+    for rows in results[4:]:
+        persona_rows.extend(rows)
     if persona_rows:
         hierarchy = _merge_unique_rows(persona_rows + hierarchy)[:top_k]
 
@@ -525,11 +1252,50 @@ def retrieve_context(
             corpus.append(text)
 
     bundle = {
-        "task": task,
-        "seed": seed,
-        "board_id": board_id,
-        "zone_id": zone_id,
+        "task": request["task"],
+        "seed": request["seed"],
+        "board_id": request["board_id"],
+        "zone_id": request["zone_id"],
         "persona_ids": persona_ids,
         "sections": sections,
     }
     return {"bundle": bundle, "corpus": corpus}
+
+
+def retrieve_contexts(index: dict[str, Any], requests: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    specs: list[dict[str, Any]] = []
+    offsets: list[tuple[int, int]] = []
+    for request in requests:
+        request_specs = _context_specs(request)
+        offsets.append((len(specs), len(specs) + len(request_specs)))
+        specs.extend(request_specs)
+    results = search_many(index, specs)
+    return [
+        _context_from_results(request, results[start:end])
+        for request, (start, end) in zip(requests, offsets)
+    ]
+
+
+def retrieve_context(
+    index: dict[str, Any],
+    *,
+    task: str,
+    seed: str,
+    board_id: str,
+    zone_id: str,
+    persona_ids: list[str] | None,
+    top_k: int = 3,
+) -> dict[str, Any]:
+    return retrieve_contexts(
+        index,
+        [
+            {
+                "task": task,
+                "seed": seed,
+                "board_id": board_id,
+                "zone_id": zone_id,
+                "persona_ids": persona_ids or [],
+                "top_k": top_k,
+            }
+        ],
+    )[0]
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
 import hashlib
+import http.client
+import io
 import json
 import os
+import sqlite3
 import threading
+import time
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Protocol
-from urllib import error, parse, request
+from urllib import error, parse
 
 
 def _normalize_env_value(value: str | None) -> str | None:
@@ -69,6 +74,252 @@ _DEFAULT_CLIENT_LOCK = threading.Lock()
 _DEFAULT_CLIENT_SIGNATURE: tuple[object, ...] | None = None
 _DEFAULT_CLIENT_INSTANCE: LLMClient | None = None
 
+_GOOGLE_API_BASE_URL = "https://generativelanguage.googleapis.com/v1beta"
+
+# (base_url, requested model) -> model that actually answered, shared by all clients in the process.
+_RESOLVED_MODELS_LOCK = threading.Lock()
+_RESOLVED_MODELS: dict[tuple[str, str], str] = {}
+
+
+def _remembered_model(base_url: str, requested: str) -> str | None:
+    with _RESOLVED_MODELS_LOCK:
+        return _RESOLVED_MODELS.get((base_url, requested))
+
+
+def _remember_model(base_url: str, requested: str, resolved: str) -> None:
+    with _RESOLVED_MODELS_LOCK:
+        _RESOLVED_MODELS[(base_url, requested)] = resolved
+
+
+def _forget_model(base_url: str, requested: str) -> None:
+    with _RESOLVED_MODELS_LOCK:
+        _RESOLVED_MODELS.pop((base_url, requested), None)
+
+
+class _KeepAliveConnectionPool:
+    """HTTP/1.1 keep-alive connections to one origin, reused across threads."""
+
+    def __init__(self, base_url: str, *, timeout_sec: float, max_idle: int = 8):
+        parsed = parse.urlsplit(base_url)
+        if parsed.scheme not in {"http", "https"} or not parsed.hostname:
+            raise ValueError(f"Unsupported LLM base url: {base_url}")
+        self.scheme = parsed.scheme
+        self.host = parsed.hostname
+        self.port = parsed.port
+        self.timeout_sec = timeout_sec
+        self.max_idle = max(1, int(max_idle))
+        self.connections_opened = 0
+        self._idle: deque[http.client.HTTPConnection] = deque()
+        self._lock = threading.Lock()
+
+    def _new_connection(self) -> http.client.HTTPConnection:
+        with self._lock:
+            self.connections_opened += 1
+        if self.scheme == "https":
+            return http.client.HTTPSConnection(self.host, self.port, timeout=self.timeout_sec)
+        return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout_sec)
+
+    def _checkout(self) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            if self._idle:
+                return self._idle.pop(), True
+        return self._new_connection(), False
+
+    def _checkin(self, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def post(self, target: str, body: bytes, headers: dict[str, str]) -> tuple[int, str, object, bytes]:
+        conn, reused = self._checkout()
+        while True:
+            try:
+                conn.request("POST", target, body=body, headers=headers)
+                resp = conn.getresponse()
+                raw = resp.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                conn.close()
+                if not reused:
+                    raise
+                # The server dropped an idle keep-alive connection; retry once on a fresh one.
+                conn, reused = self._new_connection(), False
+                continue
+            except Exception:
+                conn.close()
+                raise
+            if resp.will_close:
+                conn.close()
+            else:
+                self._checkin(conn)
+            return resp.status, resp.reason, resp.headers, raw
+
+    def close(self) -> None:
+        with self._lock:
+            idle = list(self._idle)
+            self._idle.clear()
+        for conn in idle:
+            conn.close()
+
+
+_SQLITE_HEADER = b"SQLite format 3\x00"
+_CACHE_EVICT_EVERY = 256
+_CACHE_MEMO_MAX_ENTRIES = 4096
+_DEFAULT_CACHE_PATH = Path(".runtime/llm_cache.sqlite3")
+# Where the JSON cache lived before the SQLite store; imported when the default store is first created.
+_LEGACY_DEFAULT_CACHE_PATH = Path(".runtime/llm_cache.json")
+
+
+def _is_expired(created_at: float, max_age_sec: float | None) -> bool:
+    return max_age_sec is not None and created_at < time.time() - max_age_sec
+
+
+def _take_legacy_json_file(path: Path) -> dict[str, str]:
+    try:
+        with path.open("rb") as fp:
+            if fp.read(len(_SQLITE_HEADER)) == _SQLITE_HEADER:
+                return {}
+        raw = path.read_bytes()
+        path.replace(path.with_name(path.name + ".legacy"))
+    except OSError:
+        # Missing, or another process renamed it first: that process imports it.
+        return {}
+    try:
+        payload = json.loads(raw.decode("utf-8"))
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return {}
+    if not isinstance(payload, dict):
+        return {}
+    return {str(k): str(v) for k, v in payload.items()}
+
+
+class _SqliteResponseCache:
+    """Keyed LLM response store in SQLite WAL mode, shared safely between processes."""
+
+    def __init__(
+        self,
+        db_path: Path,
+        *,
+        max_entries: int | None = None,
+        max_age_sec: float | None = None,
+        legacy_paths: tuple[Path, ...] = (),
+    ):
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.max_age_sec = max_age_sec
+        self.legacy_paths = legacy_paths
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._inserts_since_evict = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is not None:
+            return self._conn
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        legacy = self._take_legacy_json()
+        conn = sqlite3.connect(self.db_path, timeout=30.0, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_responses (
+                cache_key TEXT PRIMARY KEY,
+                response TEXT NOT NULL,
+                created_at REAL NOT NULL
+            )
+            """
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_responses_created ON llm_responses(created_at)")
+        if legacy:
+            now = time.time()
+            conn.executemany(
+                "INSERT OR IGNORE INTO llm_responses (cache_key, response, created_at) VALUES (?, ?, ?)",
+                [(key, value, now) for key, value in legacy.items()],
+            )
+        self._conn = conn
+        self._evict()
+        return conn
+
+    def _take_legacy_json(self) -> dict[str, str]:
+        # Earlier versions rewrote one JSON object per cache file; import it once and keep a backup.
+        sources = [self.db_path] if self.db_path.exists() else list(self.legacy_paths)
+        imported: dict[str, str] = {}
+        for path in sources:
+            imported.update(_take_legacy_json_file(path))
+        return imported
+
+    def _evict(self) -> None:
+        assert self._conn is not None
+        self._inserts_since_evict = 0
+        if self.max_age_sec is not None:
+            self._conn.execute(
+                "DELETE FROM llm_responses WHERE created_at < ?",
+                (time.time() - self.max_age_sec,),
+            )
+        if self.max_entries is not None:
+            self._conn.execute(
+                """
+                DELETE FROM llm_responses WHERE cache_key IN (
+                    SELECT cache_key FROM llm_responses
+                    ORDER BY created_at DESC, cache_key DESC
+                    LIMIT -1 OFFSET ?
+                )
+                """,
+                (self.max_entries,),
+            )
+
+    def lookup(self, key: str) -> tuple[str, float] | None:
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute("SELECT response, created_at FROM llm_responses WHERE cache_key = ?", (key,)).fetchone()
+        if row is None or _is_expired(float(row[1]), self.max_age_sec):
+            return None
+        return str(row[0]), float(row[1])
+
+    def get(self, key: str) -> str | None:
+        found = self.lookup(key)
+        return found[0] if found is not None else None
+
+    def put(self, key: str, value: str) -> None:
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_responses (cache_key, response, created_at) VALUES (?, ?, ?)",
+                (key, value, time.time()),
+            )
+            self._inserts_since_evict += 1
+            if self._inserts_since_evict >= _CACHE_EVICT_EVERY or (
+                self.max_entries is not None and self._inserts_since_evict >= self.max_entries
+            ):
+                self._evict()
+
+    def __len__(self) -> int:
+        with self._lock:
+            conn = self._connect()
+            return int(conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()[0])
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class _RateLimiter:
+    def __init__(self, requests_per_second: float):
+        self.interval = 1.0 / requests_per_second
+        self._next_at = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_at - now
+            self._next_at = max(now, self._next_at) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
 
 @dataclass
 class GoogleAIStudioLLMClient:
@@ -76,48 +327,126 @@ class GoogleAIStudioLLMClient:
     model: str = "gemini-3.1-flash"
     response_mode: str = "model_output"
     timeout_sec: float = 60.0
-    cache_path: Path | None = Path(".runtime/llm_cache.json")
-    _cache: dict[str, str] = field(default_factory=dict, init=False)
-    _cache_loaded: bool = field(default=False, init=False)
+    cache_path: Path | None = _DEFAULT_CACHE_PATH
+    base_url: str = _GOOGLE_API_BASE_URL
+    cache_max_entries: int | None = None
+    cache_max_age_sec: float | None = None
+    max_concurrency: int = 4
+    requests_per_second: float | None = None
+    _cache: OrderedDict[str, tuple[str, float]] = field(default_factory=OrderedDict, init=False)
+    _store: _SqliteResponseCache | None = field(default=None, init=False)
+    _pool: _KeepAliveConnectionPool | None = field(default=None, init=False)
+    _slots: threading.BoundedSemaphore = field(init=False)
+    _rate_limiter: _RateLimiter | None = field(default=None, init=False)
     _prompt_passthrough_probe_done: bool = field(default=False, init=False)
     _lock: threading.Lock = field(default_factory=threading.Lock, init=False)
 
+    def __post_init__(self) -> None:
+        if self.max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+        if self.requests_per_second is not None and self.requests_per_second <= 0:
+            raise ValueError("requests_per_second must be > 0")
+        # Shared by every thread calling this client, e.g. the concurrent generation workers.
+        self._slots = threading.BoundedSemaphore(self.max_concurrency)
+        if self.requests_per_second is not None:
+            self._rate_limiter = _RateLimiter(self.requests_per_second)
+
     def _cache_key(self, prompt: str, task: str) -> str:
         raw = f"{self.model}\n{task}\n{prompt}"
         return hashlib.sha256(raw.encode("utf-8")).hexdigest()
 
-    def _load_cache(self) -> None:
-        if self.cache_path is None or self._cache_loaded:
-            return
-        if self.cache_path.exists():
-            try:
-                payload = json.loads(self.cache_path.read_text(encoding="utf-8"))
-                if isinstance(payload, dict):
-                    self._cache = {str(k): str(v) for k, v in payload.items()}
-            except (json.JSONDecodeError, OSError):
-                self._cache = {}
-        self._cache_loaded = True
-
-    def _persist_cache(self) -> None:
+    def _cache_store(self) -> _SqliteResponseCache | None:
         if self.cache_path is None:
+            return None
+        if self._store is None:
+            self._store = _SqliteResponseCache(
+                self.cache_path,
+                max_entries=self.cache_max_entries,
+                max_age_sec=self.cache_max_age_sec,
+                legacy_paths=(_LEGACY_DEFAULT_CACHE_PATH,) if self.cache_path == _DEFAULT_CACHE_PATH else (),
+            )
+        return self._store
+
+    def _memo_limit(self) -> int:
+        if self.cache_max_entries is None:
+            return _CACHE_MEMO_MAX_ENTRIES
+        return max(0, min(_CACHE_MEMO_MAX_ENTRIES, self.cache_max_entries))
+
+    def _memoize(self, key: str, value: str, created_at: float) -> None:
+        limit = self._memo_limit()
+        if limit == 0:
             return
-        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
-        self.cache_path.write_text(
-            json.dumps(self._cache, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
+        self._cache[key] = (value, created_at)
+        self._cache.move_to_end(key)
+        while len(self._cache) > limit:
+            self._cache.popitem(last=False)
+
+    def _cache_lookup(self, key: str) -> str | None:
+        memo = self._cache.get(key)
+        if memo is not None:
+            if not _is_expired(memo[1], self.cache_max_age_sec):
+                self._cache.move_to_end(key)
+                return memo[0]
+            del self._cache[key]
+        store = self._cache_store()
+        if store is None:
+            return None
+        found = store.lookup(key)
+        if found is None:
+            return None
+        self._memoize(key, *found)
+        return found[0]
+
+    def _cache_insert(self, key: str, value: str) -> None:
+        self._memoize(key, value, time.time())
+        store = self._cache_store()
+        if store is not None:
+            store.put(key, value)
 
     def _resolve_model_candidates(self) -> list[str]:
         requested = self.model.strip()
         # Some Google accounts do not expose gemini-3.1-flash for text generateContent yet.
         if requested == "gemini-3.1-flash":
-            return [
+            candidates = [
                 requested,
                 "gemini-3-flash-preview",
                 "gemini-flash-latest",
                 "gemini-2.5-flash",
             ]
-        return [requested]
+        else:
+            candidates = [requested]
+        remembered = _remembered_model(self.base_url, requested)
+        if remembered in candidates:
+            candidates.remove(remembered)
+            candidates.insert(0, remembered)
+        return candidates
+
+    @property
+    def connection_pool(self) -> _KeepAliveConnectionPool:
+        with self._lock:
+            if self._pool is None:
+                self._pool = _KeepAliveConnectionPool(
+                    self.base_url,
+                    timeout_sec=self.timeout_sec,
+                    max_idle=self.max_concurrency,
+                )
+            return self._pool
+
+    def _post_generate(self, url: str, payload: bytes) -> str:
+        parsed = parse.urlsplit(url)
+        target = f"{parsed.path}?{parsed.query}" if parsed.query else parsed.path
+        pool = self.connection_pool
+        with self._slots:
+            if self._rate_limiter is not None:
+                self._rate_limiter.wait()
+            status, reason, headers, raw = pool.post(
+                target,
+                payload,
+                {"Content-Type": "application/json", "Connection": "keep-alive"},
+            )
+        if status >= 400:
+            raise error.HTTPError(url, status, reason, hdrs=headers, fp=io.BytesIO(raw))
+        return raw.decode("utf-8")
 
     def _request_model_output(self, prompt: str) -> str:
         body = {
@@ -127,24 +456,23 @@ class GoogleAIStudioLLMClient:
         payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
         api_key = parse.quote(self.api_key, safe="")
 
+        requested = self.model.strip()
+        base_url = self.base_url.rstrip("/")
+
         last_http_error: error.HTTPError | None = None
         for model_name in self._resolve_model_candidates():
             model_id = parse.quote(model_name, safe="")
-            url = f"https://generativelanguage.googleapis.com/v1beta/models/{model_id}:generateContent?key={api_key}"
-            req = request.Request(
-                url,
-                data=payload,
-                method="POST",
-                headers={"Content-Type": "application/json"},
-            )
+            url = f"{base_url}/models/{model_id}:generateContent?key={api_key}"
             try:
-                with request.urlopen(req, timeout=self.timeout_sec) as resp:
-                    raw = resp.read().decode("utf-8")
+                raw = self._post_generate(url, payload)
             except error.HTTPError as exc:
                 last_http_error = exc
                 if exc.code == 404:
+                    if _remembered_model(self.base_url, requested) == model_name:
+                        _forget_model(self.base_url, requested)
                     continue
                 raise
+            _remember_model(self.base_url, requested, model_name)
 
             parsed = json.loads(raw)
             candidates = parsed.get("candidates", [])
@@ -167,9 +495,9 @@ class GoogleAIStudioLLMClient:
         should_probe = False
 
         with self._lock:
-            self._load_cache()
-            if key in self._cache:
-                return self._cache[key]
+            cached = self._cache_lookup(key)
+            if cached is not None:
+                return cached
             if self.response_mode == "prompt_passthrough" and not self._prompt_passthrough_probe_done:
                 # Probe the configured model once per process, then keep tests deterministic/fast.
                 self._prompt_passthrough_probe_done = True
@@ -188,23 +516,23 @@ class GoogleAIStudioLLMClient:
             final_output = model_output
 
         with self._lock:
-            self._cache[key] = final_output
-            self._persist_cache()
+            self._cache_insert(key, final_output)
         return final_output
 
+    def close(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+            store, self._store = self._store, None
+        if pool is not None:
+            pool.close()
+        if store is not None:
+            store.close()
 
-def build_default_llm_client() -> LLMClient:
-    global _DEFAULT_CLIENT_SIGNATURE, _DEFAULT_CLIENT_INSTANCE
+
+def _google_client_settings() -> tuple[dict[str, object], tuple[object, ...]] | None:
     provider = (_get_setting("PROJECT_DREAM_LLM_PROVIDER", default="echo") or "echo").lower()
     if provider not in {"google", "gemini"}:
-        signature: tuple[object, ...] = ("echo",)
-        with _DEFAULT_CLIENT_LOCK:
-            if _DEFAULT_CLIENT_SIGNATURE == signature and _DEFAULT_CLIENT_INSTANCE is not None:
-                return _DEFAULT_CLIENT_INSTANCE
-            client = EchoLLMClient()
-            _DEFAULT_CLIENT_SIGNATURE = signature
-            _DEFAULT_CLIENT_INSTANCE = client
-            return client
+        return None
 
     api_key = (
         _get_setting("PROJECT_DREAM_LLM_API_KEY")
@@ -217,9 +545,36 @@ def build_default_llm_client() -> LLMClient:
     model = _get_setting("PROJECT_DREAM_LLM_MODEL", default="gemini-3.1-flash") or "gemini-3.1-flash"
     response_mode = _get_setting("PROJECT_DREAM_LLM_RESPONSE_MODE", default="model_output") or "model_output"
     timeout_raw = _get_setting("PROJECT_DREAM_LLM_TIMEOUT_SEC", default="60") or "60"
-    cache_path_raw = _get_setting("PROJECT_DREAM_LLM_CACHE_PATH", default=".runtime/llm_cache.json")
-    timeout_sec = float(timeout_raw)
-    cache_path = Path(cache_path_raw) if cache_path_raw else None
+    cache_path_raw = _get_setting("PROJECT_DREAM_LLM_CACHE_PATH", default=str(_DEFAULT_CACHE_PATH))
+    cache_max_entries_raw = _get_setting("PROJECT_DREAM_LLM_CACHE_MAX_ENTRIES")
+    cache_max_age_raw = _get_setting("PROJECT_DREAM_LLM_CACHE_MAX_AGE_SEC")
+    try:
+        cache_max_entries = int(cache_max_entries_raw) if cache_max_entries_raw else None
+        cache_max_age_sec = float(cache_max_age_raw) if cache_max_age_raw else None
+    except ValueError as exc:
+        raise ValueError(
+            "Invalid PROJECT_DREAM_LLM_CACHE_MAX_ENTRIES or PROJECT_DREAM_LLM_CACHE_MAX_AGE_SEC"
+        ) from exc
+    concurrency_raw = _get_setting("PROJECT_DREAM_LLM_MAX_CONCURRENCY", default="4") or "4"
+    rps_raw = _get_setting("PROJECT_DREAM_LLM_RATE_LIMIT_RPS")
+    try:
+        max_concurrency = int(concurrency_raw)
+        requests_per_second = float(rps_raw) if rps_raw else None
+    except ValueError as exc:
+        raise ValueError("Invalid PROJECT_DREAM_LLM_MAX_CONCURRENCY or PROJECT_DREAM_LLM_RATE_LIMIT_RPS") from exc
+    base_url = _get_setting("PROJECT_DREAM_LLM_BASE_URL", default=_GOOGLE_API_BASE_URL) or _GOOGLE_API_BASE_URL
+    kwargs: dict[str, object] = {
+        "api_key": api_key,
+        "model": model,
+        "response_mode": response_mode,
+        "timeout_sec": float(timeout_raw),
+        "cache_path": Path(cache_path_raw) if cache_path_raw else None,
+        "base_url": base_url,
+        "cache_max_entries": cache_max_entries,
+        "cache_max_age_sec": cache_max_age_sec,
+        "max_concurrency": max_concurrency,
+        "requests_per_second": requests_per_second,
+    }
     signature = (
         "google",
         api_key,
@@ -227,18 +582,48 @@ def build_default_llm_client() -> LLMClient:
         response_mode,
         timeout_raw,
         cache_path_raw,
+        base_url,
+        cache_max_entries_raw,
+        cache_max_age_raw,
+        concurrency_raw,
+        rps_raw,
     )
+    return kwargs, signature
+
 
+def build_default_llm_client() -> LLMClient:
+    global _DEFAULT_CLIENT_SIGNATURE, _DEFAULT_CLIENT_INSTANCE
+    settings = _google_client_settings()
+    if settings is None:
+        signature: tuple[object, ...] = ("echo",)
+        with _DEFAULT_CLIENT_LOCK:
+            if _DEFAULT_CLIENT_SIGNATURE == signature and _DEFAULT_CLIENT_INSTANCE is not None:
+                return _DEFAULT_CLIENT_INSTANCE
+            client = EchoLLMClient()
+            _DEFAULT_CLIENT_SIGNATURE = signature
+            _DEFAULT_CLIENT_INSTANCE = client
+            return client
+
+    kwargs, signature = settings
     with _DEFAULT_CLIENT_LOCK:
         if _DEFAULT_CLIENT_SIGNATURE == signature and _DEFAULT_CLIENT_INSTANCE is not None:
             return _DEFAULT_CLIENT_INSTANCE
-        client = GoogleAIStudioLLMClient(
-            api_key=api_key,
-            model=model,
-            response_mode=response_mode,
-            timeout_sec=timeout_sec,
-            cache_path=cache_path,
-        )
+        previous = _DEFAULT_CLIENT_INSTANCE
+        client = GoogleAIStudioLLMClient(**kwargs)
         _DEFAULT_CLIENT_SIGNATURE = signature
         _DEFAULT_CLIENT_INSTANCE = client
-        return client
+    if isinstance(previous, GoogleAIStudioLLMClient):
+        previous.close()
+    return client
+
+
+def per_process_limit_env(processes: int) -> dict[str, str]:
+    """Env overrides giving each of `processes` worker processes an equal share of the client limits."""
+    settings = _google_client_settings()
+    if settings is None or processes <= 1:
+        return {}
+    kwargs, _ = settings
+    overrides = {"PROJECT_DREAM_LLM_MAX_CONCURRENCY": str(max(1, int(kwargs["max_concurrency"]) // processes))}
+    if kwargs["requests_per_second"] is not None:
+        overrides["PROJECT_DREAM_LLM_RATE_LIMIT_RPS"] = repr(float(kwargs["requests_per_second"]) / processes)
+    return overrides
@@ -273,16 +273,29 @@ def run_simulation_with_backend(
     max_stage_retries: int = 0,
     packs=None,
     backend: str = "manual",
+    generation_workers: int | None = None,
 ) -> dict:
     selected = _normalize_backend(backend)
-    stage_retry_budget = max(0, int(max_stage_retries))
     raw_result = run_simulation(
         seed=seed,
         rounds=rounds,
         corpus=corpus,
         max_retries=max_retries,
         packs=packs,
+        generation_workers=generation_workers,
     )
+    return finalize_simulation_with_backend(raw_result, backend=selected, max_stage_retries=max_stage_retries)
+
+
+def finalize_simulation_with_backend(
+    raw_result: dict,
+    *,
+    backend: str = "manual",
+    max_stage_retries: int = 0,
+) -> dict:
+    """Run the stage pipeline over an existing `run_simulation` result (e.g. from a batch)."""
+    selected = _normalize_backend(backend)
+    stage_retry_budget = max(0, int(max_stage_retries))
     stage_payloads = extract_stage_payloads(raw_result)
 
     if selected == "langgraph":
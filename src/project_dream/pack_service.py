@@ -1,7 +1,11 @@
+import copy
 import json
 import hashlib
-from dataclasses import dataclass
+import threading
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from pathlib import Path
+from types import MappingProxyType
 
 from project_dream.pack_schemas import (
     BoardPackPayload,
@@ -16,7 +20,7 @@ from project_dream.pack_schemas import (
 )
 
 
-@dataclass
+@dataclass(frozen=True)
 class LoadedPacks:
     boards: dict[str, dict]
     communities: dict[str, dict]
@@ -35,6 +39,137 @@ class LoadedPacks:
     gate_policy: dict
     pack_manifest: dict
     pack_fingerprint: str
+    lookup: "PackLookup" = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "lookup", build_pack_lookup(self))
+
+    def __getstate__(self) -> dict:
+        state = dict(self.__dict__)
+        state.pop("lookup", None)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        object.__setattr__(self, "lookup", build_pack_lookup(self))
+
+
+# Identity equality keeps the lookup hashable so per-pack caches can key on it.
+@dataclass(frozen=True, eq=False)
+class PackLookup:
+    """Read-only tables derived from the packs once, for the per-round simulation paths."""
+
+    persona_ids: tuple[str, ...]
+    persona_ids_by_location: Mapping[tuple[str, str], tuple[str, ...]]
+    persona_ids_by_board: Mapping[str, tuple[str, ...]]
+    board_only_persona_ids: Mapping[tuple[str, str], tuple[str, ...]]
+    off_board_persona_ids: Mapping[str, tuple[str, ...]]
+    archetype_by_persona: Mapping[str, str]
+    default_register_profile_by_archetype: Mapping[str, str]
+    register_rules_by_archetype: Mapping[str, tuple[dict, ...]]
+    generic_register_rules: tuple[dict, ...]
+    template_by_board: Mapping[str, tuple[str, str]]
+    community_by_board: Mapping[str, dict]
+
+    def participant_groups(self, board_id: str, zone_id: str) -> tuple[tuple[str, ...], ...]:
+        """Return (same board+zone, same board only, other boards) persona ids, each sorted by id."""
+        location = (board_id, zone_id)
+        return (
+            self.persona_ids_by_location.get(location, ()),
+            self.board_only_persona_ids.get(location, self.persona_ids_by_board.get(board_id, ())),
+            self.off_board_persona_ids.get(board_id, self.persona_ids),
+        )
+
+    def register_rules_for(self, archetype_id: str) -> tuple[dict, ...]:
+        return self.register_rules_by_archetype.get(archetype_id, self.generic_register_rules)
+
+
+def _frozen_groups(groups: dict) -> Mapping:
+    return MappingProxyType({key: tuple(values) for key, values in groups.items()})
+
+
+def build_pack_lookup(packs) -> PackLookup:
+    personas = getattr(packs, "personas", None) or {}
+    communities = getattr(packs, "communities", None) or {}
+    archetypes = getattr(packs, "archetypes", None) or {}
+    thread_templates = getattr(packs, "thread_templates", None) or {}
+    register_switch_rules = getattr(packs, "register_switch_rules", None)
+    if not isinstance(register_switch_rules, list):
+        register_switch_rules = []
+
+    persona_ids: list[str] = []
+    location_by_persona: dict[str, tuple[object, object]] = {}
+    by_location: dict[tuple, list[str]] = {}
+    by_board: dict[object, list[str]] = {}
+    archetype_by_persona: dict[str, str] = {}
+    for persona in sorted(personas.values(), key=lambda row: row["id"]):
+        persona_id = persona["id"]
+        community = communities.get(persona.get("main_com"), {})
+        location = (community.get("board_id"), community.get("zone_id"))
+        persona_ids.append(persona_id)
+        location_by_persona[persona_id] = location
+        by_location.setdefault(location, []).append(persona_id)
+        by_board.setdefault(location[0], []).append(persona_id)
+        archetype_by_persona[persona_id] = str(persona.get("archetype_id", "")).strip()
+
+    board_only = {
+        location: [pid for pid in by_board[location[0]] if location_by_persona[pid][1] != location[1]]
+        for location in by_location
+    }
+    off_board = {
+        board_id: [pid for pid in persona_ids if location_by_persona[pid][0] != board_id] for board_id in by_board
+    }
+
+    default_profiles: dict[str, str] = {}
+    for archetype_id, archetype in archetypes.items():
+        if isinstance(archetype, dict):
+            default_profiles[archetype_id] = str(archetype.get("default_register_profile_id", "")).strip()
+
+    # Rules keep their priority order; rules without an archetype condition apply to every archetype.
+    scoped_rules: list[tuple[dict, set[str]]] = []
+    rule_archetypes: set[str] = set(archetypes)
+    for rule in register_switch_rules:
+        if not isinstance(rule, dict) or not isinstance(rule.get("conditions", {}), dict):
+            continue
+        condition_archetypes = set(_as_str_list(rule.get("conditions", {}).get("archetype_ids")))
+        scoped_rules.append((rule, condition_archetypes))
+        rule_archetypes |= condition_archetypes
+    rules_by_archetype = {
+        archetype_id: [rule for rule, scope in scoped_rules if not scope or archetype_id in scope]
+        for archetype_id in sorted(rule_archetypes)
+    }
+
+    template_by_board: dict[str, tuple[str, str]] = {}
+    for template in sorted(thread_templates.values(), key=lambda row: row["id"]):
+        for board_id in template.get("intended_boards", []):
+            template_by_board.setdefault(board_id, (template["id"], template.get("default_comment_flow", "P1")))
+
+    community_by_board: dict[str, dict] = {}
+    for community in sorted(communities.values(), key=lambda row: row["id"]):
+        board_id = str(community.get("board_id", ""))
+        if board_id:
+            community_by_board.setdefault(board_id, community)
+
+    return PackLookup(
+        persona_ids=tuple(persona_ids),
+        persona_ids_by_location=_frozen_groups(by_location),
+        persona_ids_by_board=_frozen_groups(by_board),
+        board_only_persona_ids=_frozen_groups(board_only),
+        off_board_persona_ids=_frozen_groups(off_board),
+        archetype_by_persona=MappingProxyType(archetype_by_persona),
+        default_register_profile_by_archetype=MappingProxyType(default_profiles),
+        register_rules_by_archetype=_frozen_groups(rules_by_archetype),
+        generic_register_rules=tuple(rule for rule, scope in scoped_rules if not scope),
+        template_by_board=MappingProxyType(template_by_board),
+        community_by_board=MappingProxyType(community_by_board),
+    )
+
+
+def pack_lookup(packs) -> PackLookup:
+    lookup = getattr(packs, "lookup", None)
+    if isinstance(lookup, PackLookup):
+        return lookup
+    return build_pack_lookup(packs)
 
 
 _FLOW_TABOO_HINTS = {
@@ -371,6 +506,21 @@ def _validate_minimum_requirements(packs: LoadedPacks) -> None:
 
 def load_packs(base_dir: Path, enforce_phase1_minimums: bool = False) -> LoadedPacks:
     pack_manifest, pack_fingerprint = _load_and_verify_manifest(base_dir)
+    return _load_verified_packs(
+        base_dir,
+        pack_manifest=pack_manifest,
+        pack_fingerprint=pack_fingerprint,
+        enforce_phase1_minimums=enforce_phase1_minimums,
+    )
+
+
+def _load_verified_packs(
+    base_dir: Path,
+    *,
+    pack_manifest: dict,
+    pack_fingerprint: str,
+    enforce_phase1_minimums: bool,
+) -> LoadedPacks:
 
     board_pack = validate_pack_payload(
         _read_pack(base_dir / "board_pack.json", "boards"),
@@ -596,3 +746,70 @@ def load_packs(base_dir: Path, enforce_phase1_minimums: bool = False) -> LoadedP
     if enforce_phase1_minimums:
         _validate_minimum_requirements(packs)
     return packs
+
+
+_PACK_CACHE: dict[tuple[str, bool], tuple[tuple, LoadedPacks]] = {}
+_PACK_CACHE_LOCK = threading.Lock()
+_PACK_CACHE_STATS = {"hits": 0, "misses": 0, "revalidations": 0}
+
+
+def _pack_files_signature(base_dir: Path) -> tuple:
+    signature = []
+    for filename in (*_PACK_FILE_NAMES, "pack_manifest.json"):
+        try:
+            stat = (base_dir / filename).stat()
+        except FileNotFoundError:
+            signature.append((filename, -1, -1))
+            continue
+        signature.append((filename, int(stat.st_size), int(stat.st_mtime_ns)))
+    return tuple(signature)
+
+
+def _detached_copy(packs: LoadedPacks) -> LoadedPacks:
+    """Deep copy of the pack tables that still shares the (read-only) lookup of the cached packs."""
+    clone = object.__new__(LoadedPacks)
+    tables = copy.deepcopy({name: value for name, value in packs.__dict__.items() if name != "lookup"})
+    for name, value in tables.items():
+        object.__setattr__(clone, name, value)
+    object.__setattr__(clone, "lookup", packs.lookup)
+    return clone
+
+
+def load_packs_cached(base_dir: Path, enforce_phase1_minimums: bool = False) -> LoadedPacks:
+    """Process-wide `load_packs`: callers get their own copy of the cached tables, so mutations never leak."""
+    key = (str(base_dir.resolve()), enforce_phase1_minimums)
+    with _PACK_CACHE_LOCK:
+        signature = _pack_files_signature(base_dir)
+        cached = _PACK_CACHE.get(key)
+        if cached is not None and cached[0] == signature:
+            _PACK_CACHE_STATS["hits"] += 1
+            return _detached_copy(cached[1])
+
+        # Files were touched or replaced: re-verify checksums, and skip re-validation if content is unchanged.
+        pack_manifest, pack_fingerprint = _load_and_verify_manifest(base_dir)
+        if cached is not None and cached[1].pack_fingerprint == pack_fingerprint:
+            _PACK_CACHE_STATS["revalidations"] += 1
+            _PACK_CACHE[key] = (signature, cached[1])
+            return _detached_copy(cached[1])
+
+        _PACK_CACHE_STATS["misses"] += 1
+        packs = _load_verified_packs(
+            base_dir,
+            pack_manifest=pack_manifest,
+            pack_fingerprint=pack_fingerprint,
+            enforce_phase1_minimums=enforce_phase1_minimums,
+        )
+        _PACK_CACHE[key] = (signature, packs)
+        return _detached_copy(packs)
+
+
+def pack_cache_stats() -> dict:
+    with _PACK_CACHE_LOCK:
+        return {**_PACK_CACHE_STATS, "entries": len(_PACK_CACHE)}
+
+
+def clear_pack_cache() -> None:
+    with _PACK_CACHE_LOCK:
+        _PACK_CACHE.clear()
+        for name in _PACK_CACHE_STATS:
+            _PACK_CACHE_STATS[name] = 0
@@ -1,7 +1,12 @@
 import hashlib
+import threading
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Any
 
 from project_dream.models import SeedInput
+from project_dream.pack_service import PackLookup, pack_lookup
 
 
 _FALLBACK_BASE = ["AG-01", "AG-02", "AG-03", "AG-04", "AG-05"]
@@ -59,6 +64,13 @@ _VOICE_BY_ARCHETYPE: dict[str, dict[str, Any]] = {
     },
 }
 
+_VOICE_CACHE_MAX_ENTRIES = 4096
+_VOICE_CACHE: OrderedDict[tuple, dict[str, Any]] = OrderedDict()
+_VOICE_CACHE_LOCK = threading.Lock()
+_VOICE_CACHE_STATS = {"hits": 0, "misses": 0, "evictions": 0}
+
+_REGISTER_CATEGORY_CONDITIONS = ("dial_axis_in", "meme_phase_in", "status_in")
+
 _ZONE_TABOO_WORDS = {
     "A": ["realname_dox", "signature_dox"],
     "B": ["injury_dox", "doping_claim_no_proof"],
@@ -119,10 +131,7 @@ def _to_int(value: object, default: int = 0) -> int:
 def _resolve_persona_archetype_id(persona_id: str, packs) -> str:
     if packs is None or not getattr(packs, "personas", None):
         return ""
-    persona = packs.personas.get(persona_id)
-    if not isinstance(persona, dict):
-        return ""
-    return str(persona.get("archetype_id", "")).strip()
+    return pack_lookup(packs).archetype_by_persona.get(persona_id, "")
 
 
 def _apply_register_profile(base_voice: dict[str, Any], profile: dict) -> dict[str, Any]:
@@ -192,25 +201,9 @@ def select_participants(
     if packs is None or not getattr(packs, "personas", None):
         return _fallback_participants(seed, round_idx, limit)
 
-    communities = packs.communities
-    preferred: list[str] = []
-    board_match: list[str] = []
-    others: list[str] = []
-
-    for persona in sorted(packs.personas.values(), key=lambda row: row["id"]):
-        persona_id = persona["id"]
-        community_id = persona.get("main_com")
-        community = communities.get(community_id, {})
-        board_id = community.get("board_id")
-        zone_id = community.get("zone_id")
-
-        if board_id == seed.board_id and zone_id == seed.zone_id:
-            preferred.append(persona_id)
-        elif board_id == seed.board_id:
-            board_match.append(persona_id)
-        else:
-            others.append(persona_id)
-
+    preferred, board_match, others = (
+        list(group) for group in pack_lookup(packs).participant_groups(seed.board_id, seed.zone_id)
+    )
     ordered = _unique(
         _rotate(preferred, seed_id=seed.seed_id, round_idx=round_idx, salt="preferred")
         + _rotate(board_match, seed_id=seed.seed_id, round_idx=round_idx, salt="board")
@@ -260,25 +253,17 @@ def apply_register_switch(
     if packs is None:
         return out
     register_profiles = getattr(packs, "register_profiles", {})
-    register_switch_rules = getattr(packs, "register_switch_rules", [])
-    archetypes = getattr(packs, "archetypes", {})
-
     if not isinstance(register_profiles, dict):
         return out
-    if not isinstance(register_switch_rules, list):
-        register_switch_rules = []
 
+    lookup = pack_lookup(packs)
     archetype_id = _resolve_persona_archetype_id(persona_id, packs)
     runtime = dict(runtime_context) if isinstance(runtime_context, dict) else {}
 
-    if archetype_id and isinstance(archetypes, dict):
-        archetype = archetypes.get(archetype_id, {})
-        if isinstance(archetype, dict):
-            out["register_profile_id"] = str(archetype.get("default_register_profile_id", "")).strip()
+    if archetype_id:
+        out["register_profile_id"] = lookup.default_register_profile_by_archetype.get(archetype_id, "")
 
-    for rule in register_switch_rules:
-        if not isinstance(rule, dict):
-            continue
+    for rule in lookup.register_rules_for(archetype_id):
         if not _register_rule_matches(rule, archetype_id=archetype_id, runtime_context=runtime):
             continue
         profile_id = str(rule.get("apply_profile_id", "")).strip()
@@ -292,3 +277,94 @@ def apply_register_switch(
         return out
 
     return out
+
+
+@lru_cache(maxsize=16)
+def _register_signature_spec(lookup: PackLookup) -> tuple[dict[str, frozenset[str]], dict[str, tuple[int, ...]]]:
+    """Collect the condition values/thresholds any register rule can distinguish."""
+    values: dict[str, set[str]] = {name: set() for name in _REGISTER_CATEGORY_CONDITIONS}
+    thresholds: dict[str, set[int]] = {"reports_gte": {0}, "evidence_hours_lte": {9999}, "round_gte": {0}}
+    for rules in (lookup.generic_register_rules, *lookup.register_rules_by_archetype.values()):
+        for rule in rules:
+            conditions = rule.get("conditions", {})
+            for name in _REGISTER_CATEGORY_CONDITIONS:
+                values[name].update(_as_str_list(conditions.get(name)))
+            thresholds["reports_gte"].add(_to_int(conditions.get("reports_gte"), 0))
+            thresholds["evidence_hours_lte"].add(_to_int(conditions.get("evidence_hours_lte"), 9999))
+            thresholds["round_gte"].add(_to_int(conditions.get("round_gte"), 0))
+    values["dial_axis_in"] = {axis.upper() for axis in values["dial_axis_in"]}
+    return (
+        {name: frozenset(items) for name, items in values.items()},
+        {name: tuple(sorted(items)) for name, items in thresholds.items()},
+    )
+
+
+def _register_context_signature(lookup: PackLookup, runtime_context: dict[str, Any] | None) -> tuple:
+    """Reduce the runtime context to what `_register_rule_matches` can tell apart."""
+    runtime = runtime_context if isinstance(runtime_context, dict) else {}
+    values, thresholds = _register_signature_spec(lookup)
+    dial_axis = str(runtime.get("dial_dominant_axis", "")).strip().upper()
+    meme_phase = str(runtime.get("meme_phase", "")).strip()
+    status = str(runtime.get("status", "")).strip()
+    return (
+        dial_axis if dial_axis in values["dial_axis_in"] else "",
+        meme_phase if meme_phase in values["meme_phase_in"] else "",
+        status if status in values["status_in"] else "",
+        bisect_right(thresholds["reports_gte"], _to_int(runtime.get("total_reports"), 0)),
+        bisect_left(thresholds["evidence_hours_lte"], _to_int(runtime.get("evidence_hours_left"), 9999)),
+        bisect_right(thresholds["round_gte"], _to_int(runtime.get("round_idx"), 0)),
+    )
+
+
+def _copy_voice(voice: dict[str, Any]) -> dict[str, Any]:
+    return {key: list(value) if isinstance(value, list) else value for key, value in voice.items()}
+
+
+def resolve_voice(
+    persona_id: str,
+    zone_id: str,
+    *,
+    packs=None,
+    runtime_context: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """`render_voice` + `apply_register_switch`, memoized per (persona, zone, runtime signature)."""
+    lookup = getattr(packs, "lookup", None)
+    if not isinstance(lookup, PackLookup):
+        voice = render_voice(persona_id, zone_id, packs=packs)
+        return apply_register_switch(voice, persona_id=persona_id, packs=packs, runtime_context=runtime_context)
+
+    key = (lookup, persona_id, zone_id, _register_context_signature(lookup, runtime_context))
+    with _VOICE_CACHE_LOCK:
+        voice = _VOICE_CACHE.get(key)
+        if voice is not None:
+            _VOICE_CACHE.move_to_end(key)
+            _VOICE_CACHE_STATS["hits"] += 1
+            return _copy_voice(voice)
+
+    voice = render_voice(persona_id, zone_id, packs=packs)
+    voice = apply_register_switch(voice, persona_id=persona_id, packs=packs, runtime_context=runtime_context)
+    with _VOICE_CACHE_LOCK:
+        _VOICE_CACHE_STATS["misses"] += 1
+        _VOICE_CACHE[key] = _copy_voice(voice)
+        while len(_VOICE_CACHE) > _VOICE_CACHE_MAX_ENTRIES:
+            _VOICE_CACHE.popitem(last=False)
+            _VOICE_CACHE_STATS["evictions"] += 1
+    return voice
+
+
+def voice_cache_stats() -> dict:
+    with _VOICE_CACHE_LOCK:
+        lookups = _VOICE_CACHE_STATS["hits"] + _VOICE_CACHE_STATS["misses"]
+        return {
+            **_VOICE_CACHE_STATS,
+            "entries": len(_VOICE_CACHE),
+            "max_entries": _VOICE_CACHE_MAX_ENTRIES,
+            "hit_rate": round(_VOICE_CACHE_STATS["hits"] / lookups, 4) if lookups else 0.0,
+        }
+
+
+def clear_voice_cache() -> None:
+    with _VOICE_CACHE_LOCK:
+        _VOICE_CACHE.clear()
+        for name in _VOICE_CACHE_STATS:
+            _VOICE_CACHE_STATS[name] = 0
@@ -1,14 +1,17 @@
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path
 
 from project_dream.canon_gate import enforce_canon_gate
 from project_dream.data_ingest import load_corpus_texts
 from project_dream.eval_suite import REQUIRED_REPORT_KEYS, evaluate_run
-from project_dream.kb_index import build_index, retrieve_context
+from project_dream.kb_index import build_index, load_or_build_index, retrieve_contexts
+from project_dream.llm_client import per_process_limit_env
 from project_dream.models import SeedInput
 from project_dream.orchestrator_runtime import run_simulation_with_backend
-from project_dream.pack_service import load_packs
+from project_dream.pack_service import LoadedPacks, load_packs_cached
 from project_dream.report_generator import build_report_v1
 from project_dream.storage import persist_eval, persist_run
 
@@ -157,6 +160,99 @@ def _write_summary(output_dir: Path, summary: dict) -> Path:
     return path
 
 
+def _run_seed(
+    job: dict,
+    *,
+    packs: LoadedPacks,
+    ingested_corpus: list[str],
+    rounds: int,
+    output_dir: Path,
+    metric_set: str,
+    orchestrator_backend: str,
+    generation_workers: int | None = None,
+) -> dict:
+    seed = SeedInput.model_validate(job["seed"])
+    context = job["context"]
+    merged_corpus = _merge_unique_corpus(context["corpus"], ingested_corpus)
+    sim_result = run_simulation_with_backend(
+        seed=seed,
+        rounds=rounds,
+        corpus=merged_corpus,
+        packs=packs,
+        backend=orchestrator_backend,
+        generation_workers=generation_workers,
+    )
+    sim_result["orchestrator_backend"] = orchestrator_backend
+    sim_result["context_bundle"] = context["bundle"]
+    sim_result["context_corpus"] = merged_corpus
+    sim_result["seed"] = seed.model_dump()
+    sim_result["pack_manifest"] = packs.pack_manifest
+    sim_result["pack_fingerprint"] = packs.pack_fingerprint
+    report = build_report_v1(seed, sim_result, packs)
+    run_dir = persist_run(output_dir, sim_result, report)
+    eval_result = evaluate_run(run_dir, metric_set=metric_set)
+    persist_eval(run_dir, eval_result)
+
+    communities = sorted(
+        {row.get("community_id") for row in sim_result.get("rounds", []) if row.get("community_id")}
+    )
+    missing_sections = _missing_required_sections(report)
+    report_gate = report.get("report_gate", {}) if isinstance(report, dict) else {}
+    run_register_switch_rounds, run_register_rule_counts = _collect_register_switch_stats(sim_result)
+    run_cross_inflow_events = _event_count(sim_result, "cross_inflow_logs")
+    run_meme_flow_events = _event_count(sim_result, "meme_flow_logs")
+    derived_alignment_rate, derived_weight_avg = _collect_culture_stats(sim_result)
+    metrics = eval_result.get("metrics", {})
+
+    return {
+        "seed_file": job["seed_file"],
+        "seed_id": seed.seed_id,
+        "run_id": run_dir.name,
+        "eval_pass_fail": bool(eval_result.get("pass_fail")),
+        "missing_required_sections": missing_sections,
+        "communities": communities,
+        "has_conflict_frames": _has_conflict_frames(report),
+        "has_moderation_hook": _has_moderation_hook(sim_result, report),
+        "has_validation_warning": len(report.get("risk_checks", [])) > 0,
+        "has_context_trace": _has_context_trace(eval_result),
+        "has_stage_trace": _has_stage_trace(eval_result),
+        "has_stage_trace_consistency": _has_stage_trace_consistency(eval_result),
+        "has_stage_trace_ordering": _has_stage_trace_ordering(eval_result),
+        "has_story_checklist_required_items": _has_story_checklist_required_items(eval_result),
+        "stage_trace_coverage_rate": float(metrics.get("stage_trace_coverage_rate", 0.0)),
+        "has_report_gate_pass": bool(report_gate.get("pass_fail")),
+        "has_register_switch": run_register_switch_rounds > 0,
+        "register_switch_rounds": run_register_switch_rounds,
+        "register_rule_counts": run_register_rule_counts,
+        "has_cross_inflow": run_cross_inflow_events > 0,
+        "cross_inflow_events": run_cross_inflow_events,
+        "has_meme_flow": run_meme_flow_events > 0,
+        "meme_flow_events": run_meme_flow_events,
+        "culture_dial_alignment_rate": float(metrics.get("culture_dial_alignment_rate", derived_alignment_rate)),
+        "culture_weight_avg": float(metrics.get("culture_weight_avg", derived_weight_avg)),
+    }
+
+
+# Per-process state for pool workers: packs and ingested corpus are loaded once per worker.
+_WORKER_STATE: dict = {}
+
+
+def _init_regression_worker(packs_dir: Path, corpus_dir: Path, run_kwargs: dict, limit_env: dict[str, str]) -> None:
+    os.environ.update(limit_env)
+    _WORKER_STATE["packs"] = load_packs_cached(packs_dir, enforce_phase1_minimums=True)
+    _WORKER_STATE["ingested_corpus"] = load_corpus_texts(corpus_dir)
+    _WORKER_STATE["run_kwargs"] = run_kwargs
+
+
+def _run_seed_job(job: dict) -> dict:
+    return _run_seed(
+        job,
+        packs=_WORKER_STATE["packs"],
+        ingested_corpus=_WORKER_STATE["ingested_corpus"],
+        **_WORKER_STATE["run_kwargs"],
+    )
+
+
 def run_regression_batch(
     seeds_dir: Path,
     packs_dir: Path,
@@ -172,17 +268,73 @@ def run_regression_batch(
     orchestrator_backend: str = "manual",
     vector_backend: str = "memory",
     vector_db_path: Path | None = None,
+    kb_index_dir: Path | None = None,
+    workers: int = 1,
+    generation_workers: int | None = None,
 ) -> dict:
-    packs = load_packs(packs_dir, enforce_phase1_minimums=True)
-    index = build_index(
-        packs,
-        vector_backend=vector_backend,
-        vector_db_path=vector_db_path,
-    )
+    if workers < 1:
+        raise ValueError("workers must be >= 1")
+    packs = load_packs_cached(packs_dir, enforce_phase1_minimums=True)
+    if kb_index_dir is None:
+        index = build_index(
+            packs,
+            vector_backend=vector_backend,
+            vector_db_path=vector_db_path,
+        )
+    else:
+        index = load_or_build_index(
+            packs,
+            snapshot_dir=kb_index_dir,
+            vector_backend=vector_backend,
+            vector_db_path=vector_db_path,
+        )
     ingested_corpus = load_corpus_texts(corpus_dir)
     seed_files = _seed_files(seeds_dir, max_seeds=max_seeds)
+    seeds: list[SeedInput] = []
+    for seed_file in seed_files:
+        seed = SeedInput.model_validate_json(seed_file.read_text(encoding="utf-8"))
+        enforce_canon_gate(seed=seed, packs=packs)
+        seeds.append(seed)
+    contexts = retrieve_contexts(
+        index,
+        [
+            {
+                "task": f"{seed.title} {seed.summary}",
+                "seed": seed.summary,
+                "board_id": seed.board_id,
+                "zone_id": seed.zone_id,
+                "persona_ids": [],
+                "top_k": 3,
+            }
+            for seed in seeds
+        ],
+    )
+
+    jobs = [
+        {"seed_file": seed_file.name, "seed": seed.model_dump(), "context": context}
+        for seed_file, seed, context in zip(seed_files, seeds, contexts)
+    ]
+    run_kwargs = {
+        "rounds": rounds,
+        "output_dir": output_dir,
+        "metric_set": metric_set,
+        "orchestrator_backend": orchestrator_backend,
+        "generation_workers": generation_workers,
+    }
+    if workers > 1 and len(jobs) > 1:
+        processes = min(workers, len(jobs))
+        # Each process gets its share of the LLM client limits so threads x processes stays bounded.
+        with ProcessPoolExecutor(
+            max_workers=processes,
+            initializer=_init_regression_worker,
+            initargs=(packs_dir, corpus_dir, run_kwargs, per_process_limit_env(processes)),
+        ) as executor:
+            run_summaries = list(executor.map(_run_seed_job, jobs))
+    else:
+        run_summaries = [
+            _run_seed(job, packs=packs, ingested_corpus=ingested_corpus, **run_kwargs) for job in jobs
+        ]
 
-    run_summaries: list[dict] = []
     unique_communities: set[str] = set()
     missing_required_sections_total = 0
     conflict_frame_runs = 0
@@ -206,119 +358,31 @@ def run_regression_batch(
     culture_weight_avg_sum = 0.0
     register_rule_counts_total: dict[str, int] = {}
 
-    for seed_file in seed_files:
-        seed = SeedInput.model_validate_json(seed_file.read_text(encoding="utf-8"))
-        enforce_canon_gate(seed=seed, packs=packs)
-        context = retrieve_context(
-            index,
-            task=f"{seed.title} {seed.summary}",
-            seed=seed.summary,
-            board_id=seed.board_id,
-            zone_id=seed.zone_id,
-            persona_ids=[],
-            top_k=3,
-        )
-        merged_corpus = _merge_unique_corpus(context["corpus"], ingested_corpus)
-        sim_result = run_simulation_with_backend(
-            seed=seed,
-            rounds=rounds,
-            corpus=merged_corpus,
-            packs=packs,
-            backend=orchestrator_backend,
-        )
-        sim_result["orchestrator_backend"] = orchestrator_backend
-        sim_result["context_bundle"] = context["bundle"]
-        sim_result["context_corpus"] = merged_corpus
-        sim_result["seed"] = seed.model_dump()
-        sim_result["pack_manifest"] = packs.pack_manifest
-        sim_result["pack_fingerprint"] = packs.pack_fingerprint
-        report = build_report_v1(seed, sim_result, packs)
-        run_dir = persist_run(output_dir, sim_result, report)
-        eval_result = evaluate_run(run_dir, metric_set=metric_set)
-        persist_eval(run_dir, eval_result)
-
-        communities = sorted(
-            {row.get("community_id") for row in sim_result.get("rounds", []) if row.get("community_id")}
-        )
-        unique_communities.update(communities)
-
-        missing_sections = _missing_required_sections(report)
-        has_conflict = _has_conflict_frames(report)
-        has_moderation_hook = _has_moderation_hook(sim_result, report)
-        has_validation_warning = len(report.get("risk_checks", [])) > 0
-        has_context_trace = _has_context_trace(eval_result)
-        has_stage_trace = _has_stage_trace(eval_result)
-        has_stage_trace_consistency = _has_stage_trace_consistency(eval_result)
-        has_stage_trace_ordering = _has_stage_trace_ordering(eval_result)
-        has_story_checklist_required_items = _has_story_checklist_required_items(eval_result)
-        stage_trace_coverage_rate = float(eval_result.get("metrics", {}).get("stage_trace_coverage_rate", 0.0))
-        report_gate = report.get("report_gate", {}) if isinstance(report, dict) else {}
-        has_report_gate_pass = bool(report_gate.get("pass_fail"))
-        run_register_switch_rounds, run_register_rule_counts = _collect_register_switch_stats(sim_result)
-        has_register_switch = run_register_switch_rounds > 0
-        run_cross_inflow_events = _event_count(sim_result, "cross_inflow_logs")
-        run_meme_flow_events = _event_count(sim_result, "meme_flow_logs")
-        has_cross_inflow = run_cross_inflow_events > 0
-        has_meme_flow = run_meme_flow_events > 0
-        derived_alignment_rate, derived_weight_avg = _collect_culture_stats(sim_result)
-        culture_dial_alignment_rate = float(
-            eval_result.get("metrics", {}).get("culture_dial_alignment_rate", derived_alignment_rate)
-        )
-        culture_weight_avg = float(eval_result.get("metrics", {}).get("culture_weight_avg", derived_weight_avg))
-
-        missing_required_sections_total += len(missing_sections)
-        conflict_frame_runs += int(has_conflict)
-        moderation_hook_runs += int(has_moderation_hook)
-        validation_warning_runs += int(has_validation_warning)
-        context_trace_runs += int(has_context_trace)
-        stage_trace_runs += int(has_stage_trace)
-        stage_trace_consistent_runs += int(has_stage_trace_consistency)
-        stage_trace_ordered_runs += int(has_stage_trace_ordering)
-        stage_trace_coverage_sum += stage_trace_coverage_rate
-        eval_pass_runs += int(bool(eval_result.get("pass_fail")))
-        report_gate_pass_runs += int(has_report_gate_pass)
-        story_checklist_pass_runs += int(has_story_checklist_required_items)
-        register_switch_runs += int(has_register_switch)
-        register_switch_rounds += run_register_switch_rounds
-        cross_inflow_runs += int(has_cross_inflow)
-        cross_inflow_events += run_cross_inflow_events
-        meme_flow_runs += int(has_meme_flow)
-        meme_flow_events += run_meme_flow_events
-        culture_dial_alignment_rate_sum += culture_dial_alignment_rate
-        culture_weight_avg_sum += culture_weight_avg
-        for rule_id, count in run_register_rule_counts.items():
+    for run in run_summaries:
+        unique_communities.update(run["communities"])
+        missing_required_sections_total += len(run["missing_required_sections"])
+        conflict_frame_runs += int(run["has_conflict_frames"])
+        moderation_hook_runs += int(run["has_moderation_hook"])
+        validation_warning_runs += int(run["has_validation_warning"])
+        context_trace_runs += int(run["has_context_trace"])
+        stage_trace_runs += int(run["has_stage_trace"])
+        stage_trace_consistent_runs += int(run["has_stage_trace_consistency"])
+        stage_trace_ordered_runs += int(run["has_stage_trace_ordering"])
+        stage_trace_coverage_sum += run["stage_trace_coverage_rate"]
+        eval_pass_runs += int(run["eval_pass_fail"])
+        report_gate_pass_runs += int(run["has_report_gate_pass"])
+        story_checklist_pass_runs += int(run["has_story_checklist_required_items"])
+        register_switch_runs += int(run["has_register_switch"])
+        register_switch_rounds += run["register_switch_rounds"]
+        cross_inflow_runs += int(run["has_cross_inflow"])
+        cross_inflow_events += run["cross_inflow_events"]
+        meme_flow_runs += int(run["has_meme_flow"])
+        meme_flow_events += run["meme_flow_events"]
+        culture_dial_alignment_rate_sum += run["culture_dial_alignment_rate"]
+        culture_weight_avg_sum += run["culture_weight_avg"]
+        for rule_id, count in run["register_rule_counts"].items():
             register_rule_counts_total[rule_id] = register_rule_counts_total.get(rule_id, 0) + count
 
-        run_summaries.append(
-            {
-                "seed_file": seed_file.name,
-                "seed_id": seed.seed_id,
-                "run_id": run_dir.name,
-                "eval_pass_fail": bool(eval_result.get("pass_fail")),
-                "missing_required_sections": missing_sections,
-                "communities": communities,
-                "has_conflict_frames": has_conflict,
-                "has_moderation_hook": has_moderation_hook,
-                "has_validation_warning": has_validation_warning,
-                "has_context_trace": has_context_trace,
-                "has_stage_trace": has_stage_trace,
-                "has_stage_trace_consistency": has_stage_trace_consistency,
-                "has_stage_trace_ordering": has_stage_trace_ordering,
-                "has_story_checklist_required_items": has_story_checklist_required_items,
-                "stage_trace_coverage_rate": stage_trace_coverage_rate,
-                "has_report_gate_pass": has_report_gate_pass,
-                "has_register_switch": has_register_switch,
-                "register_switch_rounds": run_register_switch_rounds,
-                "register_rule_counts": run_register_rule_counts,
-                "has_cross_inflow": has_cross_inflow,
-                "cross_inflow_events": run_cross_inflow_events,
-                "has_meme_flow": has_meme_flow,
-                "meme_flow_events": run_meme_flow_events,
-                "culture_dial_alignment_rate": culture_dial_alignment_rate,
-                "culture_weight_avg": culture_weight_avg,
-            }
-        )
-
     seed_runs = len(run_summaries)
     avg_stage_trace_coverage_rate = (
         float(round(stage_trace_coverage_sum / seed_runs, 4)) if seed_runs > 0 else 0.0
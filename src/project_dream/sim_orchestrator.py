@@ -1,7 +1,12 @@
+import os
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
 from project_dream.env_engine import apply_policy_transition, compute_culture_weight, compute_score
 from project_dream.gen_engine import generate_comment, pop_last_generation_trace, reset_last_generation_trace
-from project_dream.gate_pipeline import run_gates
-from project_dream.persona_service import apply_register_switch, render_voice, select_participants
+from project_dream.gate_pipeline import CompiledGatePolicy, compile_gate_policy, run_gates
+from project_dream.llm_client import build_default_llm_client, per_process_limit_env
+from project_dream.persona_service import resolve_voice, select_participants
 from project_dream.prompt_templates import render_prompt
 from typing import TypedDict
 
@@ -263,11 +268,8 @@ def _target_sort_tab_from_dial(seed) -> str:
     return _DIAL_AXIS_TO_SORT_TAB.get(_dominant_dial_axis(seed), "weekly_hot")
 
 
-def _score_template_for_dial(template: dict, *, seed, target_flow_id: str, dominant_axis: str) -> int:
+def _template_dial_score(template: dict, *, target_flow_id: str, dominant_axis: str) -> int:
     score = 0
-    intended_boards = _as_str_list(template.get("intended_boards"))
-    if seed.board_id in intended_boards:
-        score += 20
     if str(template.get("default_comment_flow", "")).strip() == target_flow_id:
         score += 100
     template_name = str(template.get("name", "")).strip()
@@ -277,32 +279,6 @@ def _score_template_for_dial(template: dict, *, seed, target_flow_id: str, domin
     return score
 
 
-def _select_template(seed, packs) -> tuple[str, str]:
-    if not packs or not packs.thread_templates:
-        return "T1", "P1"
-
-    sorted_templates = sorted(packs.thread_templates.values(), key=lambda x: x["id"])
-    board_candidates = [template for template in sorted_templates if seed.board_id in template.get("intended_boards", [])]
-    candidates = board_candidates or sorted_templates
-    dominant_axis = _dominant_dial_axis(seed)
-    target_flow_id = _target_flow_from_dial(seed)
-    best = sorted(
-        candidates,
-        key=lambda template: (
-            -_score_template_for_dial(
-                template,
-                seed=seed,
-                target_flow_id=target_flow_id,
-                dominant_axis=dominant_axis,
-            ),
-            str(template.get("id", "")),
-        ),
-    )
-    selected_template = best[0] if best else {"id": "T1", "default_comment_flow": "P1"}
-    flow_id = str(selected_template.get("default_comment_flow", "P1")).strip() or "P1"
-    return str(selected_template.get("id", "T1")), flow_id
-
-
 def _select_event_card_id(seed, packs) -> str:
     if not packs or not getattr(packs, "event_cards", None):
         return "EV-DEFAULT"
@@ -845,27 +821,102 @@ def _round_node_generate_comment(
     }
 
 
+def _resolve_generation_workers(generation_workers: int | None) -> int:
+    if generation_workers is None:
+        raw = os.environ.get("PROJECT_DREAM_GENERATION_WORKERS", "1")
+        try:
+            generation_workers = int(str(raw).strip() or "1")
+        except ValueError as exc:
+            raise ValueError(f"Invalid PROJECT_DREAM_GENERATION_WORKERS: {raw}") from exc
+    workers = max(1, int(generation_workers))
+    # More threads than the client admits at once would only queue on its semaphore.
+    max_concurrency = getattr(build_default_llm_client(), "max_concurrency", None)
+    if max_concurrency is not None:
+        workers = min(workers, int(max_concurrency))
+    return workers
+
+
+def _round_generation_kwargs(
+    *,
+    seed,
+    persona_id: str,
+    round_idx: int,
+    packs,
+    persona_memory: dict[str, list[str]],
+    status: str,
+    total_reports: int,
+    evidence_hours_left: int,
+    dial_dominant_axis: str,
+    round_meme_row: dict,
+    selected_title_pattern: str,
+    selected_trigger_tags: list[str],
+    template_taboos: list[str],
+    selected_body_sections: list[str],
+) -> dict:
+    memory_before = _memory_summary(persona_memory.get(persona_id, []))
+    voice_constraints = resolve_voice(
+        persona_id,
+        seed.zone_id,
+        packs=packs,
+        runtime_context={
+            "round_idx": round_idx,
+            "dial_dominant_axis": dial_dominant_axis,
+            "meme_phase": str(round_meme_row.get("phase", "")),
+            "status": status,
+            "total_reports": total_reports,
+            "evidence_hours_left": evidence_hours_left,
+        },
+    )
+    base_taboos = _as_str_list(voice_constraints.get("taboo_words"))
+    voice_constraints["taboo_words"] = _unique(base_taboos + template_taboos)
+    return {
+        "seed": seed,
+        "persona_id": persona_id,
+        "round_idx": round_idx,
+        "memory_before": memory_before,
+        "voice_constraints": voice_constraints,
+        "selected_title_pattern": selected_title_pattern,
+        "selected_trigger_tags": selected_trigger_tags,
+        "template_taboos": template_taboos,
+        "selected_body_sections": selected_body_sections,
+    }
+
+
+def _speculative_generations(jobs: list[dict], *, workers: int) -> list[tuple[dict, dict] | None]:
+    if workers <= 1 or len(jobs) <= 1:
+        return [None for _ in jobs]
+    with ThreadPoolExecutor(max_workers=min(workers, len(jobs))) as executor:
+        futures = [executor.submit(_round_node_generate_comment, **job) for job in jobs]
+    speculated: list[tuple[dict, dict] | None] = []
+    for job, future in zip(jobs, futures):
+        # A failed speculation is regenerated in order, so the error surfaces where it would sequentially.
+        speculated.append(None if future.exception() is not None else (job, future.result()))
+    return speculated
+
+
 def _round_node_gate_retry(
     *,
     text: str,
-    corpus: list[str],
+    corpus: Sequence[str],
     max_retries: int,
     forbidden_terms: list[str] | None = None,
     sensitivity_tags: list[str] | None = None,
     gate_policy: dict | None = None,
+    compiled_gate_policy: CompiledGatePolicy | None = None,
 ) -> dict:
     last = None
     total_failed_in_attempts = 0
     current_text = text
+    gate_kwargs: dict[str, object] = {}
+    if forbidden_terms:
+        gate_kwargs["forbidden_terms"] = list(forbidden_terms)
+    if sensitivity_tags:
+        gate_kwargs["sensitivity_tags"] = list(sensitivity_tags)
+    if gate_policy:
+        gate_kwargs["gate_policy"] = gate_policy
+        gate_kwargs["compiled_policy"] = compiled_gate_policy or compile_gate_policy(gate_policy)
 
     for _ in range(max_retries + 1):
-        gate_kwargs: dict[str, object] = {}
-        if forbidden_terms:
-            gate_kwargs["forbidden_terms"] = list(forbidden_terms)
-        if sensitivity_tags:
-            gate_kwargs["sensitivity_tags"] = list(sensitivity_tags)
-        if gate_policy:
-            gate_kwargs["gate_policy"] = dict(gate_policy)
         last = run_gates(current_text, corpus=corpus, **gate_kwargs)
         failed_in_attempt = [gate for gate in last["gates"] if not gate["passed"]]
         total_failed_in_attempts += len(failed_in_attempt)
@@ -1136,13 +1187,112 @@ def assemble_sim_result_from_stage_payloads(stage_payloads: SimulationStagePaylo
     }
 
 
+class SimulationTables:
+    """Pack-dependent selections shared by every seed simulated against the same packs.
+
+    Template dial scores are computed once per axis; selections keyed by board, zone, axis or
+    id are memoized on first use, so results match the per-seed `_select_*`/`_resolve_*` helpers.
+    """
+
+    def __init__(self, packs=None):
+        self.packs = packs
+        self._sorted_templates = (
+            sorted(packs.thread_templates.values(), key=lambda x: x["id"])
+            if packs and packs.thread_templates
+            else []
+        )
+        self._template_dial_scores = {
+            axis: [
+                _template_dial_score(
+                    template,
+                    target_flow_id=_DIAL_AXIS_TO_FLOW.get(axis, "P1"),
+                    dominant_axis=axis,
+                )
+                for template in self._sorted_templates
+            ]
+            for axis in _DIAL_AXIS_ORDER
+        }
+        raw_policy = getattr(packs, "gate_policy", None) if packs is not None else None
+        self.gate_policy: dict | None = dict(raw_policy) if isinstance(raw_policy, dict) else None
+        self.compiled_gate_policy: CompiledGatePolicy | None = (
+            compile_gate_policy(self.gate_policy) if self.gate_policy else None
+        )
+        self._memo: dict[tuple, object] = {}
+
+    def _cached(self, key: tuple, build):
+        try:
+            return self._memo[key]
+        except KeyError:
+            return self._memo.setdefault(key, build())
+
+    def community_id(self, seed) -> str:
+        return self._cached(("community", seed.board_id, seed.zone_id), lambda: _select_community_id(seed, self.packs))
+
+    def board_emotion(self, seed) -> str:
+        return self._cached(("emotion", seed.board_id), lambda: _resolve_board_emotion(seed, self.packs))
+
+    def event_card_id(self, seed) -> str:
+        return self._cached(("event_card", seed.board_id), lambda: _select_event_card_id(seed, self.packs))
+
+    def meme_seed_id(self, seed) -> str:
+        return self._cached(("meme_seed", seed.board_id), lambda: _select_meme_seed_id(seed, self.packs))
+
+    def template(self, seed) -> tuple[str, str]:
+        dominant_axis = _dominant_dial_axis(seed)
+        return self._cached(
+            ("template", seed.board_id, dominant_axis),
+            lambda: self._rank_template(seed.board_id, dominant_axis),
+        )
+
+    def _rank_template(self, board_id: str, dominant_axis: str) -> tuple[str, str]:
+        if not self._sorted_templates:
+            return "T1", "P1"
+        dial_scores = self._template_dial_scores[dominant_axis]
+        ranked = [
+            (
+                -(dial_scores[idx] + (20 if board_id in _as_str_list(template.get("intended_boards")) else 0)),
+                str(template.get("id", "")),
+                idx,
+            )
+            for idx, template in enumerate(self._sorted_templates)
+            if board_id in template.get("intended_boards", [])
+        ]
+        if not ranked:
+            ranked = [
+                (-dial_scores[idx], str(template.get("id", "")), idx)
+                for idx, template in enumerate(self._sorted_templates)
+            ]
+        selected_template = self._sorted_templates[min(ranked)[2]]
+        flow_id = str(selected_template.get("default_comment_flow", "P1")).strip() or "P1"
+        return str(selected_template.get("id", "T1")), flow_id
+
+    def template_context(self, template_id: str) -> dict:
+        return self._cached(("template_context", template_id), lambda: _resolve_template_context(self.packs, template_id))
+
+    def flow_context(self, flow_id: str) -> dict:
+        return self._cached(("flow_context", flow_id), lambda: _resolve_flow_context(self.packs, flow_id))
+
+    def meme_context(self, meme_seed_id: str) -> dict:
+        return self._cached(("meme_context", meme_seed_id), lambda: _resolve_meme_seed_context(self.packs, meme_seed_id))
+
+
 def run_simulation(
     seed,
     rounds: int,
-    corpus: list[str],
+    corpus: Sequence[str],
     max_retries: int = 2,
     packs=None,
+    compiled_gate_policy: CompiledGatePolicy | None = None,
+    generation_workers: int | None = None,
+    simulation_tables: SimulationTables | None = None,
 ) -> dict:
+    generation_workers = _resolve_generation_workers(generation_workers)
+    # One immutable corpus object per run lets the similarity gate reuse its index by identity.
+    corpus = tuple(corpus)
+    if simulation_tables is None:
+        simulation_tables = SimulationTables(packs)
+    elif simulation_tables.packs is not packs:
+        raise ValueError("simulation_tables were built for different packs")
     round_logs: list[dict] = []
     gate_logs: list[dict] = []
     action_logs: list[dict] = []
@@ -1150,12 +1300,12 @@ def run_simulation(
     meme_flow_logs: list[dict] = []
     moderation_decisions: list[dict] = []
     persona_memory: dict[str, list[str]] = {}
-    community_id = _select_community_id(seed, packs)
-    template_id, flow_id = _select_template(seed, packs)
-    event_card_id = _select_event_card_id(seed, packs)
-    meme_seed_id = _select_meme_seed_id(seed, packs)
-    template_context = _resolve_template_context(packs, template_id)
-    flow_context = _resolve_flow_context(packs, flow_id)
+    community_id = simulation_tables.community_id(seed)
+    template_id, flow_id = simulation_tables.template(seed)
+    event_card_id = simulation_tables.event_card_id(seed)
+    meme_seed_id = simulation_tables.meme_seed_id(seed)
+    template_context = simulation_tables.template_context(template_id)
+    flow_context = simulation_tables.flow_context(flow_id)
     cross_inflow_target_board = _select_cross_inflow_target_board(seed, template_context)
     thread_candidates = _build_thread_candidates(
         seed,
@@ -1177,7 +1327,7 @@ def run_simulation(
         flow_context.get("body_sections")
     )
     template_taboos = _as_str_list(template_context.get("taboos"))
-    board_emotion = _resolve_board_emotion(seed, packs)
+    board_emotion = simulation_tables.board_emotion(seed)
     dial_dominant_axis = _dominant_dial_axis(seed)
     dial_target_flow_id = _target_flow_from_dial(seed)
     dial_target_sort_tab = _target_sort_tab_from_dial(seed)
@@ -1185,7 +1335,7 @@ def run_simulation(
         board_emotion=board_emotion,
         dial_dominant_axis=dial_dominant_axis,
     )
-    meme_context = _resolve_meme_seed_context(packs, meme_seed_id)
+    meme_context = simulation_tables.meme_context(meme_seed_id)
     meme_decay_profile = _select_meme_decay_profile(
         dominant_axis=dial_dominant_axis,
         style_tags=_as_str_list(meme_context.get("style_tags")),
@@ -1197,11 +1347,9 @@ def run_simulation(
     meme_factory_board_id = _select_meme_factory_board(seed, meme_context, cross_inflow_target_board)
     seed_forbidden_terms = _as_str_list(getattr(seed, "forbidden_terms", []))
     seed_sensitivity_tags = _as_str_list(getattr(seed, "sensitivity_tags", []))
-    pack_gate_policy = None
-    if packs is not None:
-        raw_policy = getattr(packs, "gate_policy", None)
-        if isinstance(raw_policy, dict):
-            pack_gate_policy = dict(raw_policy)
+    pack_gate_policy = simulation_tables.gate_policy
+    if compiled_gate_policy is None:
+        compiled_gate_policy = simulation_tables.compiled_gate_policy
     raw_evidence_grade = str(getattr(seed, "evidence_grade", "B")).strip().upper()
     evidence_grade = raw_evidence_grade if raw_evidence_grade in {"A", "B", "C"} else "B"
     evidence_type = str(getattr(seed, "evidence_type", "log")).strip() or "log"
@@ -1235,41 +1383,55 @@ def run_simulation(
         )
         round_meme_row = round_meme_events[0] if round_meme_events else {}
         participants = select_participants(seed, round_idx=round_idx, packs=packs)[:3]
+        generation_context = {
+            "round_idx": round_idx,
+            "packs": packs,
+            "evidence_hours_left": evidence_hours_left,
+            "dial_dominant_axis": dial_dominant_axis,
+            "round_meme_row": round_meme_row,
+            "selected_title_pattern": selected_title_pattern,
+            "selected_trigger_tags": selected_trigger_tags,
+            "template_taboos": template_taboos,
+            "selected_body_sections": selected_body_sections,
+        }
+        # Speculate every participant against the round-start state; a result is only used when the
+        # in-order state produces the same generation inputs, so output matches the sequential path.
+        speculated = _speculative_generations(
+            [
+                _round_generation_kwargs(
+                    seed=seed,
+                    persona_id=persona_id,
+                    persona_memory=persona_memory,
+                    status=status,
+                    total_reports=total_reports,
+                    **generation_context,
+                )
+                for persona_id in participants
+            ]
+            if generation_workers > 1 and len(participants) > 1
+            else [],
+            workers=generation_workers,
+        )
 
         for idx, persona_id in enumerate(participants):
             account_type = account_type_cycle[idx % len(account_type_cycle)]
             verified = account_type == "public"
             sort_tab = dial_target_sort_tab
-            before_entries = persona_memory.get(persona_id, [])
-            memory_before = _memory_summary(before_entries)
-            voice_constraints = dict(render_voice(persona_id, seed.zone_id, packs=packs))
-            voice_constraints = apply_register_switch(
-                voice_constraints,
-                persona_id=persona_id,
-                packs=packs,
-                runtime_context={
-                    "round_idx": round_idx,
-                    "dial_dominant_axis": dial_dominant_axis,
-                    "meme_phase": str(round_meme_row.get("phase", "")),
-                    "status": status,
-                    "total_reports": total_reports,
-                    "evidence_hours_left": evidence_hours_left,
-                },
-            )
-            base_taboos = _as_str_list(voice_constraints.get("taboo_words"))
-            voice_constraints["taboo_words"] = _unique(base_taboos + template_taboos)
-
-            generated = _round_node_generate_comment(
+            generation_kwargs = _round_generation_kwargs(
                 seed=seed,
                 persona_id=persona_id,
-                round_idx=round_idx,
-                memory_before=memory_before,
-                voice_constraints=voice_constraints,
-                selected_title_pattern=selected_title_pattern,
-                selected_trigger_tags=selected_trigger_tags,
-                template_taboos=template_taboos,
-                selected_body_sections=selected_body_sections,
+                persona_memory=persona_memory,
+                status=status,
+                total_reports=total_reports,
+                **generation_context,
             )
+            memory_before = str(generation_kwargs["memory_before"])
+            voice_constraints = generation_kwargs["voice_constraints"]
+            speculation = speculated[idx] if idx < len(speculated) else None
+            if speculation is not None and speculation[0] == generation_kwargs:
+                generated = speculation[1]
+            else:
+                generated = _round_node_generate_comment(**generation_kwargs)
             gated = _round_node_gate_retry(
                 text=str(generated["text"]),
                 corpus=corpus,
@@ -1277,6 +1439,7 @@ def run_simulation(
                 forbidden_terms=seed_forbidden_terms,
                 sensitivity_tags=seed_sensitivity_tags,
                 gate_policy=pack_gate_policy,
+                compiled_gate_policy=compiled_gate_policy,
             )
             transitioned = _round_node_policy_transition(
                 round_idx=round_idx,
@@ -1471,3 +1634,55 @@ def run_simulation(
         },
     }
     return assemble_sim_result_from_stage_payloads(stage_payloads)
+
+
+_BATCH_WORKER_STATE: dict = {}
+
+
+def _init_simulation_batch_worker(packs, run_kwargs: dict, limit_env: dict[str, str]) -> None:
+    os.environ.update(limit_env)
+    _BATCH_WORKER_STATE["packs"] = packs
+    _BATCH_WORKER_STATE["simulation_tables"] = SimulationTables(packs)
+    _BATCH_WORKER_STATE["run_kwargs"] = run_kwargs
+
+
+def _run_simulation_batch_job(seed) -> dict:
+    return run_simulation(
+        seed=seed,
+        packs=_BATCH_WORKER_STATE["packs"],
+        simulation_tables=_BATCH_WORKER_STATE["simulation_tables"],
+        **_BATCH_WORKER_STATE["run_kwargs"],
+    )
+
+
+def run_simulation_batch(
+    seeds: Sequence,
+    rounds: int,
+    corpus: Sequence[str],
+    max_retries: int = 2,
+    packs=None,
+    generation_workers: int | None = None,
+    workers: int = 1,
+) -> list[dict]:
+    """Simulate many seeds against one packs object; results match per-seed `run_simulation` calls."""
+    if workers < 1:
+        raise ValueError("workers must be >= 1")
+    run_kwargs = {
+        "rounds": rounds,
+        "corpus": tuple(corpus),
+        "max_retries": max_retries,
+        "generation_workers": _resolve_generation_workers(generation_workers),
+    }
+    if workers == 1 or len(seeds) <= 1:
+        simulation_tables = SimulationTables(packs)
+        return [
+            run_simulation(seed=seed, packs=packs, simulation_tables=simulation_tables, **run_kwargs)
+            for seed in seeds
+        ]
+    processes = min(workers, len(seeds))
+    with ProcessPoolExecutor(
+        max_workers=processes,
+        initializer=_init_simulation_batch_worker,
+        initargs=(packs, run_kwargs, per_process_limit_env(processes)),
+    ) as executor:
+        return list(executor.map(_run_simulation_batch_job, seeds, chunksize=max(1, len(seeds) // (workers * 4))))
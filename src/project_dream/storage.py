@@ -1,8 +1,173 @@
 import json
+from collections.abc import Iterator
 from datetime import UTC, datetime
 from pathlib import Path
 from uuid import uuid4
 
+RUNLOG_INDEX_SCHEMA_VERSION = "runlog_index.v1"
+
+
+def _runlog_round_key(row: dict) -> int | None:
+    try:
+        return int(row.get("round"))
+    except (TypeError, ValueError):
+        return None
+
+
+class _RunlogWriter:
+    """Writes runlog rows and records each row's byte span by type and round."""
+
+    def __init__(self, fp):
+        self._fp = fp
+        self._offset = 0
+        self._types: dict[str, list[list[int]]] = {}
+        self._rounds: dict[str, list[list[int]]] = {}
+
+    def write(self, row: dict) -> None:
+        raw = (json.dumps(row, ensure_ascii=False) + "\n").encode("utf-8")
+        self._fp.write(raw)
+        span = [self._offset, len(raw)]
+        self._offset += len(raw)
+        self._types.setdefault(str(row.get("type", "")), []).append(span)
+        round_key = _runlog_round_key(row)
+        if round_key is not None:
+            self._rounds.setdefault(str(round_key), []).append(span)
+
+    def index(self, mtime_ns: int) -> dict:
+        return {
+            "schema_version": RUNLOG_INDEX_SCHEMA_VERSION,
+            "size": self._offset,
+            "mtime_ns": mtime_ns,
+            "types": self._types,
+            "rounds": self._rounds,
+        }
+
+
+def load_runlog_index(run_dir: Path) -> dict | None:
+    """Return the sidecar index when it still matches runlog.jsonl, else None."""
+    index_path = run_dir / "runlog.index.json"
+    runlog_path = run_dir / "runlog.jsonl"
+    try:
+        index = json.loads(index_path.read_text(encoding="utf-8"))
+        runlog_stat = runlog_path.stat()
+    except (OSError, json.JSONDecodeError):
+        return None
+    if not isinstance(index, dict) or index.get("schema_version") != RUNLOG_INDEX_SCHEMA_VERSION:
+        return None
+    if index.get("size") != runlog_stat.st_size or index.get("mtime_ns") != runlog_stat.st_mtime_ns:
+        return None
+    return index
+
+
+def _indexed_spans(
+    index: dict,
+    *,
+    row_types: set[str] | None,
+    round_from: int | None,
+    round_to: int | None,
+) -> list[tuple[int, int]]:
+    spans: set[tuple[int, int]] | None = None
+    if row_types:
+        spans = {
+            (int(offset), int(length))
+            for row_type in row_types
+            for offset, length in index.get("types", {}).get(row_type, [])
+        }
+    if round_from is not None or round_to is not None:
+        round_spans = {
+            (int(offset), int(length))
+            for round_key, rows in index.get("rounds", {}).items()
+            if (round_from is None or int(round_key) >= round_from)
+            and (round_to is None or int(round_key) <= round_to)
+            for offset, length in rows
+        }
+        spans = round_spans if spans is None else spans & round_spans
+    return sorted(spans or ())
+
+
+def _row_in_round_range(row: dict, round_from: int | None, round_to: int | None) -> bool:
+    if round_from is None and round_to is None:
+        return True
+    round_no = _runlog_round_key(row)
+    if round_no is None:
+        return False
+    if round_from is not None and round_no < round_from:
+        return False
+    if round_to is not None and round_no > round_to:
+        return False
+    return True
+
+
+def check_runlog_cursor(path: Path, cursor: int) -> None:
+    if not cursor:
+        return
+    with path.open("rb") as fp:
+        fp.seek(cursor - 1)
+        if fp.read(1) != b"\n":
+            raise ValueError(f"Invalid cursor: {cursor}")
+
+
+def iter_runlog_rows(
+    run_dir: Path,
+    *,
+    row_types: set[str] | None = None,
+    round_from: int | None = None,
+    round_to: int | None = None,
+    cursor: int = 0,
+) -> Iterator[tuple[int, dict]]:
+    """Yield ``(next_cursor, row)`` in file order; the cursor is the byte offset after the row.
+
+    Filtered reads seek straight to the matching rows when ``runlog.index.json`` is current.
+    """
+    path = run_dir / "runlog.jsonl"
+    check_runlog_cursor(path, cursor)
+    filtered = bool(row_types) or round_from is not None or round_to is not None
+    index = load_runlog_index(run_dir) if filtered else None
+    with path.open("rb") as fp:
+        if index is not None:
+            for offset, length in _indexed_spans(
+                index,
+                row_types=row_types,
+                round_from=round_from,
+                round_to=round_to,
+            ):
+                if offset < cursor:
+                    continue
+                fp.seek(offset)
+                yield offset + length, json.loads(fp.read(length))
+            return
+
+        fp.seek(cursor)
+        position = cursor
+        for raw in fp:
+            position += len(raw)
+            if not raw.strip():
+                continue
+            row = json.loads(raw)
+            if row_types and str(row.get("type", "")) not in row_types:
+                continue
+            if not _row_in_round_range(row, round_from, round_to):
+                continue
+            yield position, row
+
+
+def read_runlog_rows(
+    run_dir: Path,
+    *,
+    row_types: set[str] | None = None,
+    round_from: int | None = None,
+    round_to: int | None = None,
+) -> list[dict]:
+    return [
+        row
+        for _, row in iter_runlog_rows(
+            run_dir,
+            row_types=row_types,
+            round_from=round_from,
+            round_to=round_to,
+        )
+    ]
+
 
 def render_report_markdown(report: dict) -> str:
     lines = [
@@ -63,51 +228,48 @@ def persist_run(output_dir: Path, sim_result: dict, report: dict) -> Path:
         pack_manifest_payload = None
     pack_fingerprint = str(sim_result.get("pack_fingerprint", "")).strip() or None
 
-    with (run_dir / "runlog.jsonl").open("w", encoding="utf-8") as fp:
+    with (run_dir / "runlog.jsonl").open("wb") as fp:
+        writer = _RunlogWriter(fp)
         context_bundle = sim_result.get("context_bundle")
         if context_bundle is not None:
-            fp.write(
-                json.dumps(
-                    {
-                        "type": "context",
-                        "bundle": context_bundle,
-                        "corpus": sim_result.get("context_corpus", []),
-                        "seed": seed_payload if isinstance(seed_payload, dict) else None,
-                        "pack_manifest": pack_manifest_payload,
-                        "pack_fingerprint": pack_fingerprint,
-                    },
-                    ensure_ascii=False,
-                )
-                + "\n"
+            writer.write(
+                {
+                    "type": "context",
+                    "bundle": context_bundle,
+                    "corpus": sim_result.get("context_corpus", []),
+                    "seed": seed_payload if isinstance(seed_payload, dict) else None,
+                    "pack_manifest": pack_manifest_payload,
+                    "pack_fingerprint": pack_fingerprint,
+                }
             )
 
         for row in sim_result.get("thread_candidates", []):
-            fp.write(json.dumps({"type": "thread_candidate", **row}, ensure_ascii=False) + "\n")
+            writer.write({"type": "thread_candidate", **row})
 
         selected_thread = sim_result.get("selected_thread")
         if selected_thread is not None:
-            fp.write(json.dumps({"type": "thread_selected", **selected_thread}, ensure_ascii=False) + "\n")
+            writer.write({"type": "thread_selected", **selected_thread})
 
         for row in sim_result["rounds"]:
-            fp.write(json.dumps({"type": "round", **row}, ensure_ascii=False) + "\n")
+            writer.write({"type": "round", **row})
         for row in sim_result.get("gate_logs", []):
-            fp.write(json.dumps({"type": "gate", **row}, ensure_ascii=False) + "\n")
+            writer.write({"type": "gate", **row})
         for row in sim_result.get("action_logs", []):
-            fp.write(json.dumps({"type": "action", **row}, ensure_ascii=False) + "\n")
+            writer.write({"type": "action", **row})
         for row in sim_result.get("cross_inflow_logs", []):
-            fp.write(json.dumps({"type": "cross_inflow", **row}, ensure_ascii=False) + "\n")
+            writer.write({"type": "cross_inflow", **row})
         for row in sim_result.get("meme_flow_logs", []):
-            fp.write(json.dumps({"type": "meme_flow", **row}, ensure_ascii=False) + "\n")
+            writer.write({"type": "meme_flow", **row})
 
         for row in sim_result.get("round_summaries", []):
-            fp.write(json.dumps({"type": "round_summary", **row}, ensure_ascii=False) + "\n")
+            writer.write({"type": "round_summary", **row})
 
         for row in sim_result.get("moderation_decisions", []):
-            fp.write(json.dumps({"type": "moderation_decision", **row}, ensure_ascii=False) + "\n")
+            writer.write({"type": "moderation_decision", **row})
 
         end_condition = sim_result.get("end_condition")
         if end_condition is not None:
-            fp.write(json.dumps({"type": "end_condition", **end_condition}, ensure_ascii=False) + "\n")
+            writer.write({"type": "end_condition", **end_condition})
 
         graph_node_trace = sim_result.get("graph_node_trace")
         if isinstance(graph_node_trace, dict):
@@ -120,51 +282,47 @@ def persist_run(output_dir: Path, sim_result: dict, report: dict) -> Path:
                 for row in nodes:
                     if not isinstance(row, dict):
                         continue
-                    fp.write(
-                        json.dumps(
-                            {
-                                "type": "graph_node",
-                                "schema_version": trace_schema_version,
-                                "backend": trace_backend,
-                                **row,
-                            },
-                            ensure_ascii=False,
-                        )
-                        + "\n"
+                    writer.write(
+                        {
+                            "type": "graph_node",
+                            "schema_version": trace_schema_version,
+                            "backend": trace_backend,
+                            **row,
+                        }
                     )
             if isinstance(node_attempts, dict):
                 for node_id, raw_attempts in node_attempts.items():
                     attempts = int(raw_attempts) if isinstance(raw_attempts, int) else 0
-                    fp.write(
-                        json.dumps(
-                            {
-                                "type": "graph_node_attempt",
-                                "schema_version": trace_schema_version,
-                                "backend": trace_backend,
-                                "node_id": str(node_id),
-                                "attempts": max(0, attempts),
-                            },
-                            ensure_ascii=False,
-                        )
-                        + "\n"
+                    writer.write(
+                        {
+                            "type": "graph_node_attempt",
+                            "schema_version": trace_schema_version,
+                            "backend": trace_backend,
+                            "node_id": str(node_id),
+                            "attempts": max(0, attempts),
+                        }
                     )
             if isinstance(stage_checkpoints, list):
                 for row in stage_checkpoints:
                     if not isinstance(row, dict):
                         continue
-                    fp.write(
-                        json.dumps(
-                            {
-                                "type": "stage_checkpoint",
-                                "schema_version": trace_schema_version,
-                                "backend": trace_backend,
-                                **row,
-                            },
-                            ensure_ascii=False,
-                        )
-                        + "\n"
+                    writer.write(
+                        {
+                            "type": "stage_checkpoint",
+                            "schema_version": trace_schema_version,
+                            "backend": trace_backend,
+                            **row,
+                        }
                     )
 
+    (run_dir / "runlog.index.json").write_text(
+        json.dumps(
+            writer.index((run_dir / "runlog.jsonl").stat().st_mtime_ns),
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ),
+        encoding="utf-8",
+    )
     (run_dir / "report.json").write_text(
         json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8"
     )
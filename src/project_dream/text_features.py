@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import hashlib
+import re
+
+
+_TOKEN_PATTERN = re.compile(r"[0-9A-Za-z가-힣_]+")
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def term_freq(tokens: list[str]) -> dict[str, int]:
+    counts: dict[str, int] = {}
+    for token in tokens:
+        counts[token] = counts.get(token, 0) + 1
+    return counts
+
+
+def normalize_dense_text(text: str) -> str:
+    return "".join(tokenize(text))
+
+
+def char_ngrams(text: str, n: int = 2) -> dict[str, float]:
+    return char_ngrams_of_normalized(normalize_dense_text(text), n=n)
+
+
+def char_ngrams_of_normalized(normalized: str, n: int = 2) -> dict[str, float]:
+    if not normalized:
+        return {}
+    if len(normalized) <= n:
+        return {normalized: 1.0}
+    counts: dict[str, float] = {}
+    for idx in range(0, len(normalized) - n + 1):
+        gram = normalized[idx : idx + n]
+        counts[gram] = counts.get(gram, 0.0) + 1.0
+    return counts
+
+
+def text_digest(text: str) -> bytes:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
@@ -29,6 +29,7 @@ def test_simulate_and_persist_passes_retrieved_corpus(
         max_retries=2,
         packs=None,
         backend="manual",
+        generation_workers=None,
     ):
         captured["seed_id"] = seed.seed_id
         captured["rounds"] = rounds
@@ -96,6 +97,7 @@ def test_simulate_and_persist_merges_ingested_corpus(
         max_retries=2,
         packs=None,
         backend="manual",
+        generation_workers=None,
     ):
         captured["corpus"] = list(corpus)
         captured["backend"] = backend
@@ -173,6 +175,7 @@ def test_simulate_and_persist_forwards_orchestrator_backend(
         max_retries=2,
         packs=None,
         backend="manual",
+        generation_workers=None,
     ):
         captured["backend"] = backend
         return {
@@ -234,6 +237,7 @@ def test_simulate_and_persist_forwards_vector_backend_to_build_index(
         max_retries=2,
         packs=None,
         backend="manual",
+        generation_workers=None,
     ):
         return {
             "rounds": [],
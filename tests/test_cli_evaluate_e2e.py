@@ -1,4 +1,5 @@
 import json
+import sqlite3
 from pathlib import Path
 
 from project_dream.cli import main
@@ -151,3 +152,100 @@ def test_cli_simulate_evaluate_eval_export_with_sqlite_backend(tmp_path: Path):
 
     eval_files = list(runs_dir.glob("*/eval.json"))
     assert eval_files
+
+
+def _simulate_seeds(tmp_path: Path, runs_dir: Path, count: int, *extra: str) -> None:
+    for idx in range(count):
+        seed_file = tmp_path / f"seed_bulk_{idx}.json"
+        seed_file.write_text(
+            json.dumps(
+                {
+                    "seed_id": f"SEED-BULK-{idx}",
+                    "title": f"일괄 평가 {idx}",
+                    "summary": "evaluate-all 검증",
+                    "board_id": "B07",
+                    "zone_id": "D",
+                }
+            ),
+            encoding="utf-8",
+        )
+        rc = main(
+            [
+                "simulate",
+                "--seed",
+                str(seed_file),
+                "--output-dir",
+                str(runs_dir),
+                "--rounds",
+                "3",
+                *extra,
+            ]
+        )
+        assert rc == 0
+
+
+def test_cli_evaluate_all_skips_current_evals_unless_forced(tmp_path: Path, capsys):
+    runs_dir = tmp_path / "runs"
+    _simulate_seeds(tmp_path, runs_dir, 2)
+    capsys.readouterr()
+
+    rc = main(["evaluate-all", "--runs-dir", str(runs_dir), "--metric-set", "v2", "--batch-size", "1"])
+    assert rc == 0
+    captured = capsys.readouterr()
+    stats = json.loads(captured.out)
+    assert stats["total"] == 2
+    assert stats["evaluated"] == 2
+    assert stats["skipped"] == 0
+    assert stats["failed"] == []
+    assert captured.err.count("[evaluate-all]") == 2
+    for path in runs_dir.glob("*/eval.json"):
+        assert json.loads(path.read_text(encoding="utf-8"))["metric_set"] == "v2"
+
+    rc = main(["evaluate-all", "--runs-dir", str(runs_dir), "--metric-set", "v2"])
+    assert rc == 0
+    stats = json.loads(capsys.readouterr().out)
+    assert stats["evaluated"] == 0
+    assert stats["skipped"] == 2
+
+    rc = main(["evaluate-all", "--runs-dir", str(runs_dir), "--metric-set", "v1"])
+    assert rc == 0
+    assert json.loads(capsys.readouterr().out)["evaluated"] == 2
+
+    rc = main(["evaluate-all", "--runs-dir", str(runs_dir), "--metric-set", "v1", "--force", "--seed-id", "SEED-BULK-0"])
+    assert rc == 0
+    stats = json.loads(capsys.readouterr().out)
+    assert stats["total"] == 1
+    assert stats["evaluated"] == 1
+
+
+def test_cli_evaluate_all_updates_sqlite_eval_pass(tmp_path: Path, capsys):
+    runs_dir = tmp_path / "runs"
+    sqlite_db_path = tmp_path / "runs-index.sqlite3"
+    backend = ["--repo-backend", "sqlite", "--sqlite-db-path", str(sqlite_db_path)]
+    _simulate_seeds(tmp_path, runs_dir, 2, *backend)
+    capsys.readouterr()
+
+    rc = main(["evaluate-all", "--runs-dir", str(runs_dir), "--workers", "2", *backend])
+    assert rc == 0
+    stats = json.loads(capsys.readouterr().out)
+    assert stats["evaluated"] == 2
+
+    with sqlite3.connect(sqlite_db_path) as conn:
+        rows = conn.execute("SELECT run_id, eval_pass FROM runs ORDER BY run_id").fetchall()
+    assert len(rows) == 2
+    for run_id, eval_pass in rows:
+        payload = json.loads((runs_dir / run_id / "eval.json").read_text(encoding="utf-8"))
+        assert eval_pass == int(payload["pass_fail"])
+
+
+def test_evaluate_all_pages_runs_by_cursor(tmp_path: Path):
+    from project_dream.app_service import _list_all_run_dirs
+    from project_dream.infra.store import FileRunRepository, SQLiteRunRepository
+
+    runs_dir = tmp_path / "runs"
+    sqlite_db_path = tmp_path / "runs-index.sqlite3"
+    _simulate_seeds(tmp_path, runs_dir, 3, "--repo-backend", "sqlite", "--sqlite-db-path", str(sqlite_db_path))
+
+    for repository in (FileRunRepository(runs_dir), SQLiteRunRepository(runs_dir, db_path=sqlite_db_path)):
+        run_dirs = _list_all_run_dirs(repository, page_size=2)
+        assert sorted(run_dirs) == sorted(path.parent for path in runs_dir.glob("*/runlog.jsonl"))
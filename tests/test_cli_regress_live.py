@@ -81,6 +81,8 @@ def test_cli_regress_live_temporarily_overrides_llm_env(monkeypatch: pytest.Monk
     assert seen["kwargs"]["corpus_dir"] == Path("corpus")
     assert seen["kwargs"]["vector_backend"] == "memory"
     assert seen["kwargs"]["vector_db_path"] is None
+    assert seen["kwargs"]["workers"] == 1
+    assert seen["kwargs"]["generation_workers"] is None
 
     assert cli.os.environ.get("PROJECT_DREAM_LLM_PROVIDER") == "echo"
     assert cli.os.environ.get("PROJECT_DREAM_LLM_MODEL") == "old-model"
@@ -88,6 +90,32 @@ def test_cli_regress_live_temporarily_overrides_llm_env(monkeypatch: pytest.Monk
     assert cli.os.environ.get("PROJECT_DREAM_LLM_TIMEOUT_SEC") == "99"
 
 
+def test_cli_regress_live_passes_generation_workers(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    seen = {}
+
+    def fake_run_regression_batch(**kwargs):
+        seen.update(kwargs)
+        return _summary()
+
+    monkeypatch.setattr(cli, "run_regression_batch", fake_run_regression_batch)
+    rc = cli.main(
+        [
+            "regress-live",
+            "--workers",
+            "2",
+            "--generation-workers",
+            "3",
+            "--update-baseline",
+            "--baseline-file",
+            str(tmp_path / "baseline.json"),
+        ]
+    )
+
+    assert rc == 0
+    assert seen["workers"] == 2
+    assert seen["generation_workers"] == 3
+
+
 def test_cli_regress_live_returns_nonzero_when_regression_fails(monkeypatch: pytest.MonkeyPatch):
     monkeypatch.setattr(cli, "run_regression_batch", lambda **kwargs: _summary(pass_fail=False))
     rc = cli.main(["regress-live"])
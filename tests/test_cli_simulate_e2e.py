@@ -147,3 +147,60 @@ def test_cli_simulate_fails_when_pack_manifest_checksum_mismatches(tmp_path: Pat
         )
 
     assert "checksum mismatch" in str(exc.value)
+
+
+def test_cli_simulate_dial_sweep_prints_table_and_persists_interesting_runs(
+    tmp_path: Path, capsys: pytest.CaptureFixture
+):
+    seed_file = tmp_path / "seed.json"
+    seed_file.write_text(
+        json.dumps(
+            {
+                "seed_id": "SEED-SWEEP-001",
+                "title": "다이얼 스윕",
+                "summary": "같은 시드를 다이얼만 바꿔 돌린다",
+                "board_id": "B07",
+                "zone_id": "D",
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    rc = main(
+        [
+            "simulate",
+            "--seed",
+            str(seed_file),
+            "--output-dir",
+            str(tmp_path / "runs"),
+            "--rounds",
+            "3",
+            "--sweep-step",
+            "50",
+            "--workers",
+            "2",
+            "--sweep-persist",
+            "interesting",
+        ]
+    )
+
+    assert rc == 0
+    summary = json.loads(capsys.readouterr().out)
+    rows = summary["rows"]
+    assert summary["variants"] == len(rows) == 16
+    assert rows[0]["dial"] == {"U": 30, "E": 25, "M": 15, "S": 15, "H": 15}
+    assert rows[0]["interesting"] is False
+    assert {row["target_flow_id"] for row in rows} > {rows[0]["target_flow_id"]}
+    assert set(rows[0]) >= {"termination_reason", "ended_round", "total_reports", "culture_weight", "status"}
+
+    persisted = [row for row in rows if row["run_id"]]
+    assert summary["persisted"] == len(persisted) == summary["interesting"]
+    assert all(row["interesting"] for row in persisted)
+    assert sorted(path.name for path in (tmp_path / "runs").iterdir() if path.is_dir()) == sorted(
+        row["run_id"] for row in persisted
+    )
+
+
+def test_cli_simulate_rejects_workers_without_sweep(tmp_path: Path):
+    with pytest.raises(SystemExit):
+        main(["simulate", "--seed", str(tmp_path / "seed.json"), "--workers", "2"])
@@ -1,7 +1,14 @@
 import json
 from pathlib import Path
 
-from project_dream.data_ingest import build_corpus_from_packs, load_corpus_texts
+import pytest
+
+import project_dream.data_ingest as data_ingest
+import project_dream.kb_index as kb_index
+from project_dream.corpus_artifacts import CORPUS_ARTIFACT_SCHEMA_VERSION, corpus_artifact_path, load_corpus_artifact
+from project_dream.data_ingest import build_corpus_from_packs, iter_corpus_rows, load_corpus_texts
+from project_dream.kb_index import build_index
+from project_dream.pack_service import load_packs
 
 
 REQUIRED_ROW_KEYS = {
@@ -94,3 +101,129 @@ def test_load_corpus_texts_reads_reference_and_refined(tmp_path: Path):
 
 def test_load_corpus_texts_returns_empty_when_missing_dir(tmp_path: Path):
     assert load_corpus_texts(tmp_path / "missing-corpus") == []
+
+
+def test_iter_corpus_rows_streams_with_source_and_board_filters(tmp_path: Path):
+    corpus_dir = tmp_path / "corpus"
+    build_corpus_from_packs(packs_dir=Path("packs"), corpus_dir=corpus_dir)
+
+    rows = iter_corpus_rows(corpus_dir, ("refined",), board_ids={"B07"})
+    assert not isinstance(rows, list)
+    collected = list(rows)
+    assert collected
+    assert all(row["source_type"] == "refined" and row["board_id"] == "B07" for row in collected)
+
+
+def test_corpus_texts_are_parsed_once_and_kb_index_streams_rows(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    corpus_dir = tmp_path / "corpus"
+    build_corpus_from_packs(packs_dir=Path("packs"), corpus_dir=corpus_dir)
+    data_ingest.clear_corpus_cache()
+
+    parsed: list[str] = []
+    original_iter_jsonl = data_ingest._iter_jsonl
+
+    def counting_iter_jsonl(path: Path):
+        parsed.append(path.name)
+        return original_iter_jsonl(path)
+
+    monkeypatch.setattr(data_ingest, "_iter_jsonl", counting_iter_jsonl)
+
+    first = load_corpus_texts(corpus_dir)
+    assert sorted(parsed) == ["reference.jsonl", "refined.jsonl"]
+    parsed.clear()
+
+    build_index(load_packs(Path("packs")), corpus_dir)
+    assert sorted(parsed) == ["generated.jsonl", "reference.jsonl", "refined.jsonl"]
+    assert len(data_ingest._SEGMENTS) == 2
+    parsed.clear()
+
+    assert load_corpus_texts(corpus_dir) == first
+    assert parsed == []
+
+    with (corpus_dir / "generated.jsonl").open("a", encoding="utf-8") as fp:
+        fp.write(json.dumps({"doc_id": "G-1", "text": first[0]}, ensure_ascii=False) + "\n")
+    assert load_corpus_texts(corpus_dir, ("reference", "refined", "generated")) == first
+    assert parsed == ["generated.jsonl"]
+
+
+def test_corpus_segment_cache_keeps_distinct_texts_per_board(tmp_path: Path):
+    data_ingest.clear_corpus_cache()
+    corpus_dir = tmp_path / "corpus"
+    corpus_dir.mkdir()
+    rows = [
+        {"doc_id": "R-1", "board_id": "B01", "text": "same text"},
+        {"doc_id": "R-2", "board_id": "B01", "text": "same text"},
+        {"doc_id": "R-3", "board_id": "B02", "text": "same text"},
+        {"doc_id": "R-4", "board_id": "B02", "text": "  "},
+        {"doc_id": "R-5", "board_id": "B02", "text": "other text"},
+    ]
+    (corpus_dir / "reference.jsonl").write_text("".join(json.dumps(row) + "\n" for row in rows), encoding="utf-8")
+
+    assert load_corpus_texts(corpus_dir, ("reference",)) == ["same text", "other text"]
+    assert load_corpus_texts(corpus_dir, ("reference",), board_ids={"B02"}) == ["same text", "other text"]
+    (segment,) = data_ingest._SEGMENTS.values()
+    assert [board_id for board_id, _ in segment.texts] == ["B01", "B02", "B02"]
+    assert segment.texts[0][1] is segment.texts[1][1]
+
+
+def test_corpus_text_store_releases_texts_of_dropped_segments(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(data_ingest, "_MAX_CACHED_SEGMENTS", 1)
+    data_ingest.clear_corpus_cache()
+    first_dir = tmp_path / "first"
+    second_dir = tmp_path / "second"
+    for corpus_dir, label in ((first_dir, "first"), (second_dir, "second")):
+        corpus_dir.mkdir()
+        rows = [{"doc_id": f"{label}-{idx}", "text": f"{label} text {idx}"} for idx in range(3)]
+        rows.append({"doc_id": f"{label}-shared", "text": "shared text"})
+        (corpus_dir / "reference.jsonl").write_text(
+            "".join(json.dumps(row) + "\n" for row in rows),
+            encoding="utf-8",
+        )
+
+    assert len(load_corpus_texts(first_dir, ("reference",))) == 4
+    assert len(data_ingest._TEXT_STORE) == 4
+    assert len(load_corpus_texts(second_dir, ("reference",))) == 4
+    assert len(data_ingest._SEGMENTS) == 1
+    assert len(data_ingest._TEXT_STORE) == 4
+
+    (second_dir / "reference.jsonl").write_text(json.dumps({"doc_id": "x", "text": "rewritten"}) + "\n", encoding="utf-8")
+    assert load_corpus_texts(second_dir, ("reference",)) == ["rewritten"]
+    assert len(data_ingest._TEXT_STORE) == 1
+
+    data_ingest.clear_corpus_cache()
+    assert len(data_ingest._TEXT_STORE) == 0
+
+
+def test_ingest_writes_feature_artifacts_consumed_by_build_index(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    corpus_dir = tmp_path / "corpus"
+    summary = build_corpus_from_packs(packs_dir=Path("packs"), corpus_dir=corpus_dir)
+    data_ingest.clear_corpus_cache()
+
+    artifact = summary["artifacts"]["reference"]
+    assert artifact["schema_version"] == CORPUS_ARTIFACT_SCHEMA_VERSION
+    assert artifact["row_count"] == summary["reference_count"]
+    reference_path = corpus_dir / "reference.jsonl"
+    features = load_corpus_artifact(reference_path, corpus_artifact_path(corpus_dir, "reference"))
+    assert features is not None
+    first_text = _read_jsonl(reference_path)[0]["text"].strip()
+    fields = features.kb_fields(0)
+    assert fields["_tokens"] == kb_index._tokenize(first_text)
+    assert fields["_dense_vector"] == kb_index._char_ngrams(first_text, n=2)
+
+    analyzed: list[str] = []
+    original_analyze = kb_index._analyze_passage
+
+    def tracking_analyze(row: dict) -> None:
+        analyzed.append(str(row.get("kind")))
+        original_analyze(row)
+
+    monkeypatch.setattr(kb_index, "_analyze_passage", tracking_analyze)
+    index = build_index(load_packs(Path("packs")), corpus_dir)
+    assert "corpus" not in analyzed
+    assert any(row["kind"] == "corpus" and row["_token_tf"] for row in index["passages"])
+
+    reference_path.write_text(reference_path.read_text(encoding="utf-8") + "\n", encoding="utf-8")
+    assert load_corpus_artifact(reference_path, corpus_artifact_path(corpus_dir, "reference")) is None
+    analyzed.clear()
+    build_index(load_packs(Path("packs")), corpus_dir)
+    assert "corpus" in analyzed
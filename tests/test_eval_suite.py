@@ -1,7 +1,10 @@
 import json
 from pathlib import Path
 
-from project_dream.eval_suite import evaluate_run
+import pytest
+
+import project_dream.eval_suite as eval_suite
+from project_dream.eval_suite import RunlogView, evaluate_run
 
 
 def _write_valid_run(run_dir: Path) -> None:
@@ -224,3 +227,45 @@ def test_evaluate_run_fails_when_stage_trace_ordering_is_invalid(tmp_path: Path)
         c["name"] == "runlog.stage_trace_ordering" and c["passed"] is False
         for c in result["checks"]
     )
+
+
+def test_runlog_view_groups_rows_by_type():
+    rows = [
+        {"type": "context"},
+        {"type": "round", "round": 1},
+        {"type": "gate", "round": 1},
+        {"type": "round", "round": 2},
+        {"round": "bad"},
+        {"type": 7},
+    ]
+    view = RunlogView.from_rows(rows)
+
+    assert view.count("round") == 2
+    assert view.first_index("round") == 1
+    assert view.last_index("round") == 3
+    assert view.last_index("missing") is None
+    assert view.round_ids("round") == [1, 2]
+    assert view.of_type("7") == [rows[5]]
+    assert view.first_index("7") == 5
+
+
+def test_evaluate_run_uses_registered_metric_set(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(eval_suite, "METRIC_SET_REGISTRY", dict(eval_suite.METRIC_SET_REGISTRY))
+    seen: list[RunlogView] = []
+
+    def round_count_metrics(view: RunlogView, report: dict) -> dict[str, float]:
+        seen.append(view)
+        return {"round_count": float(view.count("round"))}
+
+    eval_suite.register_metric_set("round_count", round_count_metrics)
+    with pytest.raises(ValueError):
+        eval_suite.register_metric_set("round_count", round_count_metrics)
+
+    run_dir = tmp_path / "runs" / "run-plugin"
+    _write_valid_run(run_dir)
+    result = evaluate_run(run_dir, metric_set="round_count")
+
+    assert result["metric_set"] == "round_count"
+    assert result["metrics"]["round_count"] == 1.0
+    assert len(seen) == 1
+
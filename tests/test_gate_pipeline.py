@@ -1,4 +1,8 @@
-from project_dream.gate_pipeline import run_gates
+from collections import OrderedDict
+
+from rapidfuzz.fuzz import ratio
+
+from project_dream.gate_pipeline import compile_gate_policy, run_gates
 
 
 def test_gate_pipeline_masks_pii_and_reports_rewrite():
@@ -102,3 +106,61 @@ def test_gate_pipeline_uses_pack_policy_for_claim_and_moderation_markers():
     first_violation = lore_gate["violations"][0]
     assert "ENT-CLAIM" in first_violation.get("entity_refs", [])
     assert "ENT-MODERATION" in first_violation.get("entity_refs", [])
+
+
+def test_gate_pipeline_similarity_top_k_matches_full_ratio_scan():
+    text = "정본 로그 기준으로 보면 거래 사기 의혹은 근거가 약함"
+    corpus = [
+        "전혀 다른 문장",
+        "정본 로그 기준으로 보면 거래 사기 의혹은 근거가 약함",
+        "정본 로그 기준으로 보면 거래 사기 의혹은 근거가 강함",
+        "",
+        "정본 로그 기준",
+        "정본 로그 기준으로 보면 거래 사기 의혹은 근거가 약함 (재게시)",
+        "정본 로그 기준으로 보면 거래 사기 의혹은 근거가 강함",
+        "짧음",
+    ]
+    expected = [{"index": idx, "score": float(ratio(text, row))} for idx, row in enumerate(corpus)]
+    expected.sort(key=lambda item: item["score"], reverse=True)
+
+    result = run_gates(text, corpus=corpus)
+
+    similarity_gate = next(g for g in result["gates"] if g["gate_name"] == "similarity")
+    assert similarity_gate["top_k"] == expected[:3]
+    assert similarity_gate["reason"] == f"max_similarity={expected[0]['score']}"
+
+
+def test_compiled_gate_policy_is_cached_and_scans_overlapping_terms():
+    custom_policy = {"lore": {"moderation_keywords": ["운영", "운영자", "영자"]}}
+
+    compiled = compile_gate_policy(custom_policy)
+
+    assert compile_gate_policy(dict(custom_policy)) is compiled
+    assert compiled.rule_ids["evidence_missing"] == "RULE-PLZ-LORE-01"
+    assert {"운영", "운영자", "영자"} <= compiled.terms_in("운영자 공지")
+    assert compiled.terms_in("관계 없음") == set()
+
+    via_dict = run_gates("운영자가 사실로 확정했지만 추정일 뿐", corpus=[], gate_policy=custom_policy)
+    via_compiled = run_gates("운영자가 사실로 확정했지만 추정일 뿐", corpus=[], compiled_policy=compiled)
+    assert via_compiled == via_dict
+
+
+def test_similarity_index_is_reused_for_the_same_corpus_tuple(monkeypatch):
+    import project_dream.gate_pipeline as gate_pipeline
+
+    corpus = ("정본 로그 기준으로 보면 근거가 약함", "전혀 다른 문장")
+    built: list[tuple[str, ...]] = []
+    original_index = gate_pipeline._SimilarityIndex
+
+    def counting_index(texts: tuple[str, ...]):
+        built.append(texts)
+        return original_index(texts)
+
+    monkeypatch.setattr(gate_pipeline, "_SIMILARITY_INDEXES", OrderedDict())
+    monkeypatch.setattr(gate_pipeline, "_similarity_index_for_texts", counting_index)
+
+    first = run_gates("정본 로그 기준으로 보면 근거가 약함", corpus=corpus)
+    second = run_gates("정본 로그 기준으로 보면 근거가 약함", corpus=corpus)
+    assert built == [corpus]
+    assert first == second
+    assert run_gates("정본 로그 기준으로 보면 근거가 약함", corpus=list(corpus)) == first
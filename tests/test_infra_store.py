@@ -1,7 +1,11 @@
 import json
 from pathlib import Path
 
+import pytest
+
 from project_dream.infra.store import FileRunRepository
+from project_dream.storage import load_runlog_index, read_runlog_rows
+from project_dream.storage import persist_eval as persist_eval_file
 
 
 def _sample_sim_result() -> dict:
@@ -296,6 +300,89 @@ def test_file_run_repository_lists_runs_with_filters_and_pagination(tmp_path: Pa
     assert paged["offset"] == 1
     assert paged["items"][0]["run_id"] == listed["items"][1]["run_id"]
 
+    first_page = repo.list_runs(limit=1, include_total=False)
+    assert first_page["total"] is None
+    assert first_page["items"][0]["run_id"] == listed["items"][0]["run_id"]
+    next_page = repo.list_runs(limit=1, cursor=first_page["next_cursor"])
+    assert next_page["cursor"] == first_page["next_cursor"]
+    assert next_page["items"][0]["run_id"] == listed["items"][1]["run_id"]
+    assert next_page["next_cursor"] is None
+
+
+def test_file_run_repository_list_runs_uses_catalog_without_reading_artifacts(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    runs_dir = tmp_path / "runs"
+    repo = FileRunRepository(runs_dir)
+    run_first = repo.persist_run(_sample_sim_result(), _sample_report())
+    run_second = repo.persist_run(_sample_sim_result(), _sample_report())
+    repo.persist_eval(run_first, {"schema_version": "eval.v1", "pass_fail": True})
+    expected = repo.list_runs()
+    assert (runs_dir / ".run_catalog.jsonl").exists()
+
+    fresh = FileRunRepository(runs_dir)
+    extracted: list[str] = []
+    original = FileRunRepository._extract_run_file_metadata
+
+    def tracking_extract(self, run_dir: Path) -> dict:
+        extracted.append(run_dir.name)
+        return original(self, run_dir)
+
+    monkeypatch.setattr(FileRunRepository, "_extract_run_file_metadata", tracking_extract)
+    assert fresh.list_runs() == expected
+    assert extracted == []
+
+    persist_eval_file(run_second, {"schema_version": "eval.v1", "pass_fail": False})
+    by_id = {row["run_id"]: row for row in fresh.list_runs()["items"]}
+    assert extracted == [run_second.name]
+    assert by_id[run_second.name]["eval_pass"] is False
+    assert by_id[run_first.name]["eval_pass"] is True
+
+
+def test_file_run_repository_streams_runlog_with_filters(tmp_path: Path):
+    repo = FileRunRepository(tmp_path / "runs")
+    run_dir = repo.persist_run(_sample_sim_result(), _sample_report())
+    full = repo.load_runlog(run_dir.name)["rows"]
+
+    assert list(repo.iter_runlog(run_dir.name)) == full
+    assert list(repo.iter_runlog(run_dir.name, offset=1, limit=2)) == full[1:3]
+    rounds = list(repo.iter_runlog(run_dir.name, row_types={"round"}, round_from=1, round_to=1))
+    assert rounds == [row for row in full if row["type"] == "round"]
+
+    first = repo.load_runlog_page(run_dir.name, limit=2)
+    second = repo.load_runlog_page(run_dir.name, limit=100, cursor=first["next_cursor"])
+    assert first["items"] + second["items"] == full
+    assert second["next_cursor"] is None
+    with pytest.raises(ValueError):
+        repo.iter_runlog(run_dir.name, cursor=1)
+
+
+def test_persist_run_writes_runlog_offset_index_for_filtered_reads(tmp_path: Path):
+    repo = FileRunRepository(tmp_path / "runs")
+    run_dir = repo.persist_run(_sample_sim_result(), _sample_report())
+    full = repo.load_runlog(run_dir.name)["rows"]
+
+    index = load_runlog_index(run_dir)
+    assert index is not None
+    assert index["size"] == (run_dir / "runlog.jsonl").stat().st_size
+    assert sum(len(spans) for spans in index["types"].values()) == len(full)
+
+    wanted = {"context", "end_condition", "gate"}
+    expected = [row for row in full if row["type"] in wanted]
+    assert read_runlog_rows(run_dir, row_types=wanted) == expected
+    assert read_runlog_rows(run_dir, row_types={"round"}, round_from=1, round_to=1) == [
+        row for row in full if row["type"] == "round"
+    ]
+
+    runlog_path = run_dir / "runlog.jsonl"
+    with runlog_path.open("a", encoding="utf-8") as fp:
+        fp.write(json.dumps({"type": "gate"}) + "\n")
+    assert load_runlog_index(run_dir) is None
+    assert read_runlog_rows(run_dir, row_types={"gate"}) == [
+        *[row for row in full if row["type"] == "gate"],
+        {"type": "gate"},
+    ]
+
 
 def test_file_run_repository_lists_regressions_with_filters_and_pagination(tmp_path: Path):
     repo = FileRunRepository(tmp_path / "runs")
@@ -352,3 +439,8 @@ def test_file_run_repository_lists_regressions_with_filters_and_pagination(tmp_p
     assert paged["limit"] == 1
     assert paged["offset"] == 1
     assert paged["items"][0]["summary_id"] == first_path.name
+
+    newest = repo.list_regression_summaries(limit=1)
+    older = repo.list_regression_summaries(limit=1, cursor=newest["next_cursor"])
+    assert older["items"][0]["summary_id"] == first_path.name
+    assert older["next_cursor"] is None
@@ -1,6 +1,9 @@
 import json
+import threading
 from pathlib import Path
 
+import pytest
+
 from project_dream.infra.store import SQLiteRunRepository
 
 
@@ -214,6 +217,47 @@ def test_sqlite_run_repository_lists_runs_with_filters_and_pagination(tmp_path:
     assert paged["items"][0]["run_id"] == run_first.name
 
 
+def test_sqlite_run_repository_reuses_wal_connections_across_threads(tmp_path: Path):
+    repo = SQLiteRunRepository(tmp_path / "runs")
+    repo.persist_run(_sample_sim_result(), _sample_report())
+
+    errors: list[Exception] = []
+
+    def _worker() -> None:
+        try:
+            for _ in range(20):
+                assert repo.list_runs()["total"] == 1
+        except Exception as exc:  # pragma: no cover - surfaced below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=_worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert repo.connections_opened <= 4
+    with repo._connect() as conn:
+        assert str(conn.execute("PRAGMA journal_mode").fetchone()[0]).lower() == "wal"
+        index_names = {str(row["name"]) for row in conn.execute("PRAGMA index_list(runs)").fetchall()}
+        plan = " ".join(
+            str(row["detail"])
+            for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT COUNT(*) FROM runs WHERE pack_fingerprint = ?",
+                ("pack-fp",),
+            ).fetchall()
+        )
+    assert {
+        "idx_runs_seed_id_created_at",
+        "idx_runs_board_id_created_at",
+        "idx_runs_status_created_at",
+        "idx_runs_pack_fingerprint_created_at",
+    } <= index_names
+    assert "COVERING INDEX idx_runs_pack_fingerprint_created_at" in plan
+    repo.close()
+
+
 def test_sqlite_run_repository_uses_indexed_regression_summaries_when_file_missing(tmp_path: Path):
     repo = SQLiteRunRepository(tmp_path / "runs")
     regressions_dir = tmp_path / "runs" / "regressions"
@@ -292,3 +336,43 @@ def test_sqlite_run_repository_lists_regressions_with_filters_and_pagination(tmp
     assert paged["total"] == 2
     assert paged["limit"] == 1
     assert paged["offset"] == 1
+
+
+def test_sqlite_run_repository_pages_runs_and_regressions_by_cursor(tmp_path: Path):
+    repo = SQLiteRunRepository(tmp_path / "runs")
+    run_ids = [repo.persist_run(_sample_sim_result(), _sample_report()).name for _ in range(5)]
+    expected = [row["run_id"] for row in repo.list_runs(limit=10)["items"]]
+    assert sorted(expected) == sorted(run_ids)
+
+    seen: list[str] = []
+    cursor = None
+    while True:
+        page = repo.list_runs(limit=2, cursor=cursor, include_total=False)
+        assert page["total"] is None
+        seen.extend(row["run_id"] for row in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert seen == expected
+
+    with pytest.raises(ValueError):
+        repo.list_runs(cursor="not-a-cursor")
+    with pytest.raises(ValueError):
+        repo.list_runs(cursor=repo.list_runs(limit=1)["next_cursor"], offset=1)
+
+    for idx in range(3):
+        repo.persist_regression_summary(
+            {
+                "summary_path": str(tmp_path / "runs" / "regressions" / f"regression-2026010{idx}.json"),
+                "generated_at_utc": f"2026-01-0{idx + 1}T00:00:00+00:00",
+                "metric_set": "v1",
+                "pass_fail": True,
+                "totals": {"seed_runs": 1},
+            }
+        )
+    first = repo.list_regression_summaries(limit=2)
+    assert first["total"] == 3
+    assert [row["summary_id"] for row in first["items"]] == ["regression-20260102.json", "regression-20260101.json"]
+    rest = repo.list_regression_summaries(limit=2, cursor=first["next_cursor"])
+    assert [row["summary_id"] for row in rest["items"]] == ["regression-20260100.json"]
+    assert rest["next_cursor"] is None
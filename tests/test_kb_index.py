@@ -1,8 +1,18 @@
+import json
 from pathlib import Path
 
 import pytest
 
-from project_dream.kb_index import build_index, retrieve_context, search
+from project_dream.data_ingest import build_corpus_from_packs
+from project_dream.kb_index import (
+    _search_scan,
+    build_index,
+    load_or_build_index,
+    retrieve_context,
+    retrieve_contexts,
+    search,
+    search_many,
+)
 from project_dream.pack_service import load_packs
 
 
@@ -154,6 +164,8 @@ def test_build_index_supports_sqlite_vector_backend(tmp_path: Path):
     )
 
     assert vector_db_path.exists()
+    assert all("_dense_vector" not in row for row in index["passages"])
+    assert index["_inverted"]["gram_postings"] == {}
     assert results
     assert results[0]["item_id"] == "B17"
     assert float(results[0]["score_dense"]) > 0.0
@@ -191,3 +203,218 @@ def test_build_index_rejects_unknown_vector_backend():
 
     with pytest.raises(ValueError):
         build_index(packs, vector_backend="unknown")
+
+
+def test_search_inverted_index_matches_full_scan(tmp_path: Path):
+    packs = load_packs(Path("packs"), enforce_phase1_minimums=True)
+    corpus_dir = tmp_path / "corpus"
+    build_corpus_from_packs(packs_dir=Path("packs"), corpus_dir=corpus_dir)
+    index = build_index(packs, corpus_dir=corpus_dir)
+
+    cases = [
+        ("거래 사기 의혹 증거 로그 출처 근거", {"kind": ["board", "community", "persona", "corpus"], "board_id": "B07"}, 3),
+        ("규정 제재 신고 룰", {"kind": "rule"}, 5),
+        ("조직 세력 운영 감찰", {"kind": ["organization", "character"]}, 3),
+        ("페르소나 계층 관계", {"kind": "persona", "zone_id": "D"}, 10),
+        ("정렬이 진실", {}, 5),
+    ]
+    for query, filters, top_k in cases:
+        assert search(index, query, filters, top_k) == _search_scan(index, query, filters, top_k)
+
+
+def test_search_fills_top_k_with_zero_score_matches():
+    packs = load_packs(Path("packs"), enforce_phase1_minimums=True)
+    index = build_index(packs)
+
+    results = search(
+        index,
+        query="zzqq",
+        filters={"kind": "rule"},
+        top_k=3,
+    )
+
+    assert len(results) == 3
+    assert all(row["kind"] == "rule" for row in results)
+    assert all(row["score"] == 0.0 for row in results)
+    assert [row["item_id"] for row in results] == sorted(row["item_id"] for row in results)
+
+
+def _write_snapshot_corpus(corpus_dir: Path, *, refined_text: str) -> None:
+    corpus_dir.mkdir(parents=True, exist_ok=True)
+    (corpus_dir / "reference.jsonl").write_text(
+        '{"board_id":"B07","zone_id":"D","doc_id":"DOC-REF-010","source_type":"reference","text":"SNAPSHOT-REF-B07"}\n',
+        encoding="utf-8",
+    )
+    (corpus_dir / "refined.jsonl").write_text(
+        '{"board_id":"B07","zone_id":"D","source_type":"refined","text":"' + refined_text + '"}\n',
+        encoding="utf-8",
+    )
+    (corpus_dir / "generated.jsonl").write_text("", encoding="utf-8")
+
+
+def test_load_or_build_index_reuses_snapshot_and_matches_build_index(tmp_path: Path):
+    packs = load_packs(Path("packs"), enforce_phase1_minimums=True)
+    corpus_dir = tmp_path / "corpus"
+    snapshot_dir = tmp_path / "kb-index"
+    _write_snapshot_corpus(corpus_dir, refined_text="SNAPSHOT-REFINED-V1")
+
+    first = load_or_build_index(packs, corpus_dir=corpus_dir, snapshot_dir=snapshot_dir)
+    second = load_or_build_index(packs, corpus_dir=corpus_dir, snapshot_dir=snapshot_dir)
+    fresh = build_index(packs, corpus_dir=corpus_dir)
+
+    assert first["snapshot"]["source"] == "rebuilt"
+    assert second["snapshot"]["source"] == "snapshot"
+    assert second["snapshot"]["key"] == first["snapshot"]["key"]
+    for query, filters in [("SNAPSHOT-REF-B07", {"kind": "corpus"}), ("거래 사기 증거", {"board_id": "B07"})]:
+        assert search(second, query, filters, 5) == search(fresh, query, filters, 5)
+
+
+def test_load_or_build_index_stores_json_and_rebuilds_unreadable_snapshot(tmp_path: Path):
+    packs = load_packs(Path("packs"), enforce_phase1_minimums=True)
+    corpus_dir = tmp_path / "corpus"
+    snapshot_dir = tmp_path / "kb-index"
+    _write_snapshot_corpus(corpus_dir, refined_text="SNAPSHOT-JSON-V1")
+
+    first = load_or_build_index(packs, corpus_dir=corpus_dir, snapshot_dir=snapshot_dir)
+    snapshot_path = Path(first["snapshot"]["path"])
+    assert json.loads(snapshot_path.read_text(encoding="utf-8"))["snapshot_key"] == first["snapshot"]["key"]
+
+    snapshot_path.write_bytes(b"\x80\x05not json")
+    rebuilt = load_or_build_index(packs, corpus_dir=corpus_dir, snapshot_dir=snapshot_dir)
+    assert rebuilt["snapshot"]["source"] == "rebuilt"
+    assert search(rebuilt, "SNAPSHOT-JSON-V1", {"kind": "corpus"}, 1)[0]["text"] == "SNAPSHOT-JSON-V1"
+
+
+def test_load_or_build_index_reindexes_only_changed_corpus_file(tmp_path: Path):
+    packs = load_packs(Path("packs"), enforce_phase1_minimums=True)
+    corpus_dir = tmp_path / "corpus"
+    snapshot_dir = tmp_path / "kb-index"
+    _write_snapshot_corpus(corpus_dir, refined_text="SNAPSHOT-REFINED-V1")
+    load_or_build_index(packs, corpus_dir=corpus_dir, snapshot_dir=snapshot_dir)
+
+    (corpus_dir / "refined.jsonl").write_text(
+        '{"board_id":"B07","zone_id":"D","source_type":"refined","text":"SNAPSHOT-REFINED-V2-UPDATED"}\n',
+        encoding="utf-8",
+    )
+    index = load_or_build_index(packs, corpus_dir=corpus_dir, snapshot_dir=snapshot_dir)
+    results = search(index, "SNAPSHOT-REFINED-V2-UPDATED", {"kind": "corpus"}, 1)
+
+    assert index["snapshot"]["source"] == "rebuilt"
+    assert index["snapshot"]["reindexed_sources"] == ["refined"]
+    assert results[0]["text"] == "SNAPSHOT-REFINED-V2-UPDATED"
+    assert search(index, "SNAPSHOT-REFINED", {"kind": "corpus"}, 5) == search(
+        build_index(packs, corpus_dir=corpus_dir), "SNAPSHOT-REFINED", {"kind": "corpus"}, 5
+    )
+
+
+def test_search_numpy_vector_backend_matches_full_scan(tmp_path: Path):
+    pytest.importorskip("numpy")
+    packs = load_packs(Path("packs"), enforce_phase1_minimums=True)
+    corpus_dir = tmp_path / "corpus"
+    build_corpus_from_packs(packs_dir=Path("packs"), corpus_dir=corpus_dir)
+    index = build_index(packs, corpus_dir=corpus_dir, vector_backend="numpy")
+
+    cases = [
+        ("거래 사기 의혹 증거 로그 출처 근거", {"kind": ["board", "community", "persona", "corpus"], "board_id": "B07"}, 3),
+        ("규정 제재 신고 룰", {"kind": "rule"}, 5),
+        ("스레드 템플릿 흐름", {"board_id": ["B07", "B17"]}, 10),
+        ("페르소나 계층 관계", {"kind": "persona", "zone_id": "D"}, 10),
+        ("정렬이 진실", {"kind": "board"}, 3),
+        ("출처 근거", {"kind": "corpus", "source_type": "reference"}, 5),
+        ("zzqq", {"kind": "rule"}, 3),
+    ]
+    assert index["vector_backend"] == "numpy"
+    for query, filters, top_k in cases:
+        assert search(index, query, filters, top_k) == _search_scan(index, query, filters, top_k)
+
+
+def test_sqlite_vector_backend_upserts_only_changed_passages(tmp_path: Path):
+    packs = load_packs(Path("packs"), enforce_phase1_minimums=True)
+    corpus_dir = tmp_path / "corpus"
+    vector_db_path = tmp_path / "kb-vectors.sqlite3"
+    _write_snapshot_corpus(corpus_dir, refined_text="SQLITE-REFINED-V1")
+
+    first = build_index(packs, corpus_dir=corpus_dir, vector_backend="sqlite", vector_db_path=vector_db_path)
+    second = build_index(packs, corpus_dir=corpus_dir, vector_backend="sqlite", vector_db_path=vector_db_path)
+    _write_snapshot_corpus(corpus_dir, refined_text="SQLITE-REFINED-V2")
+    third = build_index(packs, corpus_dir=corpus_dir, vector_backend="sqlite", vector_db_path=vector_db_path)
+
+    total = len(first["passages"])
+    assert first["vector_sync"] == {"upserted": total, "deleted": 0, "unchanged": 0}
+    assert second["vector_sync"] == {"upserted": 0, "deleted": 0, "unchanged": total}
+    assert third["vector_sync"] == {"upserted": 1, "deleted": 0, "unchanged": total - 1}
+
+    memory = build_index(packs, corpus_dir=corpus_dir)
+    for query, filters in [("SQLITE-REFINED-V2", {"kind": "corpus"}), ("정렬이 진실", {}), ("거래 사기", {"board_id": "B07"})]:
+        assert search(third, query, filters, 5) == search(memory, query, filters, 5)
+        assert _search_scan(third, query, filters, 5) == _search_scan(memory, query, filters, 5)
+
+
+def test_sqlite_vector_backend_snapshot_keeps_vectors_out_of_memory(tmp_path: Path):
+    packs = load_packs(Path("packs"), enforce_phase1_minimums=True)
+    corpus_dir = tmp_path / "corpus"
+    snapshot_dir = tmp_path / "kb-index"
+    _write_snapshot_corpus(corpus_dir, refined_text="SQLITE-SNAPSHOT-V1")
+    kwargs = {"snapshot_dir": snapshot_dir, "vector_backend": "sqlite", "vector_db_path": tmp_path / "kb.sqlite3"}
+
+    load_or_build_index(packs, corpus_dir=corpus_dir, **kwargs)
+    index = load_or_build_index(packs, corpus_dir=corpus_dir, **kwargs)
+    memory = load_or_build_index(packs, corpus_dir=corpus_dir, snapshot_dir=snapshot_dir)
+
+    assert index["snapshot"]["source"] == "snapshot"
+    assert index["snapshot"]["path"] != memory["snapshot"]["path"]
+    assert index["_inverted"]["gram_postings"] == {}
+    assert all("_dense_vector" not in row for row in index["passages"])
+    for query, filters in [("SQLITE-SNAPSHOT-V1", {"kind": "corpus"}), ("거래 사기 증거", {"board_id": "B07"}), ("거", {})]:
+        assert search(index, query, filters, 5) == search(memory, query, filters, 5)
+        assert _search_scan(index, query, filters, 5) == _search_scan(memory, query, filters, 5)
+
+
+def test_search_many_matches_individual_searches(tmp_path: Path):
+    packs = load_packs(Path("packs"), enforce_phase1_minimums=True)
+    corpus_dir = tmp_path / "corpus"
+    build_corpus_from_packs(packs_dir=Path("packs"), corpus_dir=corpus_dir)
+    index = build_index(packs, corpus_dir=corpus_dir)
+    specs = [
+        {"query": "거래 사기 의혹 증거", "filters": {"kind": ["board", "corpus"], "board_id": "B07"}, "top_k": 3},
+        {"query": "거래 사기 의혹 증거", "filters": {"kind": "rule"}, "top_k": 5},
+        {"query": "규정 제재 신고 룰", "filters": {"kind": "rule"}, "top_k": 2},
+        {"query": "정렬이 진실", "filters": {}, "top_k": 4},
+        {"query": "P07", "filters": {"kind": "persona", "item_id": "P07"}, "top_k": 1},
+        {"query": "거", "filters": {"kind": "board"}, "top_k": 2},
+        {"query": "zzqq", "filters": {"kind": "rule"}, "top_k": 0},
+    ]
+
+    results = search_many(index, specs)
+
+    assert len(results) == len(specs)
+    for spec, rows in zip(specs, results):
+        assert rows == search(index, spec["query"], spec["filters"], spec["top_k"])
+        assert rows == _search_scan(index, spec["query"], spec["filters"], spec["top_k"])[: max(spec["top_k"], 0)]
+
+
+def test_retrieve_contexts_matches_retrieve_context_per_request():
+    packs = load_packs(Path("packs"), enforce_phase1_minimums=True)
+    index = build_index(packs)
+    requests = [
+        {
+            "task": "거래 사기 의혹 증거 확인",
+            "seed": "중계망 먹통 사건",
+            "board_id": "B07",
+            "zone_id": "D",
+            "persona_ids": ["P07", "P08"],
+            "top_k": 2,
+        },
+        {
+            "task": "정렬 논쟁",
+            "seed": "정렬이 진실",
+            "board_id": "B17",
+            "zone_id": "A",
+            "persona_ids": [],
+            "top_k": 3,
+        },
+    ]
+
+    contexts = retrieve_contexts(index, requests)
+
+    assert contexts == [retrieve_context(index, **request) for request in requests]
@@ -1,5 +1,10 @@
 import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from urllib.error import HTTPError
+from urllib.request import Request
 from pathlib import Path
 
 import pytest
@@ -21,6 +26,21 @@ class _FakeHTTPResponse:
         return None
 
 
+def _patch_transport(monkeypatch: pytest.MonkeyPatch, fake_urlopen) -> None:
+    """Route the pooled keep-alive transport through a urlopen-style fake."""
+
+    def fake_post(pool, target: str, body: bytes, headers: dict[str, str]):
+        port = f":{pool.port}" if pool.port else ""
+        req = Request(f"{pool.scheme}://{pool.host}{port}{target}", data=body, headers=headers, method="POST")
+        try:
+            with fake_urlopen(req, timeout=pool.timeout_sec) as resp:
+                return 200, "OK", {}, resp.read()
+        except HTTPError as exc:
+            return exc.code, exc.reason, exc.headers, b""
+
+    monkeypatch.setattr(llm_client._KeepAliveConnectionPool, "post", fake_post)
+
+
 def test_build_default_llm_client_falls_back_to_echo(monkeypatch: pytest.MonkeyPatch):
     monkeypatch.setenv("PROJECT_DREAM_LLM_PROVIDER", "echo")
     monkeypatch.delenv("PROJECT_DREAM_LLM_API_KEY", raising=False)
@@ -59,7 +79,7 @@ def test_build_default_llm_client_uses_google_with_prompt_passthrough_and_cache(
     monkeypatch.setenv("PROJECT_DREAM_LLM_MODEL", "gemini-3.1-flash")
     monkeypatch.setenv("PROJECT_DREAM_LLM_RESPONSE_MODE", "prompt_passthrough")
     monkeypatch.setenv("PROJECT_DREAM_LLM_CACHE_PATH", str(cache_path))
-    monkeypatch.setattr(llm_client.request, "urlopen", fake_urlopen)
+    _patch_transport(monkeypatch, fake_urlopen)
 
     client = llm_client.build_default_llm_client()
     out1 = client.generate("prompt-1", task="comment_generation")
@@ -90,7 +110,7 @@ def test_google_client_returns_model_output_when_response_mode_is_model_output(
             }
         )
 
-    monkeypatch.setattr(llm_client.request, "urlopen", fake_urlopen)
+    _patch_transport(monkeypatch, fake_urlopen)
     client = llm_client.GoogleAIStudioLLMClient(
         api_key="test-key",
         model="gemini-3.1-flash",
@@ -124,7 +144,7 @@ def test_google_client_falls_back_when_model_returns_404(monkeypatch: pytest.Mon
             }
         )
 
-    monkeypatch.setattr(llm_client.request, "urlopen", fake_urlopen)
+    _patch_transport(monkeypatch, fake_urlopen)
     client = llm_client.GoogleAIStudioLLMClient(
         api_key="test-key",
         model="gemini-3.1-flash",
@@ -160,7 +180,7 @@ def test_prompt_passthrough_probes_model_once_then_returns_prompt(
             }
         )
 
-    monkeypatch.setattr(llm_client.request, "urlopen", fake_urlopen)
+    _patch_transport(monkeypatch, fake_urlopen)
     client = llm_client.GoogleAIStudioLLMClient(
         api_key="test-key",
         model="gemini-3-flash-preview",
@@ -203,7 +223,7 @@ def test_build_default_llm_client_reuses_same_instance_for_same_google_settings(
     monkeypatch.setenv("PROJECT_DREAM_LLM_MODEL", "gemini-3-flash-preview")
     monkeypatch.setenv("PROJECT_DREAM_LLM_RESPONSE_MODE", "prompt_passthrough")
     monkeypatch.setenv("PROJECT_DREAM_LLM_CACHE_PATH", str(cache_path))
-    monkeypatch.setattr(llm_client.request, "urlopen", fake_urlopen)
+    _patch_transport(monkeypatch, fake_urlopen)
 
     c1 = llm_client.build_default_llm_client()
     c2 = llm_client.build_default_llm_client()
@@ -215,3 +235,277 @@ def test_build_default_llm_client_reuses_same_instance_for_same_google_settings(
     assert out1 == "prompt-C"
     assert out2 == "prompt-D"
     assert len(calls) == 1
+
+
+class _StandInGeminiServer:
+    def __init__(self):
+        self.paths: list[str] = []
+        self.connections = 0
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                with server._lock:
+                    server.connections += 1
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", "0"))
+                body = json.loads(self.rfile.read(length).decode("utf-8"))
+                with server._lock:
+                    server.paths.append(self.path)
+                if "gemini-3.1-flash:generateContent" in self.path:
+                    raw = b'{"error": "not found"}'
+                    self.send_response(404)
+                else:
+                    prompt = body["contents"][0]["parts"][0]["text"]
+                    raw = json.dumps(
+                        {"candidates": [{"content": {"parts": [{"text": f"OUT:{prompt}"}]}}]}
+                    ).encode("utf-8")
+                    self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(raw)))
+                self.end_headers()
+                self.wfile.write(raw)
+
+            def log_message(self, format, *args):
+                return None
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self.httpd.server_address[1]}/v1beta"
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def test_google_client_reuses_connection_across_threads_and_remembers_fallback_model():
+    with _StandInGeminiServer() as server:
+        client = llm_client.GoogleAIStudioLLMClient(
+            api_key="test-key",
+            model="gemini-3.1-flash",
+            response_mode="model_output",
+            cache_path=None,
+            base_url=server.base_url,
+            max_concurrency=1,
+        )
+        first = client.generate("p0", task="comment_generation")
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            rest = list(executor.map(lambda i: client.generate(f"p{i}", task="comment_generation"), range(1, 5)))
+        opened = client.connection_pool.connections_opened
+        client.close()
+
+    assert [first, *rest] == [f"OUT:p{i}" for i in range(5)]
+    probes = [path for path in server.paths if "gemini-3.1-flash:generateContent" in path]
+    assert len(probes) == 1
+    assert len(server.paths) == 6
+    assert server.connections == 1
+    assert opened == 1
+
+
+def test_google_client_reuses_keep_alive_connection_for_sync_calls():
+    with _StandInGeminiServer() as server:
+        client = llm_client.GoogleAIStudioLLMClient(
+            api_key="test-key",
+            model="gemini-3-flash-preview",
+            cache_path=None,
+            base_url=server.base_url,
+        )
+        outputs = [client.generate(f"s{i}", task="comment_generation") for i in range(3)]
+        client.close()
+
+    assert outputs == ["OUT:s0", "OUT:s1", "OUT:s2"]
+    assert server.connections == 1
+
+
+def test_google_client_applies_rate_limit_and_concurrency_bound_to_threads():
+    with _StandInGeminiServer() as server:
+        client = llm_client.GoogleAIStudioLLMClient(
+            api_key="test-key",
+            model="gemini-3-flash-preview",
+            response_mode="model_output",
+            cache_path=None,
+            base_url=server.base_url,
+            max_concurrency=2,
+            requests_per_second=20.0,
+        )
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            outputs = list(executor.map(lambda i: client.generate(f"q{i}", task="comment_generation"), range(5)))
+        elapsed = time.perf_counter() - started
+        client.close()
+
+    assert outputs == [f"OUT:q{i}" for i in range(5)]
+    assert elapsed >= 0.15
+    assert server.connections <= 2
+
+
+def test_google_client_rejects_invalid_limits():
+    with pytest.raises(ValueError):
+        llm_client.GoogleAIStudioLLMClient(api_key="k", cache_path=None, max_concurrency=0)
+    with pytest.raises(ValueError):
+        llm_client.GoogleAIStudioLLMClient(api_key="k", cache_path=None, requests_per_second=0)
+
+
+def test_default_google_client_reads_concurrency_and_rate_limit(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    monkeypatch.setenv("PROJECT_DREAM_LLM_PROVIDER", "google")
+    monkeypatch.setenv("GOOGLE_API_KEY", "test-key")
+    monkeypatch.setenv("PROJECT_DREAM_LLM_CACHE_PATH", str(tmp_path / "cache.sqlite3"))
+    monkeypatch.setenv("PROJECT_DREAM_LLM_MAX_CONCURRENCY", "3")
+    monkeypatch.setenv("PROJECT_DREAM_LLM_RATE_LIMIT_RPS", "2.5")
+
+    client = llm_client.build_default_llm_client()
+
+    assert isinstance(client, llm_client.GoogleAIStudioLLMClient)
+    assert client.max_concurrency == 3
+    assert client.requests_per_second == 2.5
+
+
+def test_per_process_limit_env_splits_client_limits(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    monkeypatch.setenv("PROJECT_DREAM_LLM_PROVIDER", "echo")
+    assert llm_client.per_process_limit_env(4) == {}
+
+    monkeypatch.setenv("PROJECT_DREAM_LLM_PROVIDER", "google")
+    monkeypatch.setenv("GOOGLE_API_KEY", "test-key")
+    monkeypatch.setenv("PROJECT_DREAM_LLM_CACHE_PATH", str(tmp_path / "cache.sqlite3"))
+    monkeypatch.setenv("PROJECT_DREAM_LLM_MAX_CONCURRENCY", "8")
+    monkeypatch.setenv("PROJECT_DREAM_LLM_RATE_LIMIT_RPS", "6")
+
+    assert llm_client.per_process_limit_env(1) == {}
+    overrides = llm_client.per_process_limit_env(4)
+    assert overrides == {"PROJECT_DREAM_LLM_MAX_CONCURRENCY": "2", "PROJECT_DREAM_LLM_RATE_LIMIT_RPS": "1.5"}
+
+    for name, value in overrides.items():
+        monkeypatch.setenv(name, value)
+    client = llm_client.build_default_llm_client()
+    assert client.max_concurrency == 2
+    assert client.requests_per_second == 1.5
+
+
+def test_google_client_cache_is_shared_through_sqlite_store(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    calls: list[str] = []
+
+    def fake_urlopen(req, timeout=0):
+        calls.append(req.full_url)
+        return _FakeHTTPResponse({"candidates": [{"content": {"parts": [{"text": "CACHED"}]}}]})
+
+    _patch_transport(monkeypatch, fake_urlopen)
+    cache_path = tmp_path / "llm_cache.sqlite3"
+    writer = llm_client.GoogleAIStudioLLMClient(api_key="k", model="gemini-3-flash-preview", cache_path=cache_path)
+    assert writer.generate("prompt-X", task="report_summary") == "CACHED"
+
+    reader = llm_client.GoogleAIStudioLLMClient(api_key="k", model="gemini-3-flash-preview", cache_path=cache_path)
+    assert reader.generate("prompt-X", task="report_summary") == "CACHED"
+
+    assert len(calls) == 1
+    assert cache_path.read_bytes().startswith(b"SQLite format 3")
+
+
+def test_google_client_imports_legacy_json_cache(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    _patch_transport(monkeypatch, lambda req, timeout=0: pytest.fail("unexpected request"))
+    cache_path = tmp_path / "llm_cache.json"
+    client = llm_client.GoogleAIStudioLLMClient(api_key="k", model="gemini-3-flash-preview", cache_path=cache_path)
+    key = client._cache_key("legacy prompt", "report_summary")
+    cache_path.write_text(json.dumps({key: "LEGACY"}), encoding="utf-8")
+
+    assert client.generate("legacy prompt", task="report_summary") == "LEGACY"
+    assert (tmp_path / "llm_cache.json.legacy").exists()
+    assert cache_path.read_bytes().startswith(b"SQLite format 3")
+
+
+def test_sqlite_response_cache_evicts_by_size_and_age(tmp_path: Path):
+    store = llm_client._SqliteResponseCache(tmp_path / "cache.sqlite3", max_entries=3)
+    for i in range(6):
+        store.put(f"k{i}", f"v{i}")
+    assert len(store) == 3
+    assert store.get("k0") is None
+    assert store.get("k5") == "v5"
+    store.close()
+
+    aged = llm_client._SqliteResponseCache(tmp_path / "cache.sqlite3", max_age_sec=0.0)
+    assert aged.get("k5") is None
+    assert len(aged) == 0
+    aged.close()
+
+
+def test_default_cache_path_imports_legacy_default_json_cache(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    monkeypatch.chdir(tmp_path)
+    _patch_transport(monkeypatch, lambda req, timeout=0: pytest.fail("unexpected request"))
+    client = llm_client.GoogleAIStudioLLMClient(api_key="k", model="gemini-3-flash-preview")
+    legacy_path = tmp_path / ".runtime" / "llm_cache.json"
+    legacy_path.parent.mkdir()
+    legacy_path.write_text(json.dumps({client._cache_key("old prompt", "report_summary"): "OLD"}), encoding="utf-8")
+
+    assert client.generate("old prompt", task="report_summary") == "OLD"
+    assert (tmp_path / ".runtime" / "llm_cache.json.legacy").exists()
+    assert (tmp_path / ".runtime" / "llm_cache.sqlite3").read_bytes().startswith(b"SQLite format 3")
+    client.close()
+
+
+def test_legacy_json_cache_renamed_concurrently_is_treated_as_migrated(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+):
+    cache_path = tmp_path / "llm_cache.json"
+    cache_path.write_text(json.dumps({"k": "v"}), encoding="utf-8")
+
+    def renamed_by_other_process(self, target):
+        raise FileNotFoundError(str(self))
+
+    monkeypatch.setattr(Path, "replace", renamed_by_other_process)
+    store = llm_client._SqliteResponseCache(cache_path)
+    assert store._take_legacy_json() == {}
+
+
+def test_google_client_memo_is_bounded_and_respects_max_age(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    calls: list[str] = []
+
+    def fake_urlopen(req, timeout=0):
+        calls.append(req.full_url)
+        return _FakeHTTPResponse({"candidates": [{"content": {"parts": [{"text": f"OUT{len(calls)}"}]}}]})
+
+    _patch_transport(monkeypatch, fake_urlopen)
+    client = llm_client.GoogleAIStudioLLMClient(
+        api_key="k",
+        model="gemini-3-flash-preview",
+        cache_path=tmp_path / "cache.sqlite3",
+        cache_max_entries=2,
+        cache_max_age_sec=60.0,
+    )
+    for prompt in ("a", "b", "c"):
+        client.generate(prompt, task="comment_generation")
+    assert list(client._cache) == [client._cache_key(p, "comment_generation") for p in ("b", "c")]
+    assert client.generate("c", task="comment_generation") == "OUT3"
+
+    started = time.time()
+    monkeypatch.setattr(llm_client.time, "time", lambda: started + 120.0)
+    assert client.generate("c", task="comment_generation") == "OUT4"
+    assert len(calls) == 4
+    client.close()
+
+
+def test_google_client_zero_max_entries_disables_memo(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    calls: list[str] = []
+
+    def fake_urlopen(req, timeout=0):
+        calls.append(req.full_url)
+        return _FakeHTTPResponse({"candidates": [{"content": {"parts": [{"text": f"OUT{len(calls)}"}]}}]})
+
+    _patch_transport(monkeypatch, fake_urlopen)
+    client = llm_client.GoogleAIStudioLLMClient(
+        api_key="k",
+        model="gemini-3-flash-preview",
+        cache_path=None,
+        cache_max_entries=0,
+    )
+    assert client.generate("a", task="comment_generation") == "OUT1"
+    assert client.generate("a", task="comment_generation") == "OUT2"
+    assert len(client._cache) == 0
+    client.close()
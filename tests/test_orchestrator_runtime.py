@@ -117,10 +117,11 @@ def test_runtime_manual_backend_delegates(monkeypatch: pytest.MonkeyPatch):
 
     captured: dict = {}
 
-    def fake_run_simulation(*, seed, rounds, corpus, max_retries=2, packs=None):
+    def fake_run_simulation(*, seed, rounds, corpus, max_retries=2, packs=None, generation_workers=None):
         captured["seed_id"] = seed.seed_id
         captured["rounds"] = rounds
         captured["corpus"] = list(corpus)
+        captured["generation_workers"] = generation_workers
         return _fake_sim_result()
 
     monkeypatch.setattr(runtime, "run_simulation", fake_run_simulation)
@@ -129,12 +130,14 @@ def test_runtime_manual_backend_delegates(monkeypatch: pytest.MonkeyPatch):
         rounds=3,
         corpus=["ctx-1"],
         backend="manual",
+        generation_workers=2,
     )
 
     assert payload["rounds"]
     assert captured["seed_id"] == "SEED-ORCH-001"
     assert captured["rounds"] == 3
     assert captured["corpus"] == ["ctx-1"]
+    assert captured["generation_workers"] == 2
     assert payload["graph_node_trace"]["backend"] == "manual"
     node_ids = [node["node_id"] for node in payload["graph_node_trace"]["nodes"]]
     assert node_ids == ["thread_candidate", "round_loop", "moderation", "end_condition"]
@@ -188,7 +191,7 @@ def test_runtime_langgraph_backend_delegates_when_available(monkeypatch: pytest.
             return _fake_langgraph_graph_module()
         raise ImportError(name)
 
-    def fake_run_simulation(*, seed, rounds, corpus, max_retries=2, packs=None):
+    def fake_run_simulation(*, seed, rounds, corpus, max_retries=2, packs=None, generation_workers=None):
         captured["seed_id"] = seed.seed_id
         return _fake_sim_result()
 
@@ -220,7 +223,7 @@ def test_runtime_manual_and_langgraph_are_equivalent_except_backend(monkeypatch:
             return _fake_langgraph_graph_module()
         raise ImportError(name)
 
-    def fake_run_simulation(*, seed, rounds, corpus, max_retries=2, packs=None):
+    def fake_run_simulation(*, seed, rounds, corpus, max_retries=2, packs=None, generation_workers=None):
         return _fake_sim_result()
 
     monkeypatch.setattr(runtime.importlib, "import_module", fake_import)
@@ -439,7 +442,7 @@ def test_runtime_batch_manual_and_langgraph_parity(monkeypatch: pytest.MonkeyPat
             return _fake_langgraph_graph_module()
         raise ImportError(name)
 
-    def fake_run_simulation(*, seed, rounds, corpus, max_retries=2, packs=None):
+    def fake_run_simulation(*, seed, rounds, corpus, max_retries=2, packs=None, generation_workers=None):
         payload = _fake_sim_result()
         selected = {
             "candidate_id": f"TC-{seed.seed_id}",
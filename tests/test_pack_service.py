@@ -1,5 +1,18 @@
+import json
+import os
+import pickle
+import shutil
 from pathlib import Path
-from project_dream.pack_service import load_packs
+
+import pytest
+
+from project_dream.pack_service import (
+    build_pack_lookup,
+    clear_pack_cache,
+    load_packs,
+    load_packs_cached,
+    pack_cache_stats,
+)
 
 
 def test_pack_service_validates_board_reference():
@@ -105,3 +118,81 @@ def test_pack_service_loads_world_schema_v1_contract():
     assert "valid_from" in first_entity
     assert "valid_to" in first_entity
     assert first_entity.get("evidence_grade") in {"A", "B", "C"}
+
+
+def test_load_packs_cached_reuses_packs_until_content_changes(tmp_path: Path):
+    packs_dir = tmp_path / "packs"
+    shutil.copytree(Path("packs"), packs_dir)
+    clear_pack_cache()
+
+    first = load_packs_cached(packs_dir, enforce_phase1_minimums=True)
+    second = load_packs_cached(packs_dir, enforce_phase1_minimums=True)
+    assert second.lookup is first.lookup
+    assert second == first
+    assert pack_cache_stats() == {"hits": 1, "misses": 1, "revalidations": 0, "entries": 1}
+
+    board_path = packs_dir / "board_pack.json"
+    stat = board_path.stat()
+    os.utime(board_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert load_packs_cached(packs_dir, enforce_phase1_minimums=True).lookup is first.lookup
+    assert pack_cache_stats()["revalidations"] == 1
+
+    payload = json.loads(board_path.read_text(encoding="utf-8"))
+    payload["boards"][0]["name"] = "캐시 무효화 보드"
+    board_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+    with pytest.raises(ValueError, match="checksum mismatch"):
+        load_packs_cached(packs_dir, enforce_phase1_minimums=True)
+    (packs_dir / "pack_manifest.json").unlink()
+
+    reloaded = load_packs_cached(packs_dir, enforce_phase1_minimums=True)
+    assert reloaded.lookup is not first.lookup
+    assert reloaded.boards[payload["boards"][0]["id"]]["name"] == "캐시 무효화 보드"
+    assert pack_cache_stats()["misses"] == 2
+
+
+def test_load_packs_cached_returns_copies_callers_cannot_corrupt(tmp_path: Path):
+    packs_dir = tmp_path / "packs"
+    shutil.copytree(Path("packs"), packs_dir)
+    clear_pack_cache()
+
+    first = load_packs_cached(packs_dir, enforce_phase1_minimums=True)
+    persona_id = sorted(first.personas)[0]
+    first.personas[persona_id]["archetype_id"] = "AR-LEAK"
+    first.thread_templates.clear()
+    first.register_switch_rules.append({"id": "RR-LEAK"})
+
+    second = load_packs_cached(packs_dir, enforce_phase1_minimums=True)
+    assert second.personas[persona_id]["archetype_id"] != "AR-LEAK"
+    assert second.thread_templates
+    assert {"id": "RR-LEAK"} not in second.register_switch_rules
+
+
+def test_pack_lookup_precomputes_read_only_tables():
+    packs = load_packs(Path("packs"), enforce_phase1_minimums=True)
+    lookup = packs.lookup
+
+    assert lookup.persona_ids == tuple(sorted(packs.personas))
+    for persona_id, persona in packs.personas.items():
+        assert lookup.archetype_by_persona[persona_id] == persona["archetype_id"]
+        community = packs.communities[persona["main_com"]]
+        location = (community["board_id"], community["zone_id"])
+        assert persona_id in lookup.persona_ids_by_location[location]
+
+    board_id, zone_id = next(iter(lookup.persona_ids_by_location))
+    preferred, board_only, others = lookup.participant_groups(board_id, zone_id)
+    assert sorted(preferred + board_only + others) == sorted(packs.personas)
+    assert lookup.participant_groups("B-UNKNOWN", "A") == ((), (), lookup.persona_ids)
+
+    for archetype_id, rules in lookup.register_rules_by_archetype.items():
+        assert list(rules) == [
+            rule
+            for rule in packs.register_switch_rules
+            if not rule["conditions"].get("archetype_ids") or archetype_id in rule["conditions"]["archetype_ids"]
+        ]
+
+    with pytest.raises(TypeError):
+        lookup.archetype_by_persona["P-NEW"] = "AG-01"
+
+    restored = pickle.loads(pickle.dumps(packs))
+    assert restored.lookup.persona_ids == lookup.persona_ids
+    assert build_pack_lookup(packs).template_by_board == lookup.template_by_board
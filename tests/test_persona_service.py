@@ -2,7 +2,14 @@ from pathlib import Path
 
 from project_dream.models import SeedInput
 from project_dream.pack_service import load_packs
-from project_dream.persona_service import apply_register_switch, render_voice, select_participants
+from project_dream.persona_service import (
+    apply_register_switch,
+    clear_voice_cache,
+    render_voice,
+    resolve_voice,
+    select_participants,
+    voice_cache_stats,
+)
 
 
 def test_select_participants_prefers_board_zone_personas():
@@ -87,3 +94,33 @@ def test_apply_register_switch_keeps_base_voice_when_no_rule_matches():
 
     assert switched["register_switch_applied"] is False
     assert switched["register_rule_id"] == ""
+
+
+def test_resolve_voice_caches_by_register_context_signature():
+    packs = load_packs(Path("packs"), enforce_phase1_minimums=True)
+    persona_id = sorted(packs.personas)[0]
+    clear_voice_cache()
+
+    contexts = [
+        {"round_idx": 1, "status": "visible", "total_reports": 3, "evidence_hours_left": 40},
+        {"round_idx": 1, "status": "visible", "total_reports": 7, "evidence_hours_left": 48},
+        {"round_idx": 3, "status": "locked", "total_reports": 7, "evidence_hours_left": 12},
+    ]
+    for context in contexts:
+        expected = apply_register_switch(
+            render_voice(persona_id, "A", packs=packs),
+            persona_id=persona_id,
+            packs=packs,
+            runtime_context=context,
+        )
+        assert resolve_voice(persona_id, "A", packs=packs, runtime_context=context) == expected
+
+    stats = voice_cache_stats()
+    assert stats["misses"] == 2
+    assert stats["hits"] == 1
+    assert stats["entries"] == 2
+
+    cached = resolve_voice(persona_id, "A", packs=packs, runtime_context=contexts[0])
+    cached["endings"].append("변경")
+    assert "변경" not in resolve_voice(persona_id, "A", packs=packs, runtime_context=contexts[0])["endings"]
+    clear_voice_cache()
@@ -118,6 +118,7 @@ def test_run_regression_batch_uses_retrieved_context_corpus(
         max_retries=2,
         packs=None,
         backend="manual",
+        generation_workers=None,
     ):
         captured_corpora.append(list(corpus))
         return base_run_simulation(
@@ -141,8 +142,10 @@ def test_run_regression_batch_uses_retrieved_context_corpus(
     )
     monkeypatch.setattr(
         regression_runner,
-        "retrieve_context",
-        lambda index, **kwargs: {"bundle": {}, "corpus": [f"ctx-{kwargs['board_id']}-{kwargs['zone_id']}"]},
+        "retrieve_contexts",
+        lambda index, requests: [
+            {"bundle": {}, "corpus": [f"ctx-{request['board_id']}-{request['zone_id']}"]} for request in requests
+        ],
         raising=False,
     )
 
@@ -189,6 +192,7 @@ def test_run_regression_batch_merges_ingested_corpus(
         max_retries=2,
         packs=None,
         backend="manual",
+        generation_workers=None,
     ):
         captured_corpora.append(list(corpus))
         return base_run_simulation(
@@ -212,8 +216,10 @@ def test_run_regression_batch_merges_ingested_corpus(
     )
     monkeypatch.setattr(
         regression_runner,
-        "retrieve_context",
-        lambda index, **kwargs: {"bundle": {}, "corpus": [f"ctx-{kwargs['board_id']}-{kwargs['zone_id']}"]},
+        "retrieve_contexts",
+        lambda index, requests: [
+            {"bundle": {}, "corpus": [f"ctx-{request['board_id']}-{request['zone_id']}"]} for request in requests
+        ],
         raising=False,
     )
 
@@ -251,6 +257,7 @@ def test_run_regression_batch_forwards_orchestrator_backend(
         max_retries=2,
         packs=None,
         backend="manual",
+        generation_workers=None,
     ):
         captured["backend"] = backend
         return base_run_simulation(
@@ -302,8 +309,8 @@ def test_run_regression_batch_forwards_vector_backend_to_build_index(
     monkeypatch.setattr(regression_runner, "build_index", fake_build_index, raising=False)
     monkeypatch.setattr(
         regression_runner,
-        "retrieve_context",
-        lambda index, **kwargs: {"bundle": {}, "corpus": ["ctx-B07-D"]},
+        "retrieve_contexts",
+        lambda index, requests: [{"bundle": {}, "corpus": ["ctx-B07-D"]} for _ in requests],
         raising=False,
     )
 
@@ -408,3 +415,50 @@ def test_run_regression_batch_hard_fails_when_canon_gate_fails(
             min_moderation_hook_runs=0,
             min_validation_warning_runs=0,
         )
+
+
+def test_run_regression_batch_with_workers_matches_sequential_summary(tmp_path: Path):
+    seeds_dir = tmp_path / "seeds"
+    seeds_dir.mkdir(parents=True, exist_ok=True)
+    _write_seed(seeds_dir / "seed_001.json", "SEED-P-001", "B01", "A")
+    _write_seed(seeds_dir / "seed_002.json", "SEED-P-002", "B07", "D")
+    _write_seed(seeds_dir / "seed_003.json", "SEED-P-003", "B01", "A")
+
+    sequential = run_regression_batch(
+        seeds_dir=seeds_dir,
+        packs_dir=Path("packs"),
+        output_dir=tmp_path / "runs-seq",
+        rounds=3,
+        max_seeds=3,
+    )
+    parallel = run_regression_batch(
+        seeds_dir=seeds_dir,
+        packs_dir=Path("packs"),
+        output_dir=tmp_path / "runs-par",
+        rounds=3,
+        max_seeds=3,
+        workers=2,
+    )
+
+    def _strip_run_ids(runs: list[dict]) -> list[dict]:
+        return [{k: v for k, v in run.items() if k != "run_id"} for run in runs]
+
+    assert "workers" not in parallel["config"]
+    assert {k: v for k, v in parallel["config"].items() if k != "output_dir"} == {
+        k: v for k, v in sequential["config"].items() if k != "output_dir"
+    }
+    assert [run["seed_file"] for run in parallel["runs"]] == ["seed_001.json", "seed_002.json", "seed_003.json"]
+    assert _strip_run_ids(parallel["runs"]) == _strip_run_ids(sequential["runs"])
+    assert parallel["totals"] == sequential["totals"]
+    assert parallel["gates"] == sequential["gates"]
+    assert len(list((tmp_path / "runs-par").glob("run-*"))) == 3
+
+
+def test_run_regression_batch_rejects_non_positive_workers(tmp_path: Path):
+    with pytest.raises(ValueError):
+        run_regression_batch(
+            seeds_dir=tmp_path,
+            packs_dir=Path("packs"),
+            output_dir=tmp_path / "runs",
+            workers=0,
+        )
@@ -1,10 +1,20 @@
-from project_dream.models import SeedInput
+import json
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from project_dream.models import Dial, SeedInput
+from project_dream.pack_service import load_packs
 from project_dream.sim_orchestrator import (
     ROUND_LOOP_NODE_ORDER,
     SIMULATION_STAGE_NODE_ORDER,
     assemble_sim_result_from_stage_payloads,
+    SimulationTables,
     extract_stage_payloads,
     run_simulation,
+    run_simulation_batch,
 )
 
 
@@ -108,3 +118,83 @@ def test_simulation_calls_round_loop_node_helpers(monkeypatch):
     assert calls["gate"] >= 1
     assert calls["policy"] >= 1
     assert calls["emit"] >= 1
+
+
+def test_concurrent_generation_matches_sequential_output(monkeypatch):
+    import project_dream.sim_orchestrator as sim_orchestrator
+
+    packs = load_packs(Path("packs"), enforce_phase1_minimums=True)
+    seed = SeedInput(
+        seed_id="SEED-CONCURRENT-001",
+        title="동시 생성",
+        summary="라운드 참여자 병렬 생성",
+        board_id="B07",
+        zone_id="D",
+    )
+    original_generate = sim_orchestrator.generate_comment
+    thread_names: set[str] = set()
+
+    def slow_generate_comment(*args, **kwargs):
+        thread_names.add(threading.current_thread().name)
+        time.sleep(0.01)
+        return original_generate(*args, **kwargs)
+
+    monkeypatch.setattr(sim_orchestrator, "generate_comment", slow_generate_comment)
+
+    sequential = run_simulation(seed=seed, rounds=4, corpus=["ctx-1"], packs=packs, generation_workers=1)
+    sequential_threads = set(thread_names)
+    thread_names.clear()
+    concurrent = run_simulation(seed=seed, rounds=4, corpus=["ctx-1"], packs=packs, generation_workers=3)
+
+    assert json.dumps(concurrent, ensure_ascii=False, sort_keys=True) == json.dumps(
+        sequential, ensure_ascii=False, sort_keys=True
+    )
+    assert sequential_threads == {threading.main_thread().name}
+    assert thread_names - {threading.main_thread().name}
+
+
+def test_generation_workers_are_capped_by_client_concurrency(monkeypatch: pytest.MonkeyPatch):
+    import project_dream.sim_orchestrator as sim_orchestrator
+
+    class _LimitedClient:
+        max_concurrency = 2
+
+    monkeypatch.delenv("PROJECT_DREAM_GENERATION_WORKERS", raising=False)
+    assert sim_orchestrator._resolve_generation_workers(None) == 1
+    assert sim_orchestrator._resolve_generation_workers(3) == 3
+
+    monkeypatch.setattr(sim_orchestrator, "build_default_llm_client", lambda: _LimitedClient())
+    assert sim_orchestrator._resolve_generation_workers(3) == 2
+    monkeypatch.setenv("PROJECT_DREAM_GENERATION_WORKERS", "5")
+    assert sim_orchestrator._resolve_generation_workers(None) == 2
+
+
+def test_simulation_batch_matches_individual_runs():
+    packs = load_packs(Path("packs"), enforce_phase1_minimums=True)
+    seeds = [
+        SeedInput(
+            seed_id=f"SEED-BATCH-{idx:03d}",
+            title="배치 시뮬레이션",
+            summary="여러 시드를 한 번에 돌린다",
+            board_id=board_id,
+            zone_id=zone_id,
+            dial=dial,
+        )
+        for idx, (board_id, zone_id, dial) in enumerate(
+            [
+                ("B07", "D", Dial()),
+                ("B07", "D", Dial(U=10, E=10, M=10, S=10, H=60)),
+                ("B01", "A", Dial(U=10, E=60, M=10, S=10, H=10)),
+                ("B12", "C", Dial(U=10, E=10, M=10, S=60, H=10)),
+            ]
+        )
+    ]
+
+    individual = [run_simulation(seed=seed, rounds=3, corpus=["ctx-1"], packs=packs) for seed in seeds]
+    batched = run_simulation_batch(seeds, rounds=3, corpus=["ctx-1"], packs=packs)
+
+    assert json.dumps(batched, ensure_ascii=False, sort_keys=True) == json.dumps(
+        individual, ensure_ascii=False, sort_keys=True
+    )
+    with pytest.raises(ValueError, match="different packs"):
+        run_simulation(seed=seeds[0], rounds=1, corpus=[], packs=packs, simulation_tables=SimulationTables(None))
@@ -32,8 +32,8 @@ def test_orchestrator_passes_rendered_voice_to_generator(monkeypatch):
     )
     monkeypatch.setattr(
         sim_orchestrator,
-        "render_voice",
-        lambda persona_id, zone_id, packs=None: {
+        "resolve_voice",
+        lambda persona_id, zone_id, packs=None, runtime_context=None: {
             "persona_id": persona_id,
             "zone_id": zone_id,
             "sentence_length": "short",
@@ -401,3 +401,135 @@ def test_http_server_maps_stage_execution_failure_to_standard_error_schema(
         server.shutdown()
         server.server_close()
         thread.join(timeout=2)
+
+
+def _write_runlog(runs_dir: Path, run_id: str) -> None:
+    run_dir = runs_dir / run_id
+    run_dir.mkdir(parents=True)
+    rows = [{"type": "context", "bundle": {}}]
+    for round_no in (1, 2, 3):
+        rows.append({"type": "round", "round": round_no, "text": f"r{round_no}"})
+        rows.append({"type": "gate", "round": round_no, "gates": []})
+    rows.append({"type": "end_condition", "status": "visible"})
+    (run_dir / "runlog.jsonl").write_text(
+        "".join(json.dumps(row, ensure_ascii=False) + "\n" for row in rows),
+        encoding="utf-8",
+    )
+
+
+def test_http_server_streams_and_paginates_runlog(tmp_path: Path):
+    _write_runlog(tmp_path / "runs", "run-stream")
+    api = ProjectDreamAPI(
+        repository=FileRunRepository(tmp_path / "runs"),
+        packs_dir=Path("packs"),
+    )
+    token = "stream-token"
+    auth = {"Authorization": f"Bearer {token}"}
+
+    server = create_server(api=api, host="127.0.0.1", port=0, api_token=token)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+        host, port = server.server_address
+        base = f"http://{host}:{port}/runs/run-stream/runlog"
+
+        req = urllib.request.Request(
+            f"{base}?type=round&round_from=2",
+            headers={**auth, "Accept": "application/x-ndjson"},
+        )
+        with urllib.request.urlopen(req, timeout=5) as resp:
+            assert resp.headers["Transfer-Encoding"] == "chunked"
+            assert resp.headers["Content-Type"].startswith("application/x-ndjson")
+            lines = resp.read().decode("utf-8").splitlines()
+        streamed = [json.loads(line) for line in lines]
+        assert [row["round"] for row in streamed] == [2, 3]
+        assert all(row["type"] == "round" for row in streamed)
+
+        status, page = _request_json("GET", f"{base}?type=round,gate&limit=4", headers=auth)
+        assert status == 200
+        assert page["count"] == 4
+        assert page["next_cursor"] is not None
+
+        status, rest = _request_json(
+            "GET", f"{base}?type=round,gate&limit=4&cursor={page['next_cursor']}", headers=auth
+        )
+        assert status == 200
+        assert [row["round"] for row in page["items"] + rest["items"]] == [1, 1, 2, 2, 3, 3]
+        assert rest["next_cursor"] is None
+
+        status, bad_cursor = _request_json("GET", f"{base}?cursor=3&format=ndjson", headers=auth)
+        assert status == 400
+        assert bad_cursor["error"] == "bad_request"
+
+        for run_id in ("run-page-a", "run-page-b"):
+            _write_runlog(tmp_path / "runs", run_id)
+        runs_url = f"http://{host}:{port}/runs"
+        status, first_runs = _request_json("GET", f"{runs_url}?limit=2&include_total=false", headers=auth)
+        assert status == 200
+        assert first_runs["total"] is None
+        assert first_runs["count"] == 2
+        status, last_runs = _request_json(
+            "GET", f"{runs_url}?limit=2&cursor={first_runs['next_cursor']}", headers=auth
+        )
+        assert status == 200
+        assert last_runs["total"] == 3
+        assert last_runs["next_cursor"] is None
+        listed_ids = [row["run_id"] for row in first_runs["items"] + last_runs["items"]]
+        assert sorted(listed_ids) == ["run-page-a", "run-page-b", "run-stream"]
+
+        status, bad_list_cursor = _request_json("GET", f"{runs_url}?cursor=%25%25", headers=auth)
+        assert status == 400
+        assert bad_list_cursor["error"] == "bad_request"
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join(timeout=1)
+
+
+
+def test_http_server_reports_mid_stream_runlog_failure_and_rejects_zero_limit(tmp_path: Path, monkeypatch):
+    _write_runlog(tmp_path / "runs", "run-broken")
+    api = ProjectDreamAPI(
+        repository=FileRunRepository(tmp_path / "runs"),
+        packs_dir=Path("packs"),
+    )
+
+    def broken_iter_runlog(run_id: str, **_kwargs):
+        yield {"type": "context", "run_id": run_id}
+        raise RuntimeError("runlog read failed")
+
+    monkeypatch.setattr(api, "iter_runlog", broken_iter_runlog)
+    token = "broken-token"
+    auth = {"Authorization": f"Bearer {token}"}
+    logs: list[dict] = []
+
+    server = create_server(api=api, host="127.0.0.1", port=0, api_token=token, request_logger=logs.append)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+        host, port = server.server_address
+        base = f"http://{host}:{port}/runs/run-broken/runlog"
+
+        req = urllib.request.Request(f"{base}?format=ndjson", headers=auth)
+        with urllib.request.urlopen(req, timeout=5) as resp:
+            lines = [json.loads(line) for line in resp.read().decode("utf-8").splitlines()]
+        assert lines[0] == {"type": "context", "run_id": "run-broken"}
+        assert lines[-1] == {"error": "internal_error", "message": "runlog read failed"}
+        stream_errors = [entry for entry in logs if entry["event"] == "http_stream_error"]
+        assert stream_errors == [
+            {
+                "event": "http_stream_error",
+                "path": "/runs/run-broken/runlog",
+                "error": "RuntimeError: runlog read failed",
+            }
+        ]
+
+        status, zero_limit = _request_json("GET", f"{base}?limit=0", headers=auth)
+        assert status == 400
+        assert zero_limit["error"] == "bad_request"
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join(timeout=2)